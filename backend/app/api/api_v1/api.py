@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
-from app.api.api_v1.endpoints import auth, jobs, candidates
+from app.api.api_v1.endpoints import auth, jobs, candidates, profiles, taxonomy
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
-api_router.include_router(candidates.router, prefix="/candidates", tags=["candidates"])
\ No newline at end of file
+api_router.include_router(candidates.router, prefix="/candidates", tags=["candidates"])
+api_router.include_router(taxonomy.router, prefix="/taxonomy", tags=["taxonomy"])
+api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
@@ -1,14 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
-from app.schemas.candidate import CandidateResponse, CandidateUpdate
+from app.schemas.candidate import (
+    CandidateResponse, CandidateUpdate, SkillFacetResponse, CandidateSearchResult, HybridRankResult,
+    CandidateRank, TalentPoolMatch, DuplicatesReport, IngestionBatchStatus, SkillRefreshResult
+)
 from app.services.candidate_service import CandidateService
+from app.services.export_service import EXPORT_FORMATS
+from app.services.ingestion_service import IngestionService
 from app.services.auth_service import AuthService
 
 router = APIRouter()
 candidate_service = CandidateService()
+ingestion_service = IngestionService(candidate_service)
 auth_service = AuthService()
 
 
@@ -28,18 +35,159 @@ async def upload_resume(
     )
 
 
+@router.post("/bulk/{job_id}", response_model=IngestionBatchStatus, status_code=202)
+async def bulk_upload_resumes(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    archive: UploadFile = File(...),
+    manifest: Optional[UploadFile] = File(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Import a ZIP archive of resumes for a job.
+
+    The optional CSV manifest (columns: filename, name, email, phone) supplies
+    contact details; otherwise the name comes from the filename and the email
+    from the resume. Processing continues in the background; poll the batch.
+    """
+    return await ingestion_service.start_archive_ingestion(
+        db, job_id, archive, manifest, current_user.id, background_tasks
+    )
+
+
+@router.get("/bulk/{batch_id}", response_model=IngestionBatchStatus)
+async def get_bulk_upload_status(
+    batch_id: str,
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Progress and per-file errors of a bulk import"""
+    return ingestion_service.get_batch(batch_id, current_user.id)
+
+
 @router.get("/job/{job_id}", response_model=List[CandidateResponse])
 async def get_candidates_for_job(
     job_id: int,
     skip: int = 0,
     limit: int = 100,
     min_score: float = 0.0,
+    skills: Optional[str] = None,
+    status: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(auth_service.get_current_user)
 ):
-    """Get all candidates for a specific job, ranked by score"""
+    """Get all candidates for a specific job, ranked by score.
+
+    `skills` filters by a boolean skill expression, e.g. `python AND kubernetes NOT php`;
+    `status` keeps only candidates with that status (e.g. shortlisted).
+    """
     return await candidate_service.get_job_candidates(
-        db, job_id, current_user.id, skip, limit, min_score
+        db, job_id, current_user.id, skip, limit, min_score, skills, status
+    )
+
+
+@router.get("/job/{job_id}/export")
+async def export_candidates_for_job(
+    job_id: int,
+    format: str = "csv",
+    columns: Optional[str] = None,
+    status: Optional[str] = None,
+    min_score: float = 0.0,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Stream every candidate of a job in rank order as CSV or NDJSON.
+
+    `columns` is a comma-separated list, e.g. `rank,name,email,total_score,skills`.
+    """
+    rows = await candidate_service.export_job_candidates(
+        db, job_id, current_user.id, format, columns, status, min_score
+    )
+    return StreamingResponse(
+        rows,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="job_{job_id}_candidates.{format}"'}
+    )
+
+
+@router.get("/job/{job_id}/facets", response_model=SkillFacetResponse)
+async def get_skill_facets_for_job(
+    job_id: int,
+    min_score: float = 0.0,
+    skills: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Get per-skill candidate counts for the filtered result set"""
+    return await candidate_service.get_skill_facets(
+        db, job_id, current_user.id, min_score, skills
+    )
+
+
+@router.post("/job/{job_id}/refresh-skills", response_model=SkillRefreshResult)
+async def refresh_skills_for_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Re-extract skills of candidates parsed with an older skills taxonomy.
+
+    Candidates already at the current taxonomy version are skipped.
+    """
+    return await candidate_service.refresh_job_skills(db, job_id, current_user.id)
+
+
+@router.get("/job/{job_id}/duplicates", response_model=DuplicatesReport)
+async def get_duplicates_for_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """List near-duplicate resumes in a job, grouped by the original they copy"""
+    return await candidate_service.get_duplicates_report(db, job_id, current_user.id)
+
+
+@router.get("/job/{job_id}/hybrid", response_model=List[HybridRankResult])
+async def get_hybrid_ranking_for_job(
+    job_id: int,
+    limit: int = 20,
+    k: int = 100,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Rank candidates by fusing BM25 and embedding retrieval (reciprocal-rank fusion)"""
+    return await candidate_service.get_hybrid_ranking(
+        db, job_id, current_user.id, limit, k
+    )
+
+
+@router.get("/talent-pool/{job_id}", response_model=List[TalentPoolMatch])
+async def find_talent_pool_candidates(
+    job_id: int,
+    limit: int = 20,
+    include_same_job: bool = False,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Find the best existing candidates from all of the user's jobs for this job"""
+    return await candidate_service.find_talent_pool_candidates(
+        db, job_id, current_user.id, limit, include_same_job
+    )
+
+
+@router.get("/search", response_model=List[CandidateSearchResult])
+async def search_candidates(
+    q: str,
+    job_id: Optional[int] = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Full-text search over resumes in one job or all of the user's jobs.
+
+    Quoted text is matched as a phrase, e.g. `"machine learning" pytorch`.
+    """
+    return await candidate_service.search_candidates(
+        db, current_user.id, q, job_id, limit
     )
 
 
@@ -55,6 +203,30 @@ async def get_candidate(
     )
 
 
+@router.get("/{candidate_id}/rank", response_model=CandidateRank)
+async def get_candidate_rank(
+    candidate_id: int,
+    status: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Rank of a candidate within its job, or among the job's candidates with `status`"""
+    return await candidate_service.get_candidate_rank(
+        db, candidate_id, current_user.id, status
+    )
+
+
+@router.delete("/{candidate_id}")
+async def delete_candidate(
+    candidate_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Delete a candidate; its resume file is removed by the next blob garbage collection"""
+    await candidate_service.delete_candidate(db, candidate_id, current_user.id)
+    return {"message": "Candidate deleted successfully"}
+
+
 @router.put("/{candidate_id}/status", response_model=CandidateResponse)
 async def update_candidate_status(
     candidate_id: int,
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.core.database import get_db
-from app.schemas.job import JobCreate, JobResponse, JobUpdate
+from app.schemas.job import JobCreate, JobResponse, JobUpdate, JobStatsResponse
 from app.services.job_service import JobService
 from app.services.auth_service import AuthService
 
@@ -51,6 +51,16 @@ async def get_job(
     return job
 
 
+@router.get("/{job_id}/stats", response_model=JobStatsResponse)
+async def get_job_stats(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Score histogram, status counts, averages and skill coverage of a job's candidates"""
+    return await job_service.get_job_stats(db, job_id, current_user.id)
+
+
 @router.put("/{job_id}", response_model=JobResponse)
 async def update_job(
     job_id: int,
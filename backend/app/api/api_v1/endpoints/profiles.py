@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+from typing import List
+
+from app.core.profiling import profile_store, to_collapsed, to_speedscope
+from app.schemas.profile import ProfileInfo
+from app.services.auth_service import AuthService
+
+router = APIRouter()
+auth_service = AuthService()
+
+
+def _require_admin(current_user) -> None:
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can access request profiles")
+
+
+@router.get("/", response_model=List[ProfileInfo])
+async def list_profiles(current_user = Depends(auth_service.get_current_user)):
+    """Stored request profiles, newest first (admins only)"""
+    _require_admin(current_user)
+    return profile_store.list()
+
+
+@router.get("/{profile_id}")
+async def download_profile(
+    profile_id: str,
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$"),
+    current_user = Depends(auth_service.get_current_user)
+):
+    """Download a profile for https://www.speedscope.app or flamegraph.pl (admins only)"""
+    _require_admin(current_user)
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    if format == "collapsed":
+        return PlainTextResponse(
+            to_collapsed(profile),
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.collapsed.txt"'}
+        )
+    return JSONResponse(
+        to_speedscope(profile),
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'}
+    )
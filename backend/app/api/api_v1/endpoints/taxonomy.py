@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from app.schemas.taxonomy import TaxonomyInfo
+from app.services.auth_service import AuthService
+from app.services.skill_taxonomy import SkillTaxonomy, taxonomy_store
+
+router = APIRouter()
+auth_service = AuthService()
+
+
+def _taxonomy_info(taxonomy: SkillTaxonomy, previous_version: Optional[str] = None) -> dict:
+    return {
+        "version": taxonomy.version,
+        "skill_count": len(taxonomy),
+        "synonym_count": len(taxonomy.vocabulary.aliases),
+        "categories": taxonomy.categories,
+        "previous_version": previous_version
+    }
+
+
+@router.get("/", response_model=TaxonomyInfo)
+async def get_taxonomy(current_user = Depends(auth_service.get_current_user)):
+    """Version and categories of the skills taxonomy in use"""
+    return _taxonomy_info(taxonomy_store.current())
+
+
+@router.post("/reload", response_model=TaxonomyInfo)
+async def reload_taxonomy(current_user = Depends(auth_service.get_current_user)):
+    """Load the taxonomy file again without a restart (admins only).
+
+    Other worker processes pick the new version up on their next file
+    check. Candidates keep their skills until refreshed with
+    POST /candidates/job/{job_id}/refresh-skills.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can reload the skills taxonomy")
+
+    previous_version = taxonomy_store.current().version
+    try:
+        taxonomy = taxonomy_store.reload()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Taxonomy not reloaded: {e}")
+    return _taxonomy_info(taxonomy, previous_version)
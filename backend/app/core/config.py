@@ -17,6 +17,7 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    LEADERBOARD_BACKEND: str = "memory"  # "memory" (per process, single worker) or "redis" (sorted sets shared by workers)
 
     # DeepSeek API
     DEEPSEEK_API_KEY: str = ""
@@ -24,16 +25,72 @@ class Settings(BaseSettings):
 
     # File Upload
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_BLOCK_SIZE: int = 1024 * 1024  # Bytes read per step when streaming uploads
     UPLOAD_DIR: str = "uploads"
-    ALLOWED_EXTENSIONS: List[str] = [".pdf", ".docx", ".doc"]
+    ALLOWED_EXTENSIONS: List[str] = [".pdf", ".docx"]
+
+    # PDF extraction
+    PDF_MAX_PAGES: int = 30  # Pages read per resume; the rest is ignored
+    PDF_TIMEOUT_SECONDS: float = 15.0  # Wall-clock budget per document
+    PDF_TEXT_LAYER_PROBE_PAGES: int = 3  # Pages checked for fonts before full extraction
+    TEXT_EXTRACTION_SLOW_MS: int = 2000  # Resume text extractions slower than this are logged
+
+    # OCR for scanned PDFs
+    OCR_DPI: int = 200  # 150 is faster, 300 reads small print better
+    OCR_MAX_PAGES: int = 5  # Pages OCRed per resume
+    OCR_WORKERS: int = 2  # Tesseract processes
+    OCR_LANG: str = "eng"
+    OCR_PAGE_TIMEOUT_SECONDS: float = 60.0
+    OCR_CACHE_DIR: str = "ocr_cache"  # Results keyed by file SHA-256
+
+    # Bulk ingestion
+    BULK_MAX_ARCHIVE_SIZE: int = 500 * 1024 * 1024  # 500MB
+    BULK_MAX_FILES: int = 2000  # Resumes per batch
+    BULK_PARSE_WORKERS: int = 4  # Worker processes extracting text
+    BULK_EMBED_CONCURRENCY: int = 8  # Embedding/LLM requests in flight
+    BULK_QUEUE_SIZE: int = 32  # Items buffered between pipeline stages
+    BULK_COMMIT_EVERY: int = 25  # Most candidates per database commit; the writer also commits whenever it catches up
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched from the export cursor and written per chunk
+
+    # Skills taxonomy
+    SKILLS_TAXONOMY_PATH: str = ""  # Empty uses the bundled app/data/skills_taxonomy.json
+    TAXONOMY_CHECK_INTERVAL_SECONDS: float = 30.0  # How often the file is checked for changes; 0 disables
 
     # Embeddings
     EMBEDDING_MODEL: str = "deepseek-embedding"
+    EMBEDDING_BACKEND: str = "remote"  # "remote" (DeepSeek /embeddings) or "local" (hashed features, CPU only)
+    EMBEDDING_FALLBACK: str = "local"  # Backend used when the primary one fails; empty to raise instead
+    EMBEDDING_DIMENSIONS: int = 1536  # Size of local vectors; must match the remote model
+    EMBEDDING_BATCH_SIZE: int = 64  # Texts per remote embeddings request
+    EMBEDDING_COMPRESSION: str = ""  # Hybrid search's per-job vector indexes only (scoring and the talent pool use full vectors): "pca", "random" and/or "int8", e.g. "pca+int8"; empty keeps float32
+    EMBEDDING_COMPRESSED_DIM: int = 256  # Output dimension of pca/random reduction
+    EMBEDDING_COMPRESSION_FIT_SIZE: int = 1000  # Vectors a job needs before its index is fitted and compressed
     CHUNK_SIZE: int = 400
     CHUNK_OVERLAP: int = 50
 
+    # Near-duplicate detection
+    DEDUP_NUM_PERM: int = 128  # MinHash permutations
+    DEDUP_BANDS: int = 16  # LSH bands (rows per band = NUM_PERM / BANDS)
+    DEDUP_SHINGLE_SIZE: int = 5  # Words per shingle
+    DEDUP_THRESHOLD: float = 0.85  # Estimated Jaccard similarity to flag a duplicate
+
+    # Observability
+    REQUEST_LOG_ENABLED: bool = True  # One JSON line per request with its stage breakdown
+    METRICS_TOKEN: str = ""  # Bearer token for Prometheus scrapes of /metrics; admins' tokens are accepted too
+    PROFILE_SAMPLE_RATE: float = 0.0  # Fraction of requests profiled at random
+    PROFILE_SLOW_REQUEST_MS: int = 0  # Keep profiles of requests at least this slow (every request is then sampled); 0 disables slow-request capture
+    PROFILE_INTERVAL_MS: float = 5.0  # Sampling period while a request is profiled
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_STORED: int = 200  # Oldest profiles are deleted beyond this
+    LOOP_LAG_INTERVAL_MS: int = 500  # Event loop heartbeat period
+    LOOP_BLOCK_DEBUG: bool = False  # Print the stack of code blocking the event loop
+    LOOP_BLOCK_THRESHOLD_MS: int = 100  # Loop stalls at least this long count as blocked
+
     # Vector Store
     FAISS_INDEX_PATH: str = "vector_store/faiss_index"
+    TALENT_POOL_HNSW_M: int = 32  # Graph degree of the cross-job HNSW index
+    TALENT_POOL_EF_SEARCH: int = 128  # Higher is more accurate and slower
+    TALENT_POOL_CANDIDATES: int = 200  # ANN hits re-scored per talent pool query
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,107 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+loop_lag = registry.gauge(
+    "cvbot_event_loop_lag_last_seconds", "Scheduling delay of the last event loop heartbeat"
+)
+loop_lag_histogram = registry.histogram(
+    "cvbot_event_loop_lag_seconds", "Scheduling delay of event loop heartbeats",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+loop_blocks = registry.counter(
+    "cvbot_event_loop_blocks_total", "Times the event loop was blocked beyond LOOP_BLOCK_THRESHOLD_MS"
+)
+
+
+class LoopMonitor:
+    """Event loop heartbeat and, in debug mode, a blocking-call watchdog.
+
+    The heartbeat sleeps for a fixed interval and records how late it
+    wakes up: any synchronous work (parsing, queries, bcrypt) running on
+    the loop delays it by that much. The watchdog is a thread that checks
+    the heartbeat; when the loop has not come back for longer than the
+    threshold it prints the loop thread's stack, i.e. the code blocking it
+    at that moment, once per stall.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        debug: Optional[bool] = None,
+        threshold: Optional[float] = None
+    ):
+        self.interval = interval or settings.LOOP_LAG_INTERVAL_MS / 1000
+        self.debug = settings.LOOP_BLOCK_DEBUG if debug is None else debug
+        self.threshold = threshold or settings.LOOP_BLOCK_THRESHOLD_MS / 1000
+        if self.debug:
+            # A stall is only noticed between heartbeats
+            self.interval = min(self.interval, self.threshold / 2)
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._beat = time.monotonic()
+
+    def start(self) -> None:
+        """Start monitoring the running loop"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        if self.debug:
+            self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._beat = now
+            loop_lag.labels().set(lag)
+            loop_lag_histogram.labels().observe(lag)
+            if lag >= self.threshold:
+                loop_blocks.labels().inc()
+                if self.debug:
+                    print(f"Event loop was blocked for {lag * 1000:.0f} ms")
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stopped.wait(self.threshold / 4):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            print(
+                f"Event loop blocked for more than {stalled * 1000:.0f} ms "
+                f"(threshold {self.threshold * 1000:.0f} ms), currently running:\n{stack}"
+            )
+
+
+loop_monitor = LoopMonitor()
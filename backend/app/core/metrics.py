@@ -0,0 +1,377 @@
+import abc
+import asyncio
+import json
+import logging
+import math
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric(abc.ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _new_child(self) -> Any:
+        """A fresh time series for one set of label values"""
+
+    def labels(self, **labels: Any) -> Any:
+        """The time series for these label values, created on first use"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abc.abstractmethod
+    def _samples(self) -> Iterator[Tuple[str, Tuple[str, ...], Tuple[str, ...], float]]:
+        """(suffix, extra label names, label values, value) per sample"""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, extra_names, values, value in self._samples():
+            labels = _label_text(self.labelnames + extra_names, values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _Value:
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value(self._lock)
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield "_total" if not self.name.endswith("_total") else "", (), key, child.value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield "", (), key, child.value
+
+
+class _HistogramValue:
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[index] += 1
+                    break
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = _DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets, self._lock)
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            with self._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield "_bucket", ("le",), key + (_format_value(bound),), cumulative
+            yield "_bucket", ("le",), key + ("+Inf",), count
+            yield "_sum", (), key, total
+            yield "_count", (), key, count
+
+
+class MetricsRegistry:
+    """Metrics of this worker process, rendered in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = _DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "cvbot_http_requests_total", "HTTP requests by route and status", ["method", "route", "status"]
+)
+http_duration = registry.histogram(
+    "cvbot_http_request_duration_seconds", "Time until the response was sent", ["method", "route"]
+)
+stage_duration = registry.histogram(
+    "cvbot_stage_duration_seconds", "Time spent per pipeline stage", ["pipeline", "stage"]
+)
+provider_calls = registry.counter(
+    "cvbot_provider_calls_total", "Calls to external model providers", ["provider", "operation", "outcome"]
+)
+provider_duration = registry.histogram(
+    "cvbot_provider_call_duration_seconds", "Latency of external model provider calls", ["provider", "operation"]
+)
+provider_tokens = registry.counter(
+    "cvbot_provider_tokens_total", "Tokens reported by model providers", ["provider", "operation", "kind"]
+)
+embedding_fallbacks = registry.counter(
+    "cvbot_embedding_fallbacks_total", "Texts embedded by the fallback backend after a failure", ["backend"]
+)
+cache_lookups = registry.counter(
+    "cvbot_cache_lookups_total", "Cache lookups by result", ["cache", "result"]
+)
+cache_hit_ratio = registry.gauge(
+    "cvbot_cache_hit_ratio", "Hits over lookups since the process started", ["cache"]
+)
+queue_depth = registry.gauge(
+    "cvbot_queue_depth", "Items waiting in in-process work queues", ["queue"]
+)
+
+# Breakdown of the request being served: stage timings and provider usage.
+# Pipeline code times its steps with `stage()`; the middleware logs the
+# collected breakdown as one JSON line per request.
+_request_breakdown: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_breakdown", default=None)
+
+request_logger = logging.getLogger("cvbot.requests")
+if not request_logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    request_logger.addHandler(_handler)
+    request_logger.setLevel(logging.INFO)
+    request_logger.propagate = False
+
+
+@contextmanager
+def stage(pipeline: str, name: str) -> Iterator[None]:
+    """Time a block as one pipeline stage (failed blocks are timed too)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_duration.labels(pipeline=pipeline, stage=name).observe(elapsed)
+        breakdown = _request_breakdown.get()
+        if breakdown is not None:
+            key = f"{pipeline}.{name}"
+            breakdown["stages"][key] = round(breakdown["stages"].get(key, 0.0) + elapsed * 1000, 1)
+
+
+def record_provider_call(
+    provider: str,
+    operation: str,
+    seconds: float,
+    ok: bool,
+    usage: Optional[Dict[str, Any]] = None
+) -> None:
+    """Count a provider call, its latency and the token usage it reported"""
+    provider_calls.labels(provider=provider, operation=operation, outcome="ok" if ok else "error").inc()
+    provider_duration.labels(provider=provider, operation=operation).observe(seconds)
+    tokens = 0
+    for kind in ("prompt_tokens", "completion_tokens"):
+        count = (usage or {}).get(kind)
+        if isinstance(count, (int, float)) and count:
+            provider_tokens.labels(provider=provider, operation=operation, kind=kind[:-len("_tokens")]).inc(count)
+            tokens += count
+
+    breakdown = _request_breakdown.get()
+    if breakdown is not None:
+        calls = breakdown["provider_calls"].setdefault(operation, {"calls": 0, "ms": 0.0, "tokens": 0, "errors": 0})
+        calls["calls"] += 1
+        calls["ms"] = round(calls["ms"] + seconds * 1000, 1)
+        calls["tokens"] += int(tokens)
+        calls["errors"] += 0 if ok else 1
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    lookups = cache_lookups.labels(cache=cache, result="hit" if hit else "miss")
+    lookups.inc()
+    hits = cache_lookups.labels(cache=cache, result="hit").value
+    total = hits + cache_lookups.labels(cache=cache, result="miss").value
+    cache_hit_ratio.labels(cache=cache).set(hits / total if total else 0.0)
+
+
+class MeteredQueue(asyncio.Queue):
+    """asyncio.Queue whose size is reported as cvbot_queue_depth{queue=name}.
+
+    The gauge moves by increments, so several queues sharing a name (one
+    per concurrent batch) add up. Call `discard()` when abandoning a queue
+    that still holds items.
+    """
+
+    def __init__(self, name: str, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._depth = queue_depth.labels(queue=name)
+
+    def put_nowait(self, item: Any) -> None:
+        super().put_nowait(item)
+        self._depth.inc()
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        self._depth.dec()
+        return item
+
+    def discard(self) -> None:
+        self._depth.dec(self.qsize())
+
+
+def _route_template(scope: Scope) -> str:
+    """Route path with parameter placeholders, to keep label cardinality bounded"""
+    route = scope.get("route")
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is not None and path_regex.match(scope["path"]):
+        return route.path_format
+    if "endpoint" not in scope:
+        return "unmatched"
+    path = scope["path"]
+    for name, value in (scope.get("path_params") or {}).items():
+        path = path.replace(f"/{value}", f"/{{{name}}}", 1)
+    return path
+
+
+class RequestMetricsMiddleware:
+    """Counts and times every HTTP request and logs its stage breakdown.
+
+    The log line is written when the response body has been sent, so
+    background tasks started by the request are not part of it.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        breakdown = {"stages": {}, "provider_calls": {}}
+        token = _request_breakdown.set(breakdown)
+        status = 500
+        finished = False
+
+        def finish() -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            http_requests.labels(method=scope["method"], route=route, status=status).inc()
+            http_duration.labels(method=scope["method"], route=route).observe(elapsed)
+            if settings.REQUEST_LOG_ENABLED:
+                request_logger.info(json.dumps({
+                    "event": "request",
+                    "method": scope["method"],
+                    "route": route,
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round(elapsed * 1000, 1),
+                    **breakdown
+                }))
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
+            _request_breakdown.reset(token)
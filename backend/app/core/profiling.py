@@ -0,0 +1,342 @@
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.user import User
+
+PROFILE_HEADER = "x-profile"  # Send "X-Profile: 1" with an admin token to profile that request
+PROFILE_ID_HEADER = "x-profile-id"
+BLOCKING = "[loop blocked]"  # The request's own code was running on the event loop thread
+AWAITING = "[awaiting]"  # The request was suspended: network, threadpool, locks or other tasks
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _frame_label(code: CodeType) -> str:
+    """'function (file:first line)', with paths shortened to the package or app"""
+    filename = code.co_filename
+    if filename.startswith(_BACKEND_ROOT):
+        filename = os.path.relpath(filename, _BACKEND_ROOT)
+    elif "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class ProfileSession:
+    """Samples collected for one in-flight request.
+
+    `root` is the frame of the profiling middleware's coroutine; stacks
+    are recorded from there down. A sample is "loop blocked" when that
+    frame is on the event loop thread's stack (the request's code is
+    running and nothing else can), otherwise "awaiting", recorded as the
+    chain of suspended coroutines.
+    """
+
+    def __init__(self, task: asyncio.Task, root: FrameType, thread_id: int, method: str, path: str):
+        self.task = task
+        self.root = root
+        self.thread_id = thread_id
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.stacks: Dict[Tuple[str, ...], List[float]] = {}  # Stack -> [samples, seconds]
+        self.seconds = {BLOCKING: 0.0, AWAITING: 0.0}
+        self._labels: Dict[CodeType, str] = {}
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = _frame_label(code)
+        return label
+
+    def _blocking_stack(self, frame: Optional[FrameType]) -> Optional[List[FrameType]]:
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            if frame is self.root:
+                frames.reverse()
+                return frames
+            frame = frame.f_back
+        return None
+
+    def _awaiting_stack(self) -> List[FrameType]:
+        frames = []
+        awaitable: Any = self.task.get_coro()
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+            if frame is None:
+                break
+            if frames or frame is self.root:
+                frames.append(frame)
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+        return frames
+
+    def sample(self, thread_frame: Optional[FrameType], seconds: float) -> None:
+        if self.task.done():
+            return
+        frames = self._blocking_stack(thread_frame)
+        kind = BLOCKING
+        if frames is None:
+            frames, kind = self._awaiting_stack(), AWAITING
+            if not frames:
+                return
+        stack = (kind,) + tuple(self._label(frame.f_code) for frame in frames)
+        totals = self.stacks.get(stack)
+        if totals is None:
+            totals = self.stacks[stack] = [0, 0.0]
+        totals[0] += 1
+        totals[1] += seconds
+        self.seconds[kind] += seconds
+
+
+class SamplingProfiler:
+    """One background thread sampling the stacks of the requests being profiled.
+
+    The thread only runs while at least one session is active. Samples
+    are taken with sys._current_frames(), so profiled code runs unchanged;
+    each sample is weighted by the time since the previous one.
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval
+        self._sessions: List[ProfileSession] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, task: asyncio.Task, root: FrameType, method: str, path: str) -> ProfileSession:
+        session = ProfileSession(task, root, threading.get_ident(), method, path)
+        with self._condition:
+            self._sessions.append(session)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return session
+
+    def stop(self, session: ProfileSession) -> None:
+        with self._condition:
+            if session in self._sessions:
+                self._sessions.remove(session)
+
+    def _run(self) -> None:
+        interval = (self.interval or settings.PROFILE_INTERVAL_MS) / 1000
+        last = time.perf_counter()
+        while True:
+            with self._condition:
+                while not self._sessions:
+                    self._condition.wait()
+                    last = time.perf_counter()
+                sessions = list(self._sessions)
+            time.sleep(interval)
+            now = time.perf_counter()
+            frames = sys._current_frames()
+            for session in sessions:
+                session.sample(frames.get(session.thread_id), now - max(last, session.started))
+            last = now
+
+
+class ProfileStore:
+    """Finished profiles as JSON files, shared by all workers using the directory"""
+
+    def __init__(self, directory: Optional[str] = None, max_stored: Optional[int] = None):
+        self.directory = directory or settings.PROFILE_DIR
+        self.max_stored = max_stored or settings.PROFILE_MAX_STORED
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def save(self, profile: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(profile["id"])
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+        os.replace(path + ".tmp", path)
+        self._prune()
+
+    def _prune(self) -> None:
+        entries = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in entries[:max(0, len(entries) - self.max_stored)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        try:
+            with open(self._path(profile_id), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Profile summaries, newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            profile = self.get(name[:-len(".json")]) if name.endswith(".json") else None
+            if profile is not None:
+                profile.pop("stacks", None)
+                profiles.append(profile)
+        return sorted(profiles, key=lambda profile: profile["created_at"], reverse=True)
+
+
+def to_collapsed(profile: Dict[str, Any]) -> str:
+    """Brendan Gregg's collapsed-stack format (one "a;b;c samples" line per stack)"""
+    return "".join(f"{';'.join(stack)} {samples}\n" for stack, samples, _ in profile["stacks"])
+
+
+def to_speedscope(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Sampled profile in speedscope's file format, weighted in milliseconds"""
+    frames: Dict[str, int] = {}
+    samples, weights = [], []
+    for stack, _, milliseconds in profile["stacks"]:
+        samples.append([frames.setdefault(label, len(frames)) for label in stack])
+        weights.append(milliseconds)
+    name = f"{profile['method']} {profile['path']}"
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "cv_bot",
+        "activeProfileIndex": 0,
+        "shared": {"frames": [{"name": label} for label in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights
+        }]
+    }
+
+
+profiler = SamplingProfiler()
+profile_store = ProfileStore()
+
+
+def _is_admin(token: str) -> bool:
+    try:
+        email = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"]).get("sub")
+    except JWTError:
+        return False
+    if not email:
+        return False
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        return user is not None and user.role == "admin"
+    finally:
+        db.close()
+
+
+class RequestProfilerMiddleware:
+    """Profiles requests on demand, at random, or all of them to keep the slow ones.
+
+    A request is profiled when an admin sends the X-Profile header (its
+    profile id is returned in X-Profile-Id) or with probability
+    PROFILE_SAMPLE_RATE. With PROFILE_SLOW_REQUEST_MS set, every request
+    is sampled and the profile kept if the request took at least that
+    long. Profiles are downloaded from /api/v1/profiles.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: Tuple[str, ...] = ("/metrics", "/health")):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    @staticmethod
+    async def _trigger(scope: Scope) -> Optional[str]:
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_HEADER.encode(), b"").strip() not in (b"", b"0", b"false"):
+            scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token and await run_in_threadpool(_is_admin, token):
+                return "header"
+        if settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        trigger = await self._trigger(scope)
+        slow_seconds = settings.PROFILE_SLOW_REQUEST_MS / 1000
+        if trigger is None and slow_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        session = profiler.start(asyncio.current_task(), sys._getframe(), scope["method"], scope["path"])
+        status = 500
+        finished = False
+
+        async def finish() -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            profiler.stop(session)
+            duration = time.perf_counter() - session.started
+            if trigger is None and duration < slow_seconds:
+                return
+            profile = {
+                "id": profile_id,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "method": session.method,
+                "path": session.path,
+                "status": status,
+                "trigger": trigger or "slow",
+                "duration_ms": round(duration * 1000, 1),
+                "blocking_ms": round(session.seconds[BLOCKING] * 1000, 1),
+                "awaiting_ms": round(session.seconds[AWAITING] * 1000, 1),
+                "samples": sum(int(totals[0]) for totals in session.stacks.values()),
+                "stacks": [
+                    [list(stack), int(totals[0]), round(totals[1] * 1000, 3)]
+                    for stack, totals in session.stacks.items()
+                ]
+            }
+            try:
+                # JSON encoding, the write and the directory prune stay off the event loop
+                await run_in_threadpool(profile_store.save, profile)
+            except OSError as e:
+                print(f"Saving request profile failed: {e}")
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if trigger is not None:
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (PROFILE_ID_HEADER.encode(), profile_id.encode())
+                    ]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                await finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await finish()
@@ -1,19 +1,28 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import hmac
 import uvicorn
 
 from app.core.config import settings
 from app.api.api_v1.api import api_router
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import RequestMetricsMiddleware, registry
+from app.core.profiling import RequestProfilerMiddleware, _is_admin
+from app.utils.uploads import RequestSizeLimitMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("Starting up CV_Bot API...")
+    loop_monitor.start()
     yield
     # Shutdown
     print("Shutting down CV_Bot API...")
+    await loop_monitor.stop()
 
 
 app = FastAPI(
@@ -32,6 +41,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Refuse oversized uploads before the multipart body is buffered
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    limits={
+        f"{settings.API_V1_STR}/candidates/upload": settings.MAX_FILE_SIZE + 64 * 1024,  # File plus form fields
+        f"{settings.API_V1_STR}/candidates/bulk": settings.BULK_MAX_ARCHIVE_SIZE + 2 * 1024 * 1024  # Archive plus manifest
+    }
+)
+
+# Opt-in request profiles (admin X-Profile header, sampling, slow requests)
+app.add_middleware(RequestProfilerMiddleware)
+
+# Outermost, so rejected and failed requests are counted too
+app.add_middleware(RequestMetricsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -46,6 +70,21 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus scrape endpoint (metrics of the worker serving the request).
+
+    Needs a bearer token: METRICS_TOKEN for scrapers, or an admin's token.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    scraper = bool(settings.METRICS_TOKEN) and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode())
+    if not scraper and not await run_in_threadpool(_is_admin, token):
+        raise HTTPException(status_code=403, detail="Only admins and the metrics scraper can read metrics")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Float, Index, LargeBinary
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -6,25 +6,39 @@ from app.core.database import Base
 
 class Candidate(Base):
     __tablename__ = "candidates"
+    __table_args__ = (
+        Index("ix_candidates_job_ordinal", "job_id", "job_ordinal", unique=True),
+        Index("ix_candidates_job_score", "job_id", "total_score"),  # Leaderboard loads and ranked pages
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    job_ordinal = Column(Integer)  # Position of the candidate within its job's facet bitmaps
     name = Column(String, nullable=False)
     email = Column(String, nullable=False)
     phone = Column(String)
     resume_filename = Column(String, nullable=False)
+    resume_sha256 = Column(String(64), ForeignKey("upload_blobs.sha256"), index=True)  # Stored file in the blob store
     resume_text = Column(Text, nullable=False)
     structured_data = Column(JSON)  # Parsed skills, experience, education
+    skill_bits = Column(String)  # Hex-encoded bitset of skill IDs
+    education_level = Column(Integer, default=0)  # Normalized education level
+    experience_years = Column(Integer, default=0)
+    taxonomy_version = Column(String(32), index=True)  # Skills taxonomy version the skills were extracted with
     total_score = Column(Float, default=0.0)
     score_breakdown = Column(JSON)  # Detailed scoring by category
     match_explanation = Column(Text)  # LLM-generated explanation
     status = Column(String, default="pending")  # pending, reviewed, shortlisted, rejected
+    minhash_signature = Column(LargeBinary)  # MinHash of shingled resume text (uint32 array)
+    duplicate_of_id = Column(Integer, ForeignKey("candidates.id"))  # Near-duplicate original, if any
+    duplicate_similarity = Column(Float)  # Estimated Jaccard similarity to the original
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     job = relationship("Job", back_populates="candidates")
     chunks = relationship("CandidateChunk", back_populates="candidate")
+    duplicate_of = relationship("Candidate", remote_side=[id])
 
 
 class CandidateChunk(Base):
@@ -35,6 +49,7 @@ class CandidateChunk(Base):
     chunk_text = Column(Text, nullable=False)
     chunk_type = Column(String)  # skills, experience, education, summary
     embedding_vector = Column(JSON)  # Store as JSON array for FAISS
+    embedding_backend = Column(String(32), index=True)  # Embedding backend that produced the vector (NULL: primary)
     similarity_score = Column(Float, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
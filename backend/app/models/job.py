@@ -11,6 +11,7 @@ class Job(Base):
     title = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=False)
     requirements = Column(JSON)  # Structured requirements from LLM
+    requirement_features = Column(JSON)  # Normalized skill bitsets and levels
     questionnaire = Column(JSON)  # Auto-generated questionnaire
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_active = Column(String, default="active")  # active, paused, closed
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class JobStats(Base):
+    __tablename__ = "job_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
+    candidate_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    experience_sum = Column(Float, nullable=False, default=0.0)
+    education_sum = Column(Float, nullable=False, default=0.0)
+    score_histogram = Column(JSON)  # Candidates per fixed-width total_score bucket
+    status_counts = Column(JSON)  # Candidates per status
+    skill_counts = Column(JSON)  # Candidates per skill ID from the shared vocabulary
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Index
+from app.core.database import Base
+
+
+class CandidateLSHBucket(Base):
+    __tablename__ = "candidate_lsh_buckets"
+    __table_args__ = (Index("ix_candidate_lsh_buckets_band_bucket", "band", "bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False, index=True)
+    band = Column(Integer, nullable=False)  # Band number within the MinHash signature
+    bucket = Column(BigInteger, nullable=False)  # Hash of the band's rows
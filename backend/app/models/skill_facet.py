@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, LargeBinary, UniqueConstraint
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class JobSkillFacet(Base):
+    __tablename__ = "job_skill_facets"
+    __table_args__ = (UniqueConstraint("job_id", "skill_id", name="uq_job_skill_facet"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
+    skill_id = Column(Integer, nullable=False)  # ID from the shared skill vocabulary
+    bitmap = Column(LargeBinary, nullable=False, default=b"")  # Little-endian bitmap over candidate job ordinals
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
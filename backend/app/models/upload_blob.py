@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class UploadBlob(Base):
+    __tablename__ = "upload_blobs"
+
+    sha256 = Column(String(64), primary_key=True)  # Content hash, also the blob's file name
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # Candidates referencing this blob
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -28,6 +28,8 @@ class CandidateResponse(CandidateBase):
     score_breakdown: Optional[Dict[str, Any]] = None
     match_explanation: Optional[str] = None
     status: str
+    duplicate_of_id: Optional[int] = None
+    duplicate_similarity: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -49,6 +51,101 @@ class CandidateDetailResponse(CandidateResponse):
     chunks: List[CandidateChunkResponse] = []
 
 
+class SkillFacetResponse(BaseModel):
+    total: int
+    facets: Dict[str, int]
+
+
+class CandidateSearchResult(BaseModel):
+    candidate_id: int
+    job_id: int
+    name: str
+    total_score: Optional[float] = None
+    search_score: float
+    snippets: List[str] = []
+
+
+class HybridRankResult(BaseModel):
+    candidate_id: int
+    name: str
+    total_score: Optional[float] = None
+    fusion_score: float
+    lexical_rank: Optional[int] = None
+    vector_rank: Optional[int] = None
+
+
+class CandidateRank(BaseModel):
+    candidate_id: int
+    job_id: int
+    status: Optional[str] = None  # Ranked among candidates with this status only
+    rank: int  # 1 is the highest total score
+    total_score: float
+    ranked: int  # Candidates in the ranking
+    percentile: float  # Share of the ranking below this candidate
+
+
+class TalentPoolMatch(BaseModel):
+    candidate_id: int
+    name: str
+    email: str
+    source_job_id: int
+    status: Optional[str] = None
+    pool_similarity: float
+    total_score: float
+    score_breakdown: Dict[str, Any]
+
+
+class DuplicateCandidate(BaseModel):
+    candidate_id: int
+    name: str
+    email: str
+    job_id: Optional[int] = None
+    similarity: Optional[float] = None
+
+
+class DuplicateGroup(BaseModel):
+    original: DuplicateCandidate
+    duplicates: List[DuplicateCandidate]
+
+
+class DuplicatesReport(BaseModel):
+    job_id: int
+    duplicate_count: int
+    groups: List[DuplicateGroup]
+
+
+class IngestionError(BaseModel):
+    filename: str
+    error: str
+
+
+class IngestionBatchStatus(BaseModel):
+    batch_id: str
+    job_id: int
+    source: str
+    status: str  # queued, running, completed, failed
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    candidate_ids: List[int]
+    errors: List[IngestionError]
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float
+    resumes_per_minute: float
+
+
+class SkillRefreshResult(BaseModel):
+    job_id: int
+    taxonomy_version: str
+    checked: int  # Candidates parsed with another taxonomy version
+    changed: int  # Of those, candidates whose skills changed
+    rescored: int
+    requirements_changed: bool
+
+
 class ScoreBreakdown(BaseModel):
     semantic_similarity: float
     keyword_overlap: float
@@ -63,4 +160,5 @@ class StructuredResumeData(BaseModel):
     education: List[str]
     certifications: List[str]
     previous_roles: List[str]
-    summary: Optional[str] = None
\ No newline at end of file
+    summary: Optional[str] = None
+    taxonomy_version: Optional[str] = None
\ No newline at end of file
@@ -36,6 +36,31 @@ class JobResponse(JobBase):
         from_attributes = True
 
 
+class ScoreBucket(BaseModel):
+    min: float
+    max: float
+    count: int
+
+
+class SkillCoverage(BaseModel):
+    skill: str
+    required: bool  # Otherwise a preferred skill
+    candidates: int
+    coverage: float  # Share of the job's candidates with the skill
+
+
+class JobStatsResponse(BaseModel):
+    job_id: int
+    candidate_count: int
+    average_score: float
+    average_experience_years: float
+    average_education_level: float
+    score_histogram: List[ScoreBucket]
+    status_counts: Dict[str, int]
+    skill_coverage: List[SkillCoverage]
+    updated_at: Optional[datetime] = None
+
+
 class QuestionnaireQuestion(BaseModel):
     question: str
     type: str  # "text", "number", "boolean", "select"
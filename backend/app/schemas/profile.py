@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class ProfileInfo(BaseModel):
+    id: str
+    created_at: str
+    method: str
+    path: str
+    status: int
+    trigger: str  # "header", "sampled" or "slow"
+    duration_ms: float
+    blocking_ms: float  # Request code running on the event loop thread
+    awaiting_ms: float  # Suspended on I/O, the threadpool or other tasks
+    samples: int
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+
+class TaxonomyInfo(BaseModel):
+    version: str
+    skill_count: int
+    synonym_count: int
+    categories: Dict[str, List[str]]
+    previous_version: Optional[str] = None  # Set by a reload
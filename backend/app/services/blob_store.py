@@ -0,0 +1,115 @@
+import io
+import os
+import time
+from typing import ContextManager, Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.upload_blob import UploadBlob
+from app.utils.uploads import StoredUpload, commit_upload, open_mapped
+
+
+class BlobStore:
+    """Content-addressed storage for uploaded files.
+
+    Blobs live at `<root>/<aa>/<bb>/<sha256>` and are shared by every
+    candidate that uploads the same bytes. `upload_blobs.ref_count` tracks
+    the number of referencing candidates; `garbage_collect` removes blobs
+    nobody references any more.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.path.join(settings.UPLOAD_DIR, "blobs")
+
+    def path_for(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def put(self, db: Session, upload: StoredUpload) -> str:
+        """Move a streamed upload into the store and add one reference.
+
+        If the content is already stored the temp file is discarded. The
+        reference count change is flushed; the caller commits it.
+        """
+        destination = self.path_for(upload.sha256)
+        if os.path.exists(destination):
+            os.remove(upload.path)
+        else:
+            commit_upload(upload, destination)
+
+        self._add_reference(db, upload.sha256, upload.size)
+        return upload.sha256
+
+    def _add_reference(self, db: Session, sha256: str, size: int) -> None:
+        updated = db.execute(
+            update(UploadBlob)
+            .where(UploadBlob.sha256 == sha256)
+            .values(ref_count=UploadBlob.ref_count + 1)
+        ).rowcount
+        if updated:
+            return
+        try:
+            with db.begin_nested():
+                db.add(UploadBlob(sha256=sha256, size=size, ref_count=1))
+        except IntegrityError:
+            # Another request inserted the row first
+            db.execute(
+                update(UploadBlob)
+                .where(UploadBlob.sha256 == sha256)
+                .values(ref_count=UploadBlob.ref_count + 1)
+            )
+
+    def release(self, db: Session, sha256: Optional[str]) -> None:
+        """Drop one reference; the file is removed by the next garbage collection"""
+        if not sha256:
+            return
+        db.execute(
+            update(UploadBlob)
+            .where(UploadBlob.sha256 == sha256, UploadBlob.ref_count > 0)
+            .values(ref_count=UploadBlob.ref_count - 1)
+        )
+
+    def open_mapped(self, sha256: str) -> ContextManager[io.RawIOBase]:
+        """Read-only memory map of a blob (parsers read it without copying)"""
+        return open_mapped(self.path_for(sha256))
+
+    def garbage_collect(self, db: Session, grace_seconds: int = 3600) -> Dict[str, int]:
+        """Delete unreferenced blobs and orphaned files.
+
+        Files without a row are only removed once older than the grace
+        period, so uploads between put() and commit are not lost. Meant to
+        run as periodic maintenance (see scripts/gc_blobs.py).
+        """
+        removed_rows = 0
+        freed_bytes = 0
+        candidates = [sha for (sha,) in db.query(UploadBlob.sha256).filter(UploadBlob.ref_count <= 0).all()]
+        for sha256 in candidates:
+            # Re-check the count in the delete itself in case the blob was just reused
+            deleted = (
+                db.query(UploadBlob)
+                .filter(UploadBlob.sha256 == sha256, UploadBlob.ref_count <= 0)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            if not deleted:
+                continue
+            removed_rows += 1
+            path = self.path_for(sha256)
+            if os.path.exists(path):
+                freed_bytes += os.path.getsize(path)
+                os.remove(path)
+
+        known = {sha for (sha,) in db.query(UploadBlob.sha256).all()}
+        removed_orphans = 0
+        cutoff = time.time() - grace_seconds
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                if name not in known and os.path.getmtime(path) < cutoff:
+                    freed_bytes += os.path.getsize(path)
+                    os.remove(path)
+                    removed_orphans += 1
+
+        return {"removed_blobs": removed_rows, "removed_orphans": removed_orphans, "freed_bytes": freed_bytes}
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, UploadFile
 import os
@@ -10,7 +11,18 @@ from app.schemas.candidate import CandidateUpdate
 from app.services.resume_parser_service import ResumeParserService
 from app.services.scoring_service import ScoringService
 from app.services.llm_service import LLMService
+from app.services.facet_service import SkillFacetService
+from app.services.search_service import CandidateSearchService
+from app.services.retrieval_service import HybridRetrievalService
+from app.services.talent_pool_service import TalentPoolService
+from app.services.leaderboard_service import LeaderboardService
+from app.services.job_stats_service import JobStatsService
+from app.services.export_service import CandidateExportService, EXPORT_FORMATS
+from app.services.dedup_service import DuplicateDetectionService
+from app.services.blob_store import BlobStore
 from app.core.config import settings
+from app.core.metrics import record_cache, stage
+from app.utils.uploads import stream_upload
 
 
 class CandidateService:
@@ -18,6 +30,15 @@ class CandidateService:
         self.resume_parser = ResumeParserService()
         self.scoring_service = ScoringService()
         self.llm_service = LLMService()
+        self.facet_service = SkillFacetService(self.scoring_service.feature_service)
+        self.search_service = CandidateSearchService()
+        self.retrieval_service = HybridRetrievalService(self.scoring_service)
+        self.talent_pool_service = TalentPoolService(self.scoring_service)
+        self.leaderboard_service = LeaderboardService()
+        self.stats_service = JobStatsService(self.scoring_service.feature_service, self.facet_service)
+        self.export_service = CandidateExportService()
+        self.dedup_service = DuplicateDetectionService()
+        self.blob_store = BlobStore()
 
     async def upload_resume(
         self,
@@ -35,84 +56,422 @@ class CandidateService:
             raise HTTPException(status_code=404, detail="Job not found")
 
         # Check file type
+        if file.filename.lower().endswith(".doc"):
+            raise HTTPException(status_code=400, detail="Legacy .doc files are not supported; upload a .docx or PDF")
         if not any(file.filename.lower().endswith(ext) for ext in settings.ALLOWED_EXTENSIONS):
             raise HTTPException(status_code=400, detail="Unsupported file type")
 
-        # Save uploaded file
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-        file_path = os.path.join(settings.UPLOAD_DIR, f"{job_id}_{name}_{file.filename}")
-
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            if len(content) > settings.MAX_FILE_SIZE:
-                raise HTTPException(status_code=400, detail="File too large")
-            buffer.write(content)
+        # Stream the upload to a temp file, then move it into the blob store
+        with stage("upload", "receive"):
+            stored = await stream_upload(
+                file, settings.UPLOAD_DIR, settings.MAX_FILE_SIZE, settings.UPLOAD_BLOCK_SIZE
+            )
 
+        registered = None
         try:
-            # Parse resume
-            resume_text, structured_data = await self.resume_parser.parse_resume(file_path)
-
-            # Create candidate record
-            candidate = Candidate(
-                job_id=job_id,
-                name=name,
-                email=email,
-                phone=phone,
-                resume_filename=file.filename,
-                resume_text=resume_text,
-                structured_data=structured_data
-            )
-            db.add(candidate)
-            db.commit()
-            db.refresh(candidate)
+            with stage("upload", "store"):
+                resume_sha256 = self.blob_store.put(db, stored)
+
+            # Identical bytes were parsed before: reuse the result
+            parsed = self.find_parsed_resume(db, resume_sha256)
+            if parsed is None:
+                with stage("upload", "parse"):
+                    parsed = await self.resume_parser.parse_resume(
+                        self.blob_store.path_for(resume_sha256), os.path.splitext(file.filename)[1]
+                    )
+            resume_text, structured_data = parsed
+
+            with stage("upload", "register"):
+                candidate = self.build_candidate(
+                    job_id, name, email, phone, file.filename, resume_text, structured_data
+                )
+                candidate.resume_sha256 = resume_sha256
+                original = self.register_candidate(db, candidate, user_id)
+                db.commit()
+                db.refresh(candidate)
+                registered = candidate
 
             # Process resume chunks and calculate scores
-            await self._process_candidate_chunks(db, candidate, job)
+            if original is not None:
+                chunk_records = await self._reuse_candidate_chunks(db, candidate, job, original)
+            else:
+                chunk_records = await self._process_candidate_chunks(db, candidate, job)
+            registered = None
+            with stage("upload", "index"):
+                self.index_candidate(candidate, chunk_records)
 
             return candidate
 
         except Exception as e:
-            # Clean up file if processing fails
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            # Undo the uncommitted blob reference; an unreferenced file is
+            # removed by the next garbage collection
+            db.rollback()
+            if registered is not None:
+                # Committed before scoring (to release the job lock): do not leave it unscored
+                self._discard_registered(db, registered)
+            if isinstance(e, HTTPException):
+                raise
             raise HTTPException(status_code=500, detail=f"Resume processing failed: {str(e)}")
 
+    def _discard_registered(self, db: Session, candidate: Candidate) -> None:
+        job_id, candidate_id = candidate.job_id, candidate.id
+        try:
+            self.remove_candidate(db, candidate)
+            db.commit()
+            self.unindex_candidate(job_id, candidate_id)
+        except Exception as e:
+            db.rollback()
+            print(f"Could not remove unscored candidate {candidate_id}: {e}")
+
+    def find_parsed_resume(self, db: Session, resume_sha256: str) -> Optional[Tuple[str, dict]]:
+        """Text and structured data of an earlier candidate with the same file"""
+        parsed = (
+            db.query(Candidate.resume_text, Candidate.structured_data)
+            .filter(Candidate.resume_sha256 == resume_sha256)
+            .first()
+        )
+        record_cache("parsed_resume", parsed is not None)
+        if parsed is None:
+            return None
+        # Skills extracted with an older taxonomy are matched again
+        structured_data = self.resume_parser.refresh_skills(parsed.resume_text, dict(parsed.structured_data or {}))
+        return parsed.resume_text, structured_data
+
+    def build_candidate(
+        self,
+        job_id: int,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        filename: str,
+        resume_text: str,
+        structured_data: dict
+    ) -> Candidate:
+        """Unsaved candidate with its features and MinHash signature filled in"""
+        candidate = Candidate(
+            job_id=job_id,
+            name=name,
+            email=email,
+            phone=phone,
+            resume_filename=filename,
+            resume_text=resume_text,
+            structured_data=structured_data,
+            minhash_signature=self.dedup_service.compute_signature(resume_text)
+        )
+        self.scoring_service.feature_service.apply_resume_features(candidate)
+        return candidate
+
+    def find_original(
+        self, db: Session, candidate: Candidate, user_id: int
+    ) -> Tuple[Optional[Candidate], Optional[float]]:
+        """Earlier near-identical resume from this user's jobs, and its similarity"""
+        duplicate = self.dedup_service.find_duplicate(db, candidate.minhash_signature, user_id)
+        original, similarity = duplicate if duplicate else (None, None)
+        if original is not None and original.duplicate_of_id:
+            original = original.duplicate_of
+        return original, similarity
+
+    @staticmethod
+    def copy_chunks(db: Session, original: Candidate) -> List[CandidateChunk]:
+        """Unsaved copies of a candidate's chunks, embeddings included"""
+        return [
+            CandidateChunk(
+                chunk_text=chunk.chunk_text,
+                chunk_type=chunk.chunk_type,
+                embedding_vector=chunk.embedding_vector,
+                embedding_backend=chunk.embedding_backend
+            )
+            for chunk in db.query(CandidateChunk).filter(CandidateChunk.candidate_id == original.id).all()
+        ]
+
+    def register_candidate(self, db: Session, candidate: Candidate, user_id: int) -> Optional[Candidate]:
+        """Insert the candidate and its facet and LSH index entries (flushed, not committed).
+
+        Returns the original it near-duplicates, if any.
+        """
+        original, similarity = self.find_original(db, candidate, user_id)
+        candidate.duplicate_of_id = original.id if original is not None else None
+        candidate.duplicate_similarity = similarity
+
+        db.add(candidate)
+        db.flush()
+        self.facet_service.add_candidate(db, candidate)
+        self.dedup_service.index_candidate(db, candidate)
+        self.stats_service.apply(db, candidate.job_id, None, self.stats_service.contribution(candidate))
+        return original
+
+    def index_candidate(self, candidate: Candidate, chunk_records: List[CandidateChunk]) -> None:
+        """Add a committed candidate to the search indexes and its job's leaderboard"""
+        self.search_service.index_candidate(candidate)
+        self.retrieval_service.index_chunks(candidate, chunk_records)
+        self.leaderboard_service.record([candidate])
+
+    def remove_candidate(self, db: Session, candidate: Candidate) -> None:
+        """Delete a candidate with its index entries and blob reference (flushed, not committed)"""
+        self.facet_service.remove_candidate(db, candidate)
+        self.stats_service.apply(db, candidate.job_id, self.stats_service.contribution(candidate), None)
+        self.dedup_service.remove_candidate(db, candidate)
+        db.query(CandidateChunk).filter(CandidateChunk.candidate_id == candidate.id).delete(synchronize_session=False)
+        self.blob_store.release(db, candidate.resume_sha256)
+        db.delete(candidate)
+        db.flush()
+
+    def unindex_candidate(self, job_id: int, candidate_id: int) -> None:
+        """Drop a deleted candidate from the in-memory indexes after commit"""
+        self.search_service.index.remove_document(candidate_id)
+        self.leaderboard_service.discard(job_id, candidate_id)
+
     async def _process_candidate_chunks(self, db: Session, candidate: Candidate, job: Job):
         """Process resume into chunks and calculate scores"""
         # Create text chunks
-        chunks = await self.resume_parser.create_chunks(candidate.resume_text)
+        with stage("upload", "chunk"):
+            chunks = await self.resume_parser.create_chunks(candidate.resume_text)
 
-        chunk_records = []
-        for chunk_data in chunks:
-            # Generate embeddings for each chunk
-            embedding = await self.scoring_service.generate_embedding(chunk_data["text"])
+        # Embed all chunks in one batch
+        with stage("upload", "embed"):
+            embeddings, backend = await self.scoring_service.embed_texts([chunk["text"] for chunk in chunks])
 
-            chunk_record = CandidateChunk(
+        chunk_records = [
+            CandidateChunk(
                 candidate_id=candidate.id,
                 chunk_text=chunk_data["text"],
                 chunk_type=chunk_data["type"],
-                embedding_vector=embedding.tolist() if hasattr(embedding, 'tolist') else embedding
+                embedding_vector=embedding,
+                embedding_backend=backend
             )
-            chunk_records.append(chunk_record)
+            for chunk_data, embedding in zip(chunks, embeddings)
+        ]
 
         db.add_all(chunk_records)
 
         # Calculate overall score
-        score_breakdown = await self.scoring_service.calculate_candidate_score(
-            candidate, job, chunk_records
-        )
+        with stage("upload", "score"):
+            score_breakdown = await self.scoring_service.calculate_candidate_score(
+                candidate, job, chunk_records
+            )
 
         # Generate explanation
-        explanation = await self.llm_service.explain_candidate_match(
-            job.description, candidate.resume_text, score_breakdown
-        )
+        with stage("upload", "explain"):
+            explanation = await self.llm_service.explain_candidate_match(
+                job.description, candidate.resume_text, score_breakdown
+            )
 
         # Update candidate with scores
+        previous = self.stats_service.contribution(candidate)
+        candidate.score_breakdown = score_breakdown
+        candidate.total_score = score_breakdown.get("total_weighted_score", 0.0)
+        candidate.match_explanation = explanation
+        self.stats_service.apply(db, candidate.job_id, previous, self.stats_service.contribution(candidate))
+
+        with stage("upload", "commit"):
+            db.commit()
+        return chunk_records
+
+    async def _reuse_candidate_chunks(
+        self,
+        db: Session,
+        candidate: Candidate,
+        job: Job,
+        original: Candidate
+    ) -> List[CandidateChunk]:
+        """Score a near-duplicate using the original's chunks and embeddings"""
+        chunk_records = self.copy_chunks(db, original)
+        if not chunk_records:
+            return await self._process_candidate_chunks(db, candidate, job)
+
+        for chunk in chunk_records:
+            chunk.candidate_id = candidate.id
+        db.add_all(chunk_records)
+
+        with stage("upload", "score"):
+            score_breakdown = await self.scoring_service.calculate_candidate_score(
+                candidate, job, chunk_records
+            )
+
+        # The explanation is job-specific, so it can only be reused within the same job
+        if original.job_id == job.id and original.match_explanation:
+            explanation = original.match_explanation
+        else:
+            with stage("upload", "explain"):
+                explanation = await self.llm_service.explain_candidate_match(
+                    job.description, candidate.resume_text, score_breakdown
+                )
+
+        previous = self.stats_service.contribution(candidate)
         candidate.score_breakdown = score_breakdown
         candidate.total_score = score_breakdown.get("total_weighted_score", 0.0)
         candidate.match_explanation = explanation
+        self.stats_service.apply(db, candidate.job_id, previous, self.stats_service.contribution(candidate))
+
+        with stage("upload", "commit"):
+            db.commit()
+        return chunk_records
+
+    async def refresh_job_skills(self, db: Session, job_id: int, user_id: int) -> dict:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return self.refresh_skills(db, job)
 
+    def refresh_skills(self, db: Session, job: Job) -> dict:
+        """Bring a job's candidates up to the current skills taxonomy.
+
+        Only candidates parsed with another taxonomy version are matched
+        again, against their stored resume text; files are not re-read.
+        Facets and the structured part of the score follow the new skills.
+        If synonyms changed how the job's own requirements resolve, every
+        candidate of the job is rescored. Candidates uploaded before skill
+        facets existed are indexed here as well.
+        """
+        taxonomy = self.resume_parser.taxonomy.current()
+        feature_service = self.scoring_service.feature_service
+        indexed = self.facet_service.index_pending(db, job.id)
+
+        previous_requirements = job.requirement_features
+        feature_service.apply_requirement_features(job)
+        requirements_changed = job.requirement_features != previous_requirements
+
+        stale = (
+            db.query(Candidate)
+            .filter(
+                Candidate.job_id == job.id,
+                or_(Candidate.taxonomy_version.is_(None), Candidate.taxonomy_version != taxonomy.version)
+            )
+            .order_by(Candidate.id)
+            .all()
+        )
+        changed = []
+        for candidate in stale:
+            previous_bits = feature_service.decode_bits(feature_service.candidate_features(candidate)["skill_bits"])
+            candidate.structured_data = self.resume_parser.refresh_skills(
+                candidate.resume_text, dict(candidate.structured_data or {}), taxonomy
+            )
+            feature_service.apply_resume_features(candidate)
+            if feature_service.decode_bits(candidate.skill_bits) != previous_bits:
+                self.facet_service.update_candidate(db, candidate, previous_bits)
+                changed.append(candidate)
+
+        # The semantic part of the score does not depend on skills and is kept
+        if requirements_changed:
+            rescore = db.query(Candidate).filter(Candidate.job_id == job.id).all()
+        else:
+            rescore = changed
+        rescore = [candidate for candidate in rescore if candidate.score_breakdown]
+        weights = self.scoring_service.weights
+        scores = self.scoring_service.calculate_structured_scores(rescore, job)
+        for candidate, (keyword, experience, education) in zip(rescore, scores.tolist()):
+            breakdown = dict(candidate.score_breakdown)
+            total = (
+                breakdown.get("semantic_similarity", 0.0) * weights["semantic_similarity"] +
+                keyword * weights["keyword_overlap"] +
+                experience * weights["experience_match"] +
+                education * weights["education_match"]
+            )
+            breakdown.update(
+                keyword_overlap=round(keyword, 3),
+                experience_match=round(experience, 3),
+                education_match=round(education, 3),
+                total_weighted_score=round(total, 3)
+            )
+            candidate.score_breakdown = breakdown
+            candidate.total_score = breakdown["total_weighted_score"]
+
+        # Skill counts and scores may have moved for many candidates
+        if changed or rescore or indexed:
+            self.stats_service.rebuild(db, job.id)
         db.commit()
+        self.leaderboard_service.record(rescore)
+        return {
+            "job_id": job.id,
+            "taxonomy_version": taxonomy.version,
+            "checked": len(stale),
+            "changed": len(changed),
+            "rescored": len(rescore),
+            "requirements_changed": requirements_changed
+        }
+
+    async def reembed_chunks(self, db: Session, job: Job, include_unmarked: bool = False) -> dict:
+        """Embed chunks again whose vectors came from another backend (the fallback).
+
+        Replacements are inserted as new chunk rows and the old rows
+        deleted, so the append-only retrieval and talent pool indexes pick
+        them up by watermark. Candidates with replaced chunks are rescored.
+        With include_unmarked, chunks stored before the backend was
+        recorded are embedded again as well. Stops, keeping what was done,
+        while the primary backend is still failing.
+        """
+        scoring_service = self.scoring_service
+        primary = scoring_service.embedding_backend.name
+        result = {"job_id": job.id, "reembedded": 0, "rescored": 0, "complete": False}
+
+        mismatched = CandidateChunk.embedding_backend != primary
+        if include_unmarked:
+            mismatched = or_(CandidateChunk.embedding_backend.is_(None), mismatched)
+        stale = (
+            db.query(CandidateChunk)
+            .join(Candidate, Candidate.id == CandidateChunk.candidate_id)
+            .filter(Candidate.job_id == job.id, mismatched)
+            .order_by(CandidateChunk.id)
+            .all()
+        )
+        if not stale:
+            result["complete"] = True
+            return result
+        job_embedding, backend = await scoring_service.embed_job(job)
+        if backend != primary:
+            return result
+
+        by_candidate = {}
+        for chunk in stale:
+            by_candidate.setdefault(chunk.candidate_id, []).append(chunk)
+        rescored = []
+        for candidate_id, chunks in by_candidate.items():
+            embeddings, backend = await scoring_service.embed_texts([chunk.chunk_text for chunk in chunks])
+            if backend != primary:
+                break
+            db.add_all([
+                CandidateChunk(
+                    candidate_id=candidate_id,
+                    chunk_text=chunk.chunk_text,
+                    chunk_type=chunk.chunk_type,
+                    embedding_vector=embedding,
+                    embedding_backend=backend
+                )
+                for chunk, embedding in zip(chunks, embeddings)
+            ])
+            for chunk in chunks:
+                db.delete(chunk)
+            db.flush()
+            result["reembedded"] += len(chunks)
+
+            candidate = db.query(Candidate).filter(Candidate.id == candidate_id).one()
+            if candidate.score_breakdown:
+                current = db.query(CandidateChunk).filter(CandidateChunk.candidate_id == candidate_id).all()
+                previous = self.stats_service.contribution(candidate)
+                breakdown = (await scoring_service.score_candidates(
+                    [candidate], job, {candidate_id: current}, job_embedding
+                ))[0]
+                candidate.score_breakdown = breakdown
+                candidate.total_score = breakdown["total_weighted_score"]
+                self.stats_service.apply(db, job.id, previous, self.stats_service.contribution(candidate))
+                rescored.append(candidate)
+        else:
+            result["complete"] = True
+
+        db.commit()
+        self.leaderboard_service.record(rescored)
+        result["rescored"] = len(rescored)
+        return result
+
+    async def get_duplicates_report(self, db: Session, job_id: int, user_id: int) -> dict:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return self.dedup_service.duplicates_report(db, job_id)
 
     async def get_job_candidates(
         self,
@@ -121,25 +480,133 @@ class CandidateService:
         user_id: int,
         skip: int = 0,
         limit: int = 100,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        skills: Optional[str] = None,
+        status: Optional[str] = None
     ) -> List[Candidate]:
         # Verify job ownership
         job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
+        # Unfiltered pages come straight from the job's leaderboard
+        if not skills:
+            page = self.leaderboard_service.top(db, job_id, skip, limit, min_score, status)
+            if page is not None:
+                candidates = {
+                    c.id: c for c in db.query(Candidate).filter(
+                        Candidate.id.in_([candidate_id for candidate_id, _ in page])
+                    ).all()
+                }
+                return [candidates[candidate_id] for candidate_id, _ in page if candidate_id in candidates]
+
+        # Intersect skill bitmaps before ranking
+        if skills:
+            ids = self.facet_service.ranked_matches(db, job_id, skills, skip, limit, min_score, status)
+            candidates = {c.id: c for c in db.query(Candidate).filter(Candidate.id.in_(ids)).all()} if ids else {}
+            return [candidates[candidate_id] for candidate_id in ids if candidate_id in candidates]
+
+        query = db.query(Candidate).filter(
+            Candidate.job_id == job_id,
+            Candidate.total_score >= min_score
+        )
+        if status:
+            query = query.filter(Candidate.status == status)
+
         return (
-            db.query(Candidate)
-            .filter(
-                Candidate.job_id == job_id,
-                Candidate.total_score >= min_score
-            )
-            .order_by(Candidate.total_score.desc())
+            query
+            .order_by(Candidate.total_score.desc(), Candidate.id)
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    async def export_job_candidates(
+        self,
+        db: Session,
+        job_id: int,
+        user_id: int,
+        export_format: str = "csv",
+        columns: Optional[str] = None,
+        status: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> Iterator[bytes]:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if export_format not in EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail=f"Unsupported export format; choose from {', '.join(EXPORT_FORMATS)}")
+
+        selected = self.export_service.parse_columns(columns)
+        return self.export_service.stream(job_id, selected, export_format, status, min_score)
+
+    async def get_skill_facets(
+        self,
+        db: Session,
+        job_id: int,
+        user_id: int,
+        min_score: float = 0.0,
+        skills: Optional[str] = None
+    ) -> dict:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return self.facet_service.facet_counts(db, job_id, skills, min_score)
+
+    async def get_hybrid_ranking(
+        self,
+        db: Session,
+        job_id: int,
+        user_id: int,
+        limit: int = 20,
+        k: int = 100
+    ) -> List[dict]:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        ranking = await self.retrieval_service.rank_job(db, job, limit, k)
+        candidates = {
+            c.id: c for c in db.query(Candidate).filter(
+                Candidate.id.in_([r["candidate_id"] for r in ranking])
+            ).all()
+        }
+        results = []
+        for entry in ranking:
+            candidate = candidates.get(entry["candidate_id"])
+            if candidate is not None:
+                results.append({**entry, "name": candidate.name, "total_score": candidate.total_score})
+        return results
+
+    async def find_talent_pool_candidates(
+        self,
+        db: Session,
+        job_id: int,
+        user_id: int,
+        limit: int = 20,
+        include_same_job: bool = False
+    ) -> List[dict]:
+        # Verify job ownership
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return await self.talent_pool_service.find_candidates(db, job, user_id, limit, include_same_job)
+
+    async def search_candidates(
+        self,
+        db: Session,
+        user_id: int,
+        query: str,
+        job_id: Optional[int] = None,
+        limit: int = 20
+    ) -> List[dict]:
+        return await self.search_service.search(db, user_id, query, job_id, limit)
+
     async def get_candidate_details(self, db: Session, candidate_id: int, user_id: int) -> Candidate:
         candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
         if not candidate:
@@ -170,8 +637,57 @@ class CandidateService:
 
         # Update status
         if candidate_data.status:
+            previous = self.stats_service.contribution(candidate)
             candidate.status = candidate_data.status
+            self.stats_service.apply(db, candidate.job_id, previous, self.stats_service.contribution(candidate))
 
         db.commit()
         db.refresh(candidate)
-        return candidate
\ No newline at end of file
+        self.leaderboard_service.record([candidate])
+        return candidate
+
+    async def delete_candidate(self, db: Session, candidate_id: int, user_id: int) -> None:
+        candidate = await self.get_candidate_details(db, candidate_id, user_id)
+        job_id = candidate.job_id
+        self.remove_candidate(db, candidate)
+        db.commit()
+        self.unindex_candidate(job_id, candidate_id)
+        self.talent_pool_service.discard(user_id, candidate_id)
+
+    async def get_candidate_rank(
+        self,
+        db: Session,
+        candidate_id: int,
+        user_id: int,
+        status: Optional[str] = None
+    ) -> dict:
+        candidate = await self.get_candidate_details(db, candidate_id, user_id)
+        if status and candidate.status != status:
+            raise HTTPException(status_code=400, detail=f"Candidate status is '{candidate.status}', not '{status}'")
+
+        found = self.leaderboard_service.rank(db, candidate.job_id, candidate.id, status)
+        if found is not None:
+            rank, total_score, ranked = found
+        else:
+            # Same order as the leaderboard: higher score first, then lower ID
+            total_score = candidate.total_score or 0.0
+            query = db.query(Candidate).filter(Candidate.job_id == candidate.job_id)
+            if status:
+                query = query.filter(Candidate.status == status)
+            ranked = query.count()
+            rank = query.filter(
+                or_(
+                    Candidate.total_score > total_score,
+                    and_(Candidate.total_score == total_score, Candidate.id < candidate.id)
+                )
+            ).count() + 1
+
+        return {
+            "candidate_id": candidate.id,
+            "job_id": candidate.job_id,
+            "status": status,
+            "rank": rank,
+            "total_score": total_score,
+            "ranked": ranked,
+            "percentile": round(100.0 * (ranked - rank) / ranked, 1) if ranked else 0.0
+        }
\ No newline at end of file
@@ -0,0 +1,197 @@
+import hashlib
+import re
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.minhash import CandidateLSHBucket
+
+# Largest prime below 2**32, so permuted hashes fit in uint32
+_PRIME = np.uint64(4294967291)
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHasher:
+    """MinHash signatures over word shingles, with LSH banding"""
+
+    def __init__(
+        self,
+        num_perm: int = settings.DEDUP_NUM_PERM,
+        bands: int = settings.DEDUP_BANDS,
+        shingle_size: int = settings.DEDUP_SHINGLE_SIZE,
+        seed: int = 1
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        # Fixed seed: signatures are persisted and must stay comparable
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        words = _WORD_PATTERN.findall(text.lower())
+        if not words:
+            return np.zeros(0, dtype=np.uint64)
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        hashes = self.shingle_hashes(text or "")
+        if not hashes.size:
+            return None
+        # (a * x + b) mod p stays below 2**64 because a, x, b < 2**32
+        permuted = (np.outer(hashes, self.a) + self.b) % _PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def band_hashes(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit bucket key per band"""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).digest(),
+                "little",
+                signed=True
+            )
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the underlying shingle sets"""
+        return float(np.mean(first == second))
+
+
+class DuplicateDetectionService:
+    """Near-duplicate resume detection backed by persisted LSH buckets"""
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        self.hasher = hasher or MinHasher()
+
+    @staticmethod
+    def _decode(signature: Optional[bytes]) -> Optional[np.ndarray]:
+        return np.frombuffer(signature, dtype=np.uint32) if signature else None
+
+    def compute_signature(self, text: str) -> Optional[bytes]:
+        signature = self.hasher.signature(text)
+        return signature.tobytes() if signature is not None else None
+
+    def _match_query(self, db: Session, vector: np.ndarray, user_id: int):
+        """ID, signature and original of this user's candidates sharing an LSH bucket.
+
+        Only these columns are selected: DISTINCT over a whole candidate
+        row includes its JSON columns, which Postgres cannot compare.
+        """
+        bucket_filter = or_(*[
+            and_(CandidateLSHBucket.band == band, CandidateLSHBucket.bucket == bucket)
+            for band, bucket in enumerate(self.hasher.band_hashes(vector))
+        ])
+        return db.query(Candidate.id, Candidate.minhash_signature, Candidate.duplicate_of_id).filter(
+            Candidate.id.in_(db.query(CandidateLSHBucket.candidate_id).filter(bucket_filter)),
+            Candidate.job_id.in_(db.query(Job.id).filter(Job.created_by == user_id))
+        )
+
+    def find_duplicate(
+        self,
+        db: Session,
+        signature: Optional[bytes],
+        user_id: int
+    ) -> Optional[Tuple[Candidate, float]]:
+        """Most similar earlier candidate of this user above the threshold.
+
+        Only candidates sharing at least one LSH bucket are compared, so the
+        cost depends on the number of near matches, not on the table size.
+        """
+        vector = self._decode(signature)
+        if vector is None or vector.size != self.hasher.num_perm:
+            return None
+
+        matches = self._match_query(db, vector, user_id).all()
+
+        best, best_similarity = None, 0.0
+        for match in matches:
+            other = self._decode(match.minhash_signature)
+            if other is None or other.size != vector.size:
+                continue
+            similarity = self.hasher.similarity(vector, other)
+            # Prefer originals over copies, then older candidates, when similarities tie
+            if best is None or similarity > best_similarity or (
+                similarity == best_similarity
+                and (bool(match.duplicate_of_id), match.id) < (bool(best.duplicate_of_id), best.id)
+            ):
+                best, best_similarity = match, similarity
+
+        if best is None or best_similarity < settings.DEDUP_THRESHOLD:
+            return None
+        return db.query(Candidate).filter(Candidate.id == best.id).one(), best_similarity
+
+    def index_candidate(self, db: Session, candidate: Candidate) -> None:
+        """Record the candidate's LSH buckets (flushed, not committed)"""
+        vector = self._decode(candidate.minhash_signature)
+        if vector is None:
+            return
+        db.add_all([
+            CandidateLSHBucket(candidate_id=candidate.id, band=band, bucket=bucket)
+            for band, bucket in enumerate(self.hasher.band_hashes(vector))
+        ])
+        db.flush()
+
+    def remove_candidate(self, db: Session, candidate: Candidate) -> None:
+        """Drop a deleted candidate's LSH buckets; its copies become originals (not committed)"""
+        db.query(CandidateLSHBucket).filter(
+            CandidateLSHBucket.candidate_id == candidate.id
+        ).delete(synchronize_session=False)
+        db.query(Candidate).filter(Candidate.duplicate_of_id == candidate.id).update(
+            {Candidate.duplicate_of_id: None, Candidate.duplicate_similarity: None}, synchronize_session=False
+        )
+
+    def duplicates_report(self, db: Session, job_id: int) -> Dict[str, Any]:
+        """Duplicates in a job, grouped by the original they copy"""
+        duplicates = (
+            db.query(Candidate)
+            .filter(Candidate.job_id == job_id, Candidate.duplicate_of_id.isnot(None))
+            .order_by(Candidate.duplicate_of_id, Candidate.id)
+            .all()
+        )
+        originals = {
+            c.id: c for c in db.query(Candidate).filter(
+                Candidate.id.in_({d.duplicate_of_id for d in duplicates})
+            ).all()
+        } if duplicates else {}
+
+        groups: Dict[int, Dict[str, Any]] = {}
+        for duplicate in duplicates:
+            original = originals.get(duplicate.duplicate_of_id)
+            if original is None:
+                continue
+            group = groups.setdefault(original.id, {
+                "original": {
+                    "candidate_id": original.id,
+                    "name": original.name,
+                    "email": original.email,
+                    "job_id": original.job_id
+                },
+                "duplicates": []
+            })
+            group["duplicates"].append({
+                "candidate_id": duplicate.id,
+                "name": duplicate.name,
+                "email": duplicate.email,
+                "job_id": duplicate.job_id,
+                "similarity": round(duplicate.duplicate_similarity or 0.0, 3)
+            })
+
+        return {
+            "job_id": job_id,
+            "duplicate_count": len(duplicates),
+            "groups": list(groups.values())
+        }
@@ -0,0 +1,98 @@
+import re
+import zipfile
+from typing import BinaryIO, Iterator, List
+from xml.etree.ElementTree import iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_CONTAINERS = {f"{_W}body", f"{_W}hdr", f"{_W}ftr"}
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_HEADER_PART = re.compile(r"word/header\d*\.xml$")
+_FOOTER_PART = re.compile(r"word/footer\d*\.xml$")
+
+
+class DOCXTextExtractor:
+    """Streaming text extraction straight from a DOCX archive.
+
+    Parts are read with iterparse and elements are discarded as soon as
+    they end, so memory stays flat however large the document is. Unlike
+    python-docx's `doc.paragraphs` this covers table cells (one line per
+    row, cells joined by " | "), text boxes, headers and footers.
+    """
+
+    def parts(self, archive: zipfile.ZipFile) -> List[str]:
+        """Headers first (contact details often live there), then the body, then footers"""
+        names = archive.namelist()
+        headers = sorted(name for name in names if _HEADER_PART.match(name))
+        footers = sorted(name for name in names if _FOOTER_PART.match(name))
+        if "word/document.xml" not in names:
+            raise ValueError("Not a DOCX document: word/document.xml is missing")
+        return headers + ["word/document.xml"] + footers
+
+    def iter_part(self, stream: BinaryIO) -> Iterator[str]:
+        """Lines of one WordprocessingML part, in document order"""
+        paragraphs: List[List[str]] = []  # Nested for text boxes inside paragraphs
+        rows: List[List[str]] = []  # Cells of the table rows being read
+        cells: List[List[str]] = []  # Paragraphs of the cells being read
+        container = None  # Parent of top-level blocks; emptied as blocks finish
+        run_depth = 0
+        skip_depth = 0  # Inside mc:Fallback, which repeats the preceding mc:Choice
+
+        for event, element in iterparse(stream, events=("start", "end")):
+            tag = element.tag
+            if tag == _MC_FALLBACK:
+                skip_depth += 1 if event == "start" else -1
+            if skip_depth:
+                if event == "end":
+                    element.clear()
+                continue
+
+            if event == "start":
+                if tag in _CONTAINERS:
+                    container = element
+                elif tag == f"{_W}p":
+                    paragraphs.append([])
+                elif tag == f"{_W}r":
+                    run_depth += 1
+                elif tag == f"{_W}tr":
+                    rows.append([])
+                elif tag == f"{_W}tc":
+                    cells.append([])
+                continue
+
+            if tag == f"{_W}t" and paragraphs:
+                paragraphs[-1].append(element.text or "")
+            elif tag == f"{_W}tab" and run_depth and paragraphs:
+                paragraphs[-1].append("\t")
+            elif tag in (f"{_W}br", f"{_W}cr") and run_depth and paragraphs:
+                paragraphs[-1].append("\n")
+            elif tag == f"{_W}r":
+                run_depth -= 1
+            elif tag == f"{_W}p" and paragraphs:
+                text = "".join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(text)
+                elif text:
+                    yield text
+            elif tag == f"{_W}tc" and cells:
+                cell = " ".join(part for part in cells.pop() if part)
+                if rows:
+                    rows[-1].append(cell)
+            elif tag == f"{_W}tr" and rows:
+                row = " | ".join(cell for cell in rows.pop() if cell)
+                if cells:  # Nested table
+                    cells[-1].append(row)
+                elif row:
+                    yield row
+
+            element.clear()
+            if container is not None and not paragraphs and not rows and tag in (f"{_W}p", f"{_W}tbl"):
+                container.clear()
+
+    def iter_lines(self, fp: BinaryIO) -> Iterator[str]:
+        with zipfile.ZipFile(fp) as archive:
+            for part in self.parts(archive):
+                with archive.open(part) as stream:
+                    yield from self.iter_part(stream)
+
+    def extract(self, fp: BinaryIO) -> str:
+        return "\n".join(self.iter_lines(fp))
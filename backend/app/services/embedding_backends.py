@@ -0,0 +1,142 @@
+import abc
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import record_provider_call
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "we you your our their i my me".split()
+)
+_MAX_CACHED_FEATURES = 200_000
+
+
+class EmbeddingBackend(abc.ABC):
+    """Turns texts into fixed-size vectors, a batch at a time"""
+
+    name = ""
+
+    def __init__(self, dimensions: Optional[int] = None):
+        self.dimensions = dimensions or settings.EMBEDDING_DIMENSIONS
+
+    @abc.abstractmethod
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """One vector of `dimensions` floats per text, in order"""
+
+
+class RemoteEmbeddingBackend(EmbeddingBackend):
+    """DeepSeek /embeddings, sending up to EMBEDDING_BATCH_SIZE inputs per request.
+
+    Raises on any failure; falling back is up to the caller.
+    """
+
+    name = "remote"
+
+    def __init__(self, dimensions: Optional[int] = None, batch_size: Optional[int] = None):
+        super().__init__(dimensions)
+        self.api_key = settings.DEEPSEEK_API_KEY
+        self.base_url = settings.DEEPSEEK_BASE_URL
+        self.batch_size = max(1, batch_size or settings.EMBEDDING_BATCH_SIZE)
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        embeddings: List[List[float]] = []
+        async with httpx.AsyncClient(base_url=self.base_url, headers=headers, timeout=30.0) as client:
+            for start in range(0, len(texts), self.batch_size):
+                batch = texts[start:start + self.batch_size]
+                embeddings.extend(await self._request(client, batch))
+        return embeddings
+
+    async def _request(self, client: httpx.AsyncClient, batch: List[str]) -> List[List[float]]:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/embeddings", json={"model": settings.EMBEDDING_MODEL, "input": batch})
+            response.raise_for_status()
+            result = response.json()
+            data = sorted(result["data"], key=lambda item: item.get("index", 0))
+            if len(data) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(data)}")
+        except Exception:
+            record_provider_call("deepseek", "embedding", time.perf_counter() - start, False)
+            raise
+        record_provider_call("deepseek", "embedding", time.perf_counter() - start, True, result.get("usage"))
+        return [item["embedding"] for item in data]
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """CPU-only embeddings from signed feature hashing of words and word pairs.
+
+    Each term is hashed (CRC-32, stable across processes) to a dimension
+    and a sign, weighted by 1 + log(term frequency), and the vector is L2
+    normalized, so cosine similarity tracks vocabulary overlap. There are
+    no corpus statistics (common words are dropped instead), which keeps
+    vectors identical across deployments and over time. A batch becomes
+    one NumPy matrix; a resume chunk takes well under a millisecond.
+    """
+
+    name = "local"
+
+    def __init__(self, dimensions: Optional[int] = None):
+        super().__init__(dimensions)
+        self._features: Dict[str, Tuple[int, float]] = {}
+
+    def _feature(self, term: str) -> Tuple[int, float]:
+        feature = self._features.get(term)
+        if feature is None:
+            digest = zlib.crc32(term.encode("utf-8"))
+            feature = (digest % self.dimensions, 1.0 if digest & 0x80000000 else -1.0)
+            if len(self._features) >= _MAX_CACHED_FEATURES:
+                self._features.clear()
+            self._features[term] = feature
+        return feature
+
+    @staticmethod
+    def terms(text: str) -> Counter:
+        words = [word for word in _TOKEN.findall(text.lower()) if word not in _STOPWORDS]
+        terms = Counter(words)
+        terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+        return terms
+
+    def embed_matrix(self, texts: List[str]) -> np.ndarray:
+        rows: List[int] = []
+        columns: List[int] = []
+        values: List[float] = []
+        for row, text in enumerate(texts):
+            for term, count in self.terms(text).items():
+                column, sign = self._feature(term)
+                rows.append(row)
+                columns.append(column)
+                values.append(sign * (1.0 + math.log(count)))
+
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_matrix(texts).tolist()
+
+
+EMBEDDING_BACKENDS = {
+    RemoteEmbeddingBackend.name: RemoteEmbeddingBackend,
+    HashingEmbeddingBackend.name: HashingEmbeddingBackend
+}
+
+
+def create_embedding_backend(name: str) -> EmbeddingBackend:
+    try:
+        return EMBEDDING_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown embedding backend '{name}' (choose from {', '.join(EMBEDDING_BACKENDS)})")
@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.candidate import Candidate
+
+
+def _breakdown(component: str) -> Tuple[Any, Callable[[Any], Any]]:
+    return Candidate.score_breakdown, lambda breakdown: (breakdown or {}).get(component)
+
+
+# Column name -> (selected database column, value from that column); "rank" is the row number
+EXPORT_COLUMNS: Dict[str, Tuple[Any, Callable[[Any], Any]]] = {
+    "candidate_id": (Candidate.id, lambda value: value),
+    "name": (Candidate.name, lambda value: value),
+    "email": (Candidate.email, lambda value: value),
+    "phone": (Candidate.phone, lambda value: value),
+    "status": (Candidate.status, lambda value: value),
+    "total_score": (Candidate.total_score, lambda value: value),
+    "semantic_similarity": _breakdown("semantic_similarity"),
+    "keyword_overlap": _breakdown("keyword_overlap"),
+    "experience_match": _breakdown("experience_match"),
+    "education_match": _breakdown("education_match"),
+    "experience_years": (Candidate.experience_years, lambda value: value),
+    "education_level": (Candidate.education_level, lambda value: value),
+    "skills": (Candidate.structured_data, lambda data: (data or {}).get("skills") or []),
+    "resume_filename": (Candidate.resume_filename, lambda value: value),
+    "duplicate_of_id": (Candidate.duplicate_of_id, lambda value: value),
+    "created_at": (Candidate.created_at, lambda value: value.isoformat() if value else None),
+}
+DEFAULT_EXPORT_COLUMNS = ["rank", "candidate_id", "name", "email", "phone", "status", "total_score"]
+EXPORT_FORMATS = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class CandidateExportService:
+    """Streams a job's full ranking as CSV or NDJSON.
+
+    Rows are read through a server-side cursor (yield_per) in their own
+    session, because the response outlives the request's session, and
+    written out EXPORT_BATCH_SIZE rows at a time; memory does not grow
+    with the job and the header goes out before the first fetch.
+    """
+
+    @staticmethod
+    def parse_columns(columns: Optional[str]) -> List[str]:
+        if not columns:
+            return list(DEFAULT_EXPORT_COLUMNS)
+        names = [name.strip().lower() for name in columns.split(",") if name.strip()]
+        unknown = [name for name in names if name != "rank" and name not in EXPORT_COLUMNS]
+        if unknown or not names:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown export columns: {', '.join(unknown) or '(none)'}; "
+                       f"choose from rank, {', '.join(EXPORT_COLUMNS)}"
+            )
+        return list(dict.fromkeys(names))
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        if isinstance(value, list):
+            value = "; ".join(str(item) for item in value)
+        # Keep spreadsheets from evaluating resume text as formulas
+        if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+            return "'" + value
+        return value
+
+    def _rows(
+        self,
+        job_id: int,
+        columns: List[str],
+        status: Optional[str],
+        min_score: float
+    ) -> Iterator[List[Any]]:
+        selected = {}
+        for name in columns:
+            if name != "rank":
+                column = EXPORT_COLUMNS[name][0]
+                selected.setdefault(column.key, column)
+        positions = {key: index for index, key in enumerate(selected)}
+        db = SessionLocal()
+        try:
+            query = db.query(*selected.values()).filter(
+                Candidate.job_id == job_id,
+                Candidate.total_score >= min_score
+            )
+            if status:
+                query = query.filter(Candidate.status == status)
+            query = query.order_by(Candidate.total_score.desc(), Candidate.id).yield_per(settings.EXPORT_BATCH_SIZE)
+            for rank, row in enumerate(query, start=1):
+                values = []
+                for name in columns:
+                    if name == "rank":
+                        values.append(rank)
+                    else:
+                        column, convert = EXPORT_COLUMNS[name]
+                        values.append(convert(row[positions[column.key]]))
+                yield values
+        finally:
+            db.close()
+
+    def stream(
+        self,
+        job_id: int,
+        columns: List[str],
+        export_format: str = "csv",
+        status: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> Iterator[bytes]:
+        batch_size = settings.EXPORT_BATCH_SIZE
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == "csv" else None
+        if writer is not None:
+            writer.writerow(columns)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+        pending = 0
+        for values in self._rows(job_id, columns, status, min_score):
+            if writer is not None:
+                writer.writerow([self._csv_value(value) for value in values])
+            else:
+                buffer.write(json.dumps(dict(zip(columns, values)), default=str))
+                buffer.write("\n")
+            pending += 1
+            if pending >= batch_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        if pending:
+            yield buffer.getvalue().encode("utf-8")
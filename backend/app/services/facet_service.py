@@ -0,0 +1,335 @@
+import heapq
+import re
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.skill_facet import JobSkillFacet
+from app.services.feature_service import FeatureService
+
+_ORDINAL_SLICE = 500  # Ordinals bound per IN (...) query, well under SQLite's parameter limit
+
+
+class SkillFilter:
+    """Boolean skill expression such as `python AND kubernetes NOT php`.
+
+    Grammar (AND binds tighter than OR, adjacent terms are ANDed):
+        expr   := term (OR term)*
+        term   := factor ((AND)? factor)*
+        factor := NOT factor | '(' expr ')' | skill
+    Multi-word skills can be quoted: `"react native" OR flutter`.
+    """
+
+    TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|"([^"]+)"|([^\s()"]+))')
+
+    def __init__(self, expression: str):
+        self.tokens = self._tokenize(expression)
+        self.position = 0
+        self.tree = self._parse_expr()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token: {self.tokens[self.position][1]}")
+
+    def _tokenize(self, expression: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        expression = expression.strip()
+        while position < len(expression):
+            match = self.TOKEN_PATTERN.match(expression, position)
+            if not match:
+                raise ValueError(f"Invalid skill filter near: {expression[position:]}")
+            position = match.end()
+            if match.group(1):
+                tokens.append(("(", "("))
+            elif match.group(2):
+                tokens.append((")", ")"))
+            elif match.group(3):
+                tokens.append(("skill", match.group(3).strip().lower()))
+            else:
+                word = match.group(4)
+                if word.upper() in ("AND", "OR", "NOT"):
+                    tokens.append((word.upper(), word))
+                else:
+                    tokens.append(("skill", word.lower()))
+        return tokens
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _parse_expr(self):
+        node = self._parse_term()
+        while self._peek() == "OR":
+            self.position += 1
+            node = ("or", node, self._parse_term())
+        return node
+
+    def _parse_term(self):
+        node = self._parse_factor()
+        while self._peek() in ("AND", "NOT", "(", "skill"):
+            if self._peek() == "AND":
+                self.position += 1
+            node = ("and", node, self._parse_factor())
+        return node
+
+    def _parse_factor(self):
+        kind = self._peek()
+        if kind is None:
+            raise ValueError("Incomplete skill filter")
+        token = self.tokens[self.position]
+        self.position += 1
+        if kind == "NOT":
+            return ("not", self._parse_factor())
+        if kind == "(":
+            node = self._parse_expr()
+            if self._peek() != ")":
+                raise ValueError("Missing closing parenthesis")
+            self.position += 1
+            return node
+        if kind == "skill":
+            return ("skill", token[1])
+        raise ValueError(f"Unexpected token: {token[1]}")
+
+    def skills(self) -> List[str]:
+        return [value for kind, value in self.tokens if kind == "skill"]
+
+    def evaluate(self, bitmaps: Dict[str, int], universe: int) -> int:
+        """Evaluate the expression over per-skill candidate bitmaps"""
+        def walk(node) -> int:
+            op = node[0]
+            if op == "skill":
+                return bitmaps.get(node[1], 0)
+            if op == "not":
+                return universe & ~walk(node[1])
+            if op == "and":
+                return walk(node[1]) & walk(node[2])
+            return walk(node[1]) | walk(node[2])
+
+        return walk(self.tree) & universe
+
+
+class SkillFacetService:
+    """Per-job bitmap index of candidate skills, maintained on upload"""
+
+    def __init__(self, feature_service: Optional[FeatureService] = None):
+        self.feature_service = feature_service or FeatureService()
+
+    @staticmethod
+    def _to_int(bitmap: Optional[bytes]) -> int:
+        return int.from_bytes(bitmap or b"", "little")
+
+    @staticmethod
+    def _to_bytes(bits: int) -> bytes:
+        return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+    @staticmethod
+    def _ordinals(bits: int) -> List[int]:
+        ordinals = []
+        while bits:
+            low = bits & -bits
+            ordinals.append(low.bit_length() - 1)
+            bits ^= low
+        return ordinals
+
+    def add_candidate(self, db: Session, candidate: Candidate) -> None:
+        """Assign the candidate an ordinal and set its bit in each skill bitmap.
+
+        Changes are flushed but not committed; the caller owns the transaction.
+        """
+        # Lock the job row so concurrent uploads get distinct ordinals
+        db.query(Job).filter(Job.id == candidate.job_id).with_for_update().first()
+        if candidate.job_ordinal is None:
+            max_ordinal = (
+                db.query(func.max(Candidate.job_ordinal))
+                .filter(Candidate.job_id == candidate.job_id)
+                .scalar()
+            )
+            candidate.job_ordinal = 0 if max_ordinal is None else max_ordinal + 1
+
+        skill_bits = self.feature_service.decode_bits(
+            self.feature_service.candidate_features(candidate)["skill_bits"]
+        )
+        self._set_bits(db, candidate, self._ordinals(skill_bits), True)
+
+    def update_candidate(self, db: Session, candidate: Candidate, previous_bits: int) -> None:
+        """Move an indexed candidate's bits after its skills changed (flushed, not committed)"""
+        if candidate.job_ordinal is None:
+            self.add_candidate(db, candidate)
+            return
+        skill_bits = self.feature_service.decode_bits(candidate.skill_bits)
+        self._set_bits(db, candidate, self._ordinals(previous_bits & ~skill_bits), False)
+        self._set_bits(db, candidate, self._ordinals(skill_bits & ~previous_bits), True)
+
+    def remove_candidate(self, db: Session, candidate: Candidate) -> None:
+        """Clear a deleted candidate's bits; its ordinal is not reused (flushed, not committed)"""
+        if candidate.job_ordinal is None:
+            return
+        skill_bits = self.feature_service.decode_bits(candidate.skill_bits)
+        self._set_bits(db, candidate, self._ordinals(skill_bits), False)
+
+    def _set_bits(self, db: Session, candidate: Candidate, skill_ids: List[int], value: bool) -> None:
+        if not skill_ids:
+            db.flush()
+            return
+
+        facets = {
+            facet.skill_id: facet
+            for facet in db.query(JobSkillFacet)
+            .filter(JobSkillFacet.job_id == candidate.job_id, JobSkillFacet.skill_id.in_(skill_ids))
+            .with_for_update()
+            .all()
+        }
+        candidate_bit = 1 << candidate.job_ordinal
+        for skill_id in skill_ids:
+            facet = facets.get(skill_id)
+            if facet is None:
+                if not value:
+                    continue
+                facet = JobSkillFacet(job_id=candidate.job_id, skill_id=skill_id, bitmap=b"")
+                db.add(facet)
+            bitmap = self._to_int(facet.bitmap)
+            facet.bitmap = self._to_bytes(bitmap | candidate_bit if value else bitmap & ~candidate_bit)
+        db.flush()
+
+    def index_pending(self, db: Session, job_id: int) -> int:
+        """Index candidates uploaded before facets existed (flushed, not committed).
+
+        Run from the skills refresh, not from reads: until then such
+        candidates are missing from skill-filtered results.
+        """
+        pending = (
+            db.query(Candidate)
+            .filter(Candidate.job_id == job_id, Candidate.job_ordinal.is_(None))
+            .order_by(Candidate.id)
+            .all()
+        )
+        for candidate in pending:
+            self.add_candidate(db, candidate)
+        return len(pending)
+
+    def delete_job(self, db: Session, job_id: int) -> None:
+        """Drop a job's bitmaps before the job itself is deleted (not committed)"""
+        db.query(JobSkillFacet).filter(JobSkillFacet.job_id == job_id).delete(synchronize_session=False)
+
+    def _load_bitmaps(self, db: Session, job_id: int) -> Tuple[Dict[str, int], int]:
+        bitmaps = {}
+        for facet in db.query(JobSkillFacet).filter(JobSkillFacet.job_id == job_id).all():
+            if facet.skill_id < len(self.feature_service.vocabulary):
+                bitmaps[self.feature_service.vocabulary.names[facet.skill_id]] = self._to_int(facet.bitmap)
+
+        # Ordinals of deleted candidates are not reused, so the universe is built from live rows
+        universe = 0
+        rows = (
+            db.query(Candidate.job_ordinal)
+            .filter(Candidate.job_id == job_id, Candidate.job_ordinal.isnot(None))
+            .all()
+        )
+        for (ordinal,) in rows:
+            universe |= 1 << ordinal
+        return bitmaps, universe
+
+    def _parse_filter(self, expression: str) -> SkillFilter:
+        try:
+            skill_filter = SkillFilter(expression)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        unknown = [s for s in skill_filter.skills() if self.feature_service.vocabulary.skill_id(s) is None]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown skills: {', '.join(unknown)}")
+        return skill_filter
+
+    def _score_bitmap(self, db: Session, job_id: int, min_score: float) -> int:
+        bits = 0
+        rows = (
+            db.query(Candidate.job_ordinal)
+            .filter(
+                Candidate.job_id == job_id,
+                Candidate.job_ordinal.isnot(None),
+                Candidate.total_score >= min_score
+            )
+            .all()
+        )
+        for (ordinal,) in rows:
+            bits |= 1 << ordinal
+        return bits
+
+    def match(
+        self,
+        db: Session,
+        job_id: int,
+        expression: Optional[str],
+        min_score: float = 0.0
+    ) -> Tuple[int, Dict[str, int]]:
+        """Bitmap of candidate ordinals matching the filter, plus the skill bitmaps"""
+        bitmaps, universe = self._load_bitmaps(db, job_id)
+
+        result = universe
+        if expression:
+            skill_filter = self._parse_filter(expression)
+            # Filters may name synonyms ("k8s"); bitmaps are keyed by canonical name
+            vocabulary = self.feature_service.vocabulary
+            terms = {skill: bitmaps.get(vocabulary.canonical(skill), 0) for skill in skill_filter.skills()}
+            result = skill_filter.evaluate(terms, universe)
+        if min_score > 0:
+            result &= self._score_bitmap(db, job_id, min_score)
+        return result, bitmaps
+
+    def ordinal_slices(self, bits: int) -> Iterator[List[int]]:
+        """Ordinals of a bitmap in ascending slices of at most _ORDINAL_SLICE"""
+        ordinals = self._ordinals(bits)
+        for start in range(0, len(ordinals), _ORDINAL_SLICE):
+            yield ordinals[start:start + _ORDINAL_SLICE]
+
+    def ranked_matches(
+        self,
+        db: Session,
+        job_id: int,
+        expression: str,
+        skip: int = 0,
+        limit: int = 100,
+        min_score: float = 0.0,
+        status: Optional[str] = None
+    ) -> List[int]:
+        """IDs of one page of the matching candidates, best score first.
+
+        Matches are looked up in bounded slices of ordinals and only the
+        best skip + limit are kept while merging, so neither the bind
+        parameters of a query nor the memory grow with the result set.
+        """
+        result, _ = self.match(db, job_id, expression)
+
+        def rows():
+            for ordinals in self.ordinal_slices(result):
+                query = db.query(Candidate.id, Candidate.total_score).filter(
+                    Candidate.job_id == job_id,
+                    Candidate.job_ordinal.in_(ordinals),
+                    Candidate.total_score >= min_score
+                )
+                if status:
+                    query = query.filter(Candidate.status == status)
+                yield from query.all()
+
+        # Same order as the leaderboard: higher score first, then lower ID
+        best = heapq.nsmallest(skip + limit, rows(), key=lambda row: (-(row.total_score or 0.0), row.id))
+        return [row.id for row in best[skip:]]
+
+    def facet_counts(
+        self,
+        db: Session,
+        job_id: int,
+        expression: Optional[str] = None,
+        min_score: float = 0.0
+    ) -> Dict[str, Any]:
+        """Number of candidates per skill within the filtered result set"""
+        result, bitmaps = self.match(db, job_id, expression, min_score)
+        counts = {skill: (bitmap & result).bit_count() for skill, bitmap in bitmaps.items()}
+        return {
+            "total": result.bit_count(),
+            "facets": dict(sorted(
+                ((skill, count) for skill, count in counts.items() if count),
+                key=lambda item: (-item[1], item[0])
+            ))
+        }
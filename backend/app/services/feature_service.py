@@ -0,0 +1,119 @@
+from typing import Dict, Any, List, Iterable, Optional
+
+import numpy as np
+
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.services.skill_taxonomy import SkillVocabulary, taxonomy_store
+
+
+# Education hierarchy used for both resumes and job requirements
+EDUCATION_LEVELS: Dict[str, int] = {
+    "high school": 1,
+    "associate": 2,
+    "bachelor": 3,
+    "master": 4,
+    "phd": 5,
+    "doctorate": 5
+}
+
+
+class FeatureService:
+    """Normalized, arithmetic-friendly features for candidates and jobs"""
+
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None):
+        self._vocabulary = vocabulary
+
+    @property
+    def vocabulary(self) -> SkillVocabulary:
+        """The given vocabulary, else that of the current skills taxonomy.
+
+        Taxonomy updates only append skills, so bitsets built with an older
+        vocabulary stay valid under a newer one.
+        """
+        if self._vocabulary is not None:
+            return self._vocabulary
+        return taxonomy_store.current().vocabulary
+
+    @staticmethod
+    def encode_bits(bits: int) -> str:
+        """Compact hex form used for persistence"""
+        return format(bits, "x")
+
+    @staticmethod
+    def decode_bits(value: Optional[str]) -> int:
+        return int(value, 16) if value else 0
+
+    @staticmethod
+    def education_level(entries: Iterable[str]) -> int:
+        """Highest education level mentioned in the given strings"""
+        level = 0
+        for entry in entries:
+            entry_lower = (entry or "").lower()
+            for level_name, level_value in EDUCATION_LEVELS.items():
+                if level_value > level and level_name in entry_lower:
+                    level = level_value
+        return level
+
+    def resume_features(self, structured_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Features emitted by the resume parser"""
+        skill_bits = self.vocabulary.to_bitset(structured_data.get("skills", []))
+        return {
+            "skill_bits": self.encode_bits(skill_bits),
+            "education_level": self.education_level(structured_data.get("education", [])),
+            "experience_years": int(structured_data.get("experience_years") or 0)
+        }
+
+    def requirement_features(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Features derived from the LLM-extracted job requirements"""
+        requirements = requirements or {}
+        vocabulary = self.vocabulary
+
+        def normalized(skills: Iterable[str]) -> set:
+            # Synonyms collapse onto their canonical skill ("postgres", "PostgreSQL")
+            return {vocabulary.canonical(skill) or skill.lower() for skill in skills}
+
+        required = normalized(requirements.get("skills_required") or [])
+        preferred = normalized(requirements.get("skills_preferred") or [])
+
+        # Required skills outside the vocabulary can never be matched, but they
+        # still count towards the denominator of the overlap ratio
+        return {
+            "required_bits": self.encode_bits(vocabulary.to_bitset(required)),
+            "preferred_bits": self.encode_bits(vocabulary.to_bitset(preferred)),
+            "required_count": len(required),
+            "preferred_count": len(preferred),
+            "min_experience_years": int(requirements.get("min_experience_years") or 0),
+            "education_level": self.education_level([requirements.get("education_level") or ""])
+        }
+
+    def apply_resume_features(self, candidate: Candidate) -> None:
+        structured_data = candidate.structured_data or {}
+        features = structured_data.get("features") or self.resume_features(structured_data)
+        candidate.skill_bits = features["skill_bits"]
+        candidate.education_level = features["education_level"]
+        candidate.experience_years = features["experience_years"]
+        candidate.taxonomy_version = structured_data.get("taxonomy_version")
+
+    def apply_requirement_features(self, job: Job) -> None:
+        job.requirement_features = self.requirement_features(job.requirements or {})
+
+    def candidate_features(self, candidate: Candidate) -> Dict[str, Any]:
+        """Persisted candidate features, computed on the fly for legacy rows"""
+        if candidate.skill_bits is None:
+            return self.resume_features(candidate.structured_data or {})
+        return {
+            "skill_bits": candidate.skill_bits,
+            "education_level": candidate.education_level or 0,
+            "experience_years": candidate.experience_years or 0
+        }
+
+    def job_features(self, job: Job) -> Dict[str, Any]:
+        """Persisted job features, computed on the fly for legacy rows"""
+        return job.requirement_features or self.requirement_features(job.requirements or {})
+
+    def pack_bitsets(self, bitsets: List[int]) -> np.ndarray:
+        """Pack integer bitsets into an (n, bytes) uint8 matrix"""
+        width = max(1, (len(self.vocabulary) + 7) // 8)
+        buffer = b"".join(bits.to_bytes(width, "little") for bits in bitsets)
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(len(bitsets), width)
@@ -0,0 +1,201 @@
+import re
+from datetime import date
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.services.text_chunking import SECTION_HEADERS, phrase_alternatives
+
+_ROLES = [
+    "software engineer", "developer", "programmer", "analyst", "manager", "director", "lead", "senior",
+    "junior", "intern", "data scientist", "product manager", "project manager", "tech lead", "architect",
+    "consultant", "designer", "researcher", "specialist", "coordinator", "administrator", "executive"
+]
+_EDUCATION_KEYWORDS = ["bachelor", "master", "phd", "doctorate", "mba", "bsc", "msc", "university", "college", "degree"]
+_MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+_MONTH = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_YEAR = r"(?:19|20)\d{2}(?!\d)"
+
+
+def _date(prefix: str) -> str:
+    """Optional month ("Mar 2018", "March, 2018", "03/2018") followed by a year"""
+    return (
+        rf"(?:(?P<{prefix}_month>{_MONTH})\.?,?\s+|(?P<{prefix}_month_number>0?[1-9]|1[0-2])[/.])?"
+        rf"(?P<{prefix}_year>{_YEAR})"
+    )
+
+
+# Characters a field (other than a header) can start with; checked before
+# the alternatives are tried at each word start
+_FIELD_START = "".join(sorted(
+    {word[0] for word in _ROLES + _EDUCATION_KEYWORDS + _MONTHS + ["experience", "certified", "cert."]}
+))
+
+# Every field is an alternative of one pattern, so a resume is scanned once.
+# Each alternative is wrapped in a named group that closes last, which makes
+# `match.lastgroup` name the field. Section headers match with zero width
+# at line starts, so a line such as "experience: 5 years" is still scanned
+# for the fields it contains. The pattern runs on lowercased text.
+_FIELD_PATTERN = re.compile(
+    r"^(?=(?P<header>[^\w\n]*(?:"
+    + "|".join(f"(?P<h_{section}>{phrase_alternatives(phrases)})" for section, phrases in SECTION_HEADERS.items())
+    + r")(?:[^\S\n]*[:|]|[^\w\n]*$)))"
+    rf"|\b(?=[\d{_FIELD_START}])(?:"
+    r"(?P<stated>(?P<years>\d{1,2})\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp))"
+    r"|(?P<stated_after>experience\s*:?\s*(?P<years_after>\d{1,2})\+?\s*(?:years?|yrs?))"
+    rf"|(?P<range>{_date('start')}\s*(?:-|to|until)\s*(?:{_date('end')}|(?P<present>present|current|now|today|date)\b))"
+    r"|(?P<certification>(?:certified[^\S\n]+|certifications?[^\S\n]*:?\s*|cert\.\s*)(?=(?P<cert>[^\n]+)))"
+    rf"|(?P<role>{phrase_alternatives(_ROLES)})\b"
+    rf"|(?P<education>{'|'.join(_EDUCATION_KEYWORDS)})"
+    r")",
+    re.MULTILINE
+)
+_NORMALIZE = [
+    ("\u2010", "-"), ("\u2011", "-"), ("\u2012", "-"), ("\u2013", "-"), ("\u2014", "-"), ("\u2212", "-"),
+    ("\u00a0", " "), ("\r", "")
+]
+_NOT_EMPLOYMENT = ("education", "other")  # Date ranges here are studies, projects, certificates...
+_NOT_EDUCATION = ("experience", "skills")  # "Scrum Master", "Research assistant at X University"
+_SUMMARY_MAX_CHARS = 300
+
+
+class ExtractedFields(NamedTuple):
+    experience_years: int
+    education: List[str]
+    certifications: List[str]
+    previous_roles: List[str]
+    summary: str
+
+
+class ResumeFieldExtractor:
+    """Structured resume fields from one scan of precompiled patterns.
+
+    Experience is the larger of what the resume states ("5+ years of
+    experience") and the total length of the employment date ranges
+    ("Mar 2018 - Present", "2015 - 2018"); overlapping ranges count once
+    and ranges under education or project headers are ignored.
+    """
+
+    def __init__(self, today: Optional[date] = None):
+        self.today = today  # Fixed "present" for reproducible results; defaults to the current date
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Unicode dashes to "-", no-break spaces to spaces, no carriage returns"""
+        # A few C-speed replaces beat str.translate's per-character lookups
+        for old, new in _NORMALIZE:
+            if old in text:
+                text = text.replace(old, new)
+        return text
+
+    @staticmethod
+    def _month_index(match: re.Match, prefix: str) -> Optional[int]:
+        month = match.group(f"{prefix}_month")
+        if month:
+            return _MONTHS.index(month[:3])
+        number = match.group(f"{prefix}_month_number")
+        return int(number) - 1 if number else None
+
+    def _date_range(self, match: re.Match, today: date) -> Optional[Tuple[int, int]]:
+        """Months since year 0 as a half-open interval, or None if implausible"""
+        start_year = int(match.group("start_year"))
+        start = start_year * 12 + (self._month_index(match, "start") or 0)
+        now = today.year * 12 + today.month
+        if match.group("present"):
+            end = now
+        else:
+            end_month = self._month_index(match, "end")
+            # "Mar 2018 - May 2020" includes May; "2018 - 2023" is five years
+            end = int(match.group("end_year")) * 12 + (end_month + 1 if end_month is not None else 0)
+        end = min(end, now)
+        if start_year < 1950 or end <= start:
+            return None
+        return start, end
+
+    @staticmethod
+    def _covered_months(ranges: List[Tuple[int, int]]) -> int:
+        total = 0
+        current_start = current_end = None
+        for start, end in sorted(ranges):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    @staticmethod
+    def _line_at(text: str, position: int) -> Tuple[int, str]:
+        start = text.rfind("\n", 0, position) + 1
+        end = text.find("\n", position)
+        return start, text[start:end if end != -1 else len(text)].strip()
+
+    def extract(self, text: str) -> ExtractedFields:
+        text = self.normalize(text)
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            text = lowered  # Rare case-folding that changes length; spans must line up
+        today = self.today or date.today()
+
+        section = None  # No header seen yet
+        stated_years = 0
+        ranges: List[Tuple[int, int]] = []
+        education: List[str] = []
+        education_lines = set()
+        certifications: List[str] = []
+        certification_end = 0
+        roles: List[str] = []
+        seen_roles = set()
+        summary_span = None
+
+        for match in _FIELD_PATTERN.finditer(lowered):
+            field = match.lastgroup
+            if field == "header":
+                section = next(name for name in SECTION_HEADERS if match.group(f"h_{name}"))
+                if summary_span and summary_span[1] is None:
+                    summary_span[1] = match.start()
+                if section == "summary" and summary_span is None:
+                    summary_span = [match.end("h_summary"), None]
+            elif field == "role":
+                role = match.group("role")
+                if role not in seen_roles:
+                    seen_roles.add(role)
+                    roles.append(text[match.start("role"):match.end("role")])
+            elif field == "range":
+                if section not in _NOT_EMPLOYMENT:
+                    date_range = self._date_range(match, today)
+                    if date_range:
+                        ranges.append(date_range)
+            elif field == "education" and section not in _NOT_EDUCATION:
+                line_start, line = self._line_at(text, match.start())
+                if line_start not in education_lines and len(line) > 10:
+                    education_lines.add(line_start)
+                    education.append(line)
+            elif field == "stated":
+                stated_years = max(stated_years, int(match.group("years")))
+            elif field == "stated_after":
+                stated_years = max(stated_years, int(match.group("years_after")))
+            elif field == "certification":
+                # "Certifications" followed by "AWS Certified ..." is one entry
+                if match.start() < certification_end:
+                    continue
+                certification_end = match.end("cert")
+                certification = text[match.start("cert"):match.end("cert")].strip()
+                if certification:
+                    certifications.append(certification)
+
+        summary = ""
+        if summary_span:
+            body = text[summary_span[0]:summary_span[1]]
+            summary = " ".join(line.strip(" \t:|") for line in body.split("\n") if line.strip(" \t:|"))
+            if len(summary) > _SUMMARY_MAX_CHARS:
+                summary = summary[:_SUMMARY_MAX_CHARS] + "..."
+
+        return ExtractedFields(
+            experience_years=max(stated_years, self._covered_months(ranges) // 12),
+            education=education[:3],
+            certifications=certifications[:5],
+            previous_roles=roles[:5],
+            summary=summary
+        )
@@ -0,0 +1,526 @@
+import asyncio
+import csv
+import io
+import multiprocessing
+import os
+import re
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from fastapi import BackgroundTasks, HTTPException, UploadFile
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.metrics import MeteredQueue, stage
+from app.models.candidate import Candidate, CandidateChunk
+from app.models.job import Job
+from app.services.candidate_service import CandidateService
+from app.services.resume_parser_service import ResumeParserService
+from app.utils.uploads import StoredUpload, store_stream, stream_upload
+
+_EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_MANIFEST_MAX_SIZE = 1024 * 1024
+_DONE = object()  # Queue sentinel: no more items for this worker
+
+_worker_parser: Optional[ResumeParserService] = None
+
+
+def _parse_in_worker(file_path: str, file_extension: str) -> Tuple[str, Dict[str, Any]]:
+    """Text extraction entry point for parse worker processes"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParserService()
+    # The parser's coroutines never wait on I/O, so each call runs to completion on a private loop
+    return asyncio.run(_worker_parser.parse_resume(file_path, file_extension))
+
+
+def parse_manifest(text: str) -> Dict[str, Dict[str, str]]:
+    """CSV manifest rows keyed by filename (columns: filename, name, email, phone)"""
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or "filename" not in [f.strip().lower() for f in reader.fieldnames if f]:
+        raise HTTPException(status_code=400, detail="Manifest must have a 'filename' column")
+
+    rows = {}
+    for row in reader:
+        row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+        if row.get("filename"):
+            rows[row["filename"]] = row
+    return rows
+
+
+class ResumeSource:
+    """Resume files in a ZIP archive or a directory, opened one at a time.
+
+    Archive members are decompressed as they are read; nothing is extracted
+    up front.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.isdir(path):
+            self.archive = None
+        elif zipfile.is_zipfile(path):
+            self.archive = zipfile.ZipFile(path)
+        else:
+            raise ValueError(f"Not a ZIP archive or directory: {path}")
+
+    @staticmethod
+    def _hidden(name: str) -> bool:
+        return any(part.startswith((".", "__MACOSX")) for part in name.split("/"))
+
+    def entries(self) -> List[str]:
+        if self.archive is not None:
+            names = [info.filename for info in self.archive.infolist() if not info.is_dir()]
+        else:
+            names = [
+                os.path.relpath(os.path.join(directory, name), self.path).replace(os.sep, "/")
+                for directory, _, files in sorted(os.walk(self.path))
+                for name in sorted(files)
+            ]
+        return [name for name in names if not self._hidden(name)]
+
+    def open(self, name: str) -> BinaryIO:
+        if self.archive is not None:
+            return self.archive.open(name)
+        return open(os.path.join(self.path, name), "rb")
+
+    def close(self) -> None:
+        if self.archive is not None:
+            self.archive.close()
+
+
+class IngestionBatch:
+    """Progress of one bulk import"""
+
+    def __init__(self, job_id: int, user_id: int, source: str):
+        self.batch_id = uuid.uuid4().hex
+        self.job_id = job_id
+        self.user_id = user_id
+        self.source = source
+        self.status = "queued"
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.candidate_ids: List[int] = []
+        self.errors: List[Dict[str, str]] = []
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self._started: Optional[float] = None
+        self._elapsed = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self._started is not None and self.finished_at is None:
+            return time.monotonic() - self._started
+        return self._elapsed
+
+    def start(self) -> None:
+        self.status = "running"
+        self._started = time.monotonic()
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        self._elapsed = self.elapsed_seconds
+        self.status = status
+        self.error = error
+        self.finished_at = datetime.now(timezone.utc)
+
+    def record_success(self, candidate_id: int) -> None:
+        self.succeeded += 1
+        self.candidate_ids.append(candidate_id)
+
+    def record_failure(self, filename: str, error: str) -> None:
+        self.failed += 1
+        self.errors.append({"filename": filename, "error": error})
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed_seconds
+        return {
+            "batch_id": self.batch_id,
+            "job_id": self.job_id,
+            "source": self.source,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "candidate_ids": self.candidate_ids,
+            "errors": self.errors,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "elapsed_seconds": round(elapsed, 2),
+            "resumes_per_minute": round(self.succeeded / elapsed * 60, 1) if elapsed else 0.0
+        }
+
+
+class _IngestionItem:
+    def __init__(self, filename: str, manifest_row: Dict[str, str]):
+        self.filename = filename
+        self.manifest_row = manifest_row
+        self.extension = os.path.splitext(filename)[1].lower()
+        self.stored: Optional[StoredUpload] = None
+        self.resume_text = ""
+        self.structured_data: Dict[str, Any] = {}
+        self.candidate: Optional[Candidate] = None
+        self.chunk_records: List[CandidateChunk] = []
+
+
+class IngestionService:
+    """Bulk resume import from a ZIP archive or directory.
+
+    Files flow through four stages joined by bounded queues: read (archive
+    member to temp file), parse (text extraction in worker processes),
+    enrich (near-duplicate check, chunking, embeddings, scoring and the LLM
+    explanation, with at most BULK_EMBED_CONCURRENCY remote calls in
+    flight) and write. Near-duplicates of committed candidates reuse the
+    original's chunks and embeddings instead of calling out again. A single
+    writer owns the database session and commits every BULK_COMMIT_EVERY
+    candidates, or sooner when it has caught up with the enrich stage, as
+    its transaction holds the job's row locks. Batch progress is kept in
+    memory in this process.
+    """
+
+    MAX_TRACKED_BATCHES = 100
+
+    def __init__(self, candidate_service: Optional[CandidateService] = None):
+        self.candidate_service = candidate_service or CandidateService()
+        self.batches: "OrderedDict[str, IngestionBatch]" = OrderedDict()
+
+    def _track(self, batch: IngestionBatch) -> None:
+        self.batches[batch.batch_id] = batch
+        while len(self.batches) > self.MAX_TRACKED_BATCHES:
+            self.batches.popitem(last=False)
+
+    def get_batch(self, batch_id: str, user_id: int) -> Dict[str, Any]:
+        batch = self.batches.get(batch_id)
+        if batch is None or batch.user_id != user_id:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        return batch.to_dict()
+
+    async def start_archive_ingestion(
+        self,
+        db: Session,
+        job_id: int,
+        archive: UploadFile,
+        manifest: Optional[UploadFile],
+        user_id: int,
+        background_tasks: BackgroundTasks
+    ) -> Dict[str, Any]:
+        """Store the uploaded archive and import it after the response is sent"""
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        if not archive.filename.lower().endswith(".zip"):
+            raise HTTPException(status_code=400, detail="Bulk upload must be a ZIP archive")
+
+        manifest_rows: Dict[str, Dict[str, str]] = {}
+        if manifest is not None:
+            data = await manifest.read(_MANIFEST_MAX_SIZE + 1)
+            if len(data) > _MANIFEST_MAX_SIZE:
+                raise HTTPException(status_code=413, detail="Manifest too large")
+            manifest_rows = parse_manifest(data.decode("utf-8-sig", errors="replace"))
+
+        stored = await stream_upload(
+            archive, settings.UPLOAD_DIR, settings.BULK_MAX_ARCHIVE_SIZE, settings.UPLOAD_BLOCK_SIZE
+        )
+        if not zipfile.is_zipfile(stored.path):
+            os.remove(stored.path)
+            raise HTTPException(status_code=400, detail="Bulk upload must be a ZIP archive")
+
+        batch = IngestionBatch(job_id, user_id, archive.filename)
+        self._track(batch)
+        background_tasks.add_task(self._ingest_in_background, batch, stored.path, manifest_rows)
+        return batch.to_dict()
+
+    async def _ingest_in_background(
+        self,
+        batch: IngestionBatch,
+        archive_path: str,
+        manifest_rows: Dict[str, Dict[str, str]]
+    ) -> None:
+        # The request's session is closed by now
+        db = SessionLocal()
+        try:
+            await self.ingest(db, batch, archive_path, manifest_rows)
+        finally:
+            db.close()
+            if os.path.exists(archive_path):
+                os.remove(archive_path)
+
+    async def ingest(
+        self,
+        db: Session,
+        batch: IngestionBatch,
+        path: str,
+        manifest_rows: Optional[Dict[str, Dict[str, str]]] = None,
+        on_progress: Optional[Callable[[IngestionBatch], None]] = None
+    ) -> IngestionBatch:
+        """Import every resume in `path` (ZIP archive or directory) into the batch's job"""
+        self._track(batch)
+        batch.start()
+        source = None
+        try:
+            job = db.query(Job).filter(Job.id == batch.job_id).first()
+            if job is None:
+                raise ValueError("Job not found")
+            scoring_service = self.candidate_service.scoring_service
+            job_embedding, backend = await scoring_service.embed_job(job)
+            if not scoring_service.comparable(backend):
+                job_embedding = None  # Degraded; each candidate's scoring retries the primary backend
+            # The enrich stage reads the job concurrently with the writer's transaction
+            db.expunge(job)
+
+            source = ResumeSource(path)
+            names = source.entries()
+            if len(names) > settings.BULK_MAX_FILES:
+                raise ValueError(f"Batch has {len(names)} files; the limit is {settings.BULK_MAX_FILES}")
+            batch.total = len(names)
+
+            await self._run_pipeline(db, batch, job, job_embedding, source, names, manifest_rows or {}, on_progress)
+            batch.finish("completed")
+        except Exception as e:
+            print(f"Bulk ingestion {batch.batch_id} failed: {e}")
+            db.rollback()
+            batch.finish("failed", str(e))
+        finally:
+            if source is not None:
+                source.close()
+        if on_progress:
+            on_progress(batch)
+        return batch
+
+    async def _run_pipeline(
+        self,
+        db: Session,
+        batch: IngestionBatch,
+        job: Job,
+        job_embedding: Optional[List[float]],
+        source: ResumeSource,
+        names: List[str],
+        manifest_rows: Dict[str, Dict[str, str]],
+        on_progress: Optional[Callable[[IngestionBatch], None]]
+    ) -> None:
+        parse_queue = MeteredQueue("bulk_parse", maxsize=settings.BULK_QUEUE_SIZE)
+        enrich_queue = MeteredQueue("bulk_enrich", maxsize=settings.BULK_QUEUE_SIZE)
+        write_queue = MeteredQueue("bulk_write", maxsize=settings.BULK_QUEUE_SIZE)
+        remote_slots = asyncio.Semaphore(settings.BULK_EMBED_CONCURRENCY)
+        parsing: Dict[str, asyncio.Future] = {}
+        pending: List[_IngestionItem] = []
+
+        def fail(item: _IngestionItem, error: Exception) -> None:
+            if item.stored is not None and os.path.exists(item.stored.path):
+                os.remove(item.stored.path)
+            message = error.detail if isinstance(error, HTTPException) else str(error)
+            batch.record_failure(item.filename, message)
+            if on_progress:
+                on_progress(batch)
+
+        async def read() -> None:
+            for name in names:
+                item = _IngestionItem(name, manifest_rows.get(name) or manifest_rows.get(os.path.basename(name)) or {})
+                try:
+                    if item.extension not in settings.ALLOWED_EXTENSIONS:
+                        raise ValueError("Unsupported file type")
+                    with stage("bulk", "read"):
+                        item.stored = await run_in_threadpool(self._copy_entry, source, name)
+                except Exception as e:
+                    fail(item, e)
+                    continue
+                await parse_queue.put(item)
+
+        async def parse(item: _IngestionItem) -> None:
+            # Identical files in the batch or already in the database are parsed once
+            sha256 = item.stored.sha256
+            if sha256 not in parsing:
+                parsing[sha256] = asyncio.ensure_future(self._parse(lookup_db, executor, item))
+            with stage("bulk", "parse"):
+                resume_text, structured_data = await parsing[sha256]
+            item.resume_text, item.structured_data = resume_text, dict(structured_data)
+
+        async def enrich(item: _IngestionItem) -> None:
+            with stage("bulk", "enrich"):
+                await self._enrich(lookup_db, item, job, job_embedding, remote_slots, batch.user_id)
+
+        async def write(item: _IngestionItem) -> None:
+            with stage("bulk", "write"), db.begin_nested():
+                item.candidate.resume_sha256 = self.candidate_service.blob_store.put(db, item.stored)
+                self.candidate_service.register_candidate(db, item.candidate, batch.user_id)
+                for chunk in item.chunk_records:
+                    chunk.candidate_id = item.candidate.id
+                db.add_all(item.chunk_records)
+            pending.append(item)
+            # register_candidate locked the job and job_stats rows; never keep them while
+            # waiting on the enrich stage's remote calls
+            if len(pending) >= settings.BULK_COMMIT_EVERY or write_queue.empty():
+                self._commit(db, batch, pending, on_progress)
+
+        parse_workers = max(1, settings.BULK_PARSE_WORKERS)
+        enrich_workers = max(1, settings.BULK_EMBED_CONCURRENCY)
+        lookup_db = SessionLocal()  # Parse-by-hash and duplicate lookups stay out of the writer's transaction
+        executor = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context("spawn")  # Forking a threaded server is unsafe
+        )
+        try:
+            await asyncio.gather(
+                self._stage(read, parse_queue, parse_workers),
+                self._stage_workers(parse, parse_queue, enrich_queue, parse_workers, enrich_workers, fail),
+                self._stage_workers(enrich, enrich_queue, write_queue, enrich_workers, 1, fail),
+                self._stage_workers(write, write_queue, None, 1, 0, fail)
+            )
+            self._commit(db, batch, pending, on_progress)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            lookup_db.close()
+            for queue in (parse_queue, enrich_queue, write_queue):
+                queue.discard()  # Items left behind by a failed run
+
+    @staticmethod
+    async def _stage(producer, outbox: asyncio.Queue, consumers: int) -> None:
+        """Run a producer, then tell each downstream worker it is done"""
+        try:
+            await producer()
+        finally:
+            for _ in range(consumers):
+                await outbox.put(_DONE)
+
+    @staticmethod
+    async def _stage_workers(
+        handle,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        workers: int,
+        consumers: int,
+        fail: Callable[[_IngestionItem, Exception], None]
+    ) -> None:
+        """Run `workers` copies of `handle` over `inbox`, passing successes to `outbox`"""
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                try:
+                    await handle(item)
+                except Exception as e:
+                    fail(item, e)
+                    continue
+                if outbox is not None:
+                    await outbox.put(item)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            for _ in range(consumers):
+                await outbox.put(_DONE)
+
+    @staticmethod
+    def _copy_entry(source: ResumeSource, name: str) -> StoredUpload:
+        with source.open(name) as f:
+            return store_stream(f, settings.UPLOAD_DIR, settings.MAX_FILE_SIZE, settings.UPLOAD_BLOCK_SIZE)
+
+    async def _parse(self, lookup_db: Session, executor: Executor, item: _IngestionItem) -> Tuple[str, Dict[str, Any]]:
+        parsed = self.candidate_service.find_parsed_resume(lookup_db, item.stored.sha256)
+        if parsed is not None:
+            return parsed
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _parse_in_worker, item.stored.path, item.extension)
+
+    async def _enrich(
+        self,
+        lookup_db: Session,
+        item: _IngestionItem,
+        job: Job,
+        job_embedding: Optional[List[float]],
+        remote_slots: asyncio.Semaphore,
+        user_id: int
+    ) -> None:
+        """Build the candidate and compute everything that needs remote calls"""
+        service = self.candidate_service
+        row = item.manifest_row
+        match = _EMAIL_PATTERN.search(item.resume_text)
+        email = row.get("email") or (match.group(0) if match else None)
+        if not email:
+            raise ValueError("No email in manifest or resume")
+        name = row.get("name") or self._name_from_filename(item.filename)
+
+        candidate = service.build_candidate(
+            job.id, name, email, row.get("phone") or None, os.path.basename(item.filename),
+            item.resume_text, item.structured_data
+        )
+
+        # Checked before any remote call, like single uploads; the writer
+        # checks again for duplicates committed since
+        original, _ = service.find_original(lookup_db, candidate, user_id)
+        item.chunk_records = service.copy_chunks(lookup_db, original) if original is not None else []
+        if not item.chunk_records:
+            chunks = await service.resume_parser.create_chunks(candidate.resume_text)
+            async with remote_slots:
+                embeddings, backend = await service.scoring_service.embed_texts([chunk["text"] for chunk in chunks])
+            item.chunk_records = [
+                CandidateChunk(
+                    chunk_text=chunk["text"],
+                    chunk_type=chunk["type"],
+                    embedding_vector=embedding,
+                    embedding_backend=backend
+                )
+                for chunk, embedding in zip(chunks, embeddings)
+            ]
+
+        score_breakdown = await service.scoring_service.calculate_candidate_score(
+            candidate, job, item.chunk_records, job_embedding
+        )
+        # The explanation is job-specific, so it can only be reused within the same job
+        if original is not None and original.job_id == job.id and original.match_explanation:
+            explanation = original.match_explanation
+        else:
+            async with remote_slots:
+                explanation = await service.llm_service.explain_candidate_match(
+                    job.description, candidate.resume_text, score_breakdown
+                )
+
+        candidate.score_breakdown = score_breakdown
+        candidate.total_score = score_breakdown.get("total_weighted_score", 0.0)
+        candidate.match_explanation = explanation
+        item.candidate = candidate
+
+    def _commit(
+        self,
+        db: Session,
+        batch: IngestionBatch,
+        pending: List[_IngestionItem],
+        on_progress: Optional[Callable[[IngestionBatch], None]]
+    ) -> None:
+        if not pending:
+            return
+        try:
+            with stage("bulk", "commit"):
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            for item in pending:
+                batch.record_failure(item.filename, f"Database commit failed: {e}")
+        else:
+            for item in pending:
+                self.candidate_service.index_candidate(item.candidate, item.chunk_records)
+                batch.record_success(item.candidate.id)
+        pending.clear()
+        if on_progress:
+            on_progress(batch)
+
+    @staticmethod
+    def _name_from_filename(filename: str) -> str:
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        return re.sub(r"[_\-.]+", " ", stem).strip().title() or stem
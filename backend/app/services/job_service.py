@@ -6,11 +6,17 @@ from app.models.job import Job
 from app.models.candidate import Candidate
 from app.schemas.job import JobCreate, JobUpdate
 from app.services.llm_service import LLMService
+from app.services.feature_service import FeatureService
+from app.services.facet_service import SkillFacetService
+from app.services.job_stats_service import JobStatsService
 
 
 class JobService:
     def __init__(self):
         self.llm_service = LLMService()
+        self.feature_service = FeatureService()
+        self.facet_service = SkillFacetService(self.feature_service)
+        self.stats_service = JobStatsService(self.feature_service, self.facet_service)
 
     async def create_job(self, db: Session, job_data: JobCreate, user_id: int) -> Job:
         # Generate requirements and questionnaire using LLM
@@ -24,7 +30,10 @@ class JobService:
             questionnaire=questionnaire,
             created_by=user_id
         )
+        self.feature_service.apply_requirement_features(db_job)
         db.add(db_job)
+        db.flush()
+        self.stats_service.rebuild(db, db_job.id)
         db.commit()
         db.refresh(db_job)
         return db_job
@@ -41,6 +50,13 @@ class JobService:
 
         return jobs
 
+    async def get_job_stats(self, db: Session, job_id: int, user_id: int) -> Dict[str, Any]:
+        job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return self.stats_service.job_stats(db, job)
+
     async def update_job(self, db: Session, job_id: int, job_data: JobUpdate, user_id: int) -> Job:
         job = db.query(Job).filter(Job.id == job_id, Job.created_by == user_id).first()
         if not job:
@@ -58,6 +74,9 @@ class JobService:
         for field, value in update_data.items():
             setattr(job, field, value)
 
+        if "requirements" in update_data:
+            self.feature_service.apply_requirement_features(job)
+
         db.commit()
         db.refresh(job)
         return job
@@ -75,6 +94,9 @@ class JobService:
                 detail="Cannot delete job with existing candidates. Archive it instead."
             )
 
+        # Facet and summary rows outlive the candidates they cover
+        self.facet_service.delete_job(db, job_id)
+        self.stats_service.delete_job(db, job_id)
         db.delete(job)
         db.commit()
         return True
\ No newline at end of file
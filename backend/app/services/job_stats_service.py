@@ -0,0 +1,216 @@
+from bisect import bisect_right
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.job_stats import JobStats
+from app.services.facet_service import SkillFacetService
+from app.services.feature_service import FeatureService
+
+SCORE_BUCKETS = 10  # Fixed-width total_score buckets over [0, 1]
+STATUSES = ("pending", "reviewed", "shortlisted", "rejected")
+_THRESHOLDS = [bucket / SCORE_BUCKETS for bucket in range(1, SCORE_BUCKETS)]
+
+# (score, status, skill bits, experience years, education level) of one candidate
+Contribution = Tuple[float, str, int, int, int]
+
+
+class JobStatsService:
+    """Dashboard aggregates per job, kept in a job_stats summary row.
+
+    The row is created with the job and rebuilt with one grouped SQL
+    aggregate (plus the job's skill facet bitmaps for skill counts) after
+    bulk changes, in the writer's transaction. Every other change to a
+    candidate applies the difference between its old and new contribution
+    in the caller's transaction, under a row lock like the skill facets.
+    Reads never write: a job without a row (created before the table)
+    gets an unsaved summary until scripts/rebuild_job_stats.py stores it.
+    """
+
+    def __init__(
+        self,
+        feature_service: Optional[FeatureService] = None,
+        facet_service: Optional[SkillFacetService] = None
+    ):
+        self.feature_service = feature_service or FeatureService()
+        self.facet_service = facet_service or SkillFacetService(self.feature_service)
+
+    @staticmethod
+    def score_bucket(score: float) -> int:
+        """Bucket of a score; the same boundaries as the SQL aggregate"""
+        return bisect_right(_THRESHOLDS, score)
+
+    def contribution(self, candidate: Candidate) -> Contribution:
+        features = self.feature_service.candidate_features(candidate)
+        return (
+            candidate.total_score or 0.0,
+            candidate.status or "pending",
+            self.feature_service.decode_bits(features["skill_bits"]),
+            features["experience_years"],
+            features["education_level"]
+        )
+
+    def apply(
+        self,
+        db: Session,
+        job_id: int,
+        previous: Optional[Contribution],
+        current: Optional[Contribution]
+    ) -> None:
+        """Replace a candidate's previous contribution with its current one (flushed, not committed)"""
+        if previous == current:
+            return
+        stats = db.query(JobStats).filter(JobStats.job_id == job_id).with_for_update().first()
+        if stats is None:
+            return  # The job predates the table; see rebuild()
+
+        histogram = list(stats.score_histogram or [0] * SCORE_BUCKETS)
+        statuses = dict(stats.status_counts or {})
+        skills = dict(stats.skill_counts or {})
+        previous_bits = previous[2] if previous else 0
+        current_bits = current[2] if current else 0
+
+        changes = ((previous, -1, previous_bits & ~current_bits), (current, 1, current_bits & ~previous_bits))
+        for entry, sign, bits in changes:
+            if entry is None:
+                continue
+            score, status, _, experience, education = entry
+            stats.candidate_count += sign
+            stats.score_sum += sign * score
+            stats.experience_sum += sign * experience
+            stats.education_sum += sign * education
+            histogram[self.score_bucket(score)] += sign
+            statuses[status] = statuses.get(status, 0) + sign
+            while bits:
+                low = bits & -bits
+                skill_id = str(low.bit_length() - 1)
+                skills[skill_id] = skills.get(skill_id, 0) + sign
+                bits ^= low
+
+        stats.score_histogram = histogram
+        stats.status_counts = {status: count for status, count in statuses.items() if count}
+        stats.skill_counts = {skill_id: count for skill_id, count in skills.items() if count}
+        db.flush()
+
+    def delete_job(self, db: Session, job_id: int) -> None:
+        """Drop the job's summary row before the job itself (not committed)"""
+        db.query(JobStats).filter(JobStats.job_id == job_id).delete(synchronize_session=False)
+
+    def summarize(self, db: Session, job_id: int) -> JobStats:
+        """Unsaved summary computed from the candidates table and skill facets"""
+        bucket = case(
+            *[(Candidate.total_score >= _THRESHOLDS[index - 1], index) for index in range(SCORE_BUCKETS - 1, 0, -1)],
+            else_=0
+        ).label("bucket")
+        rows = (
+            db.query(
+                Candidate.status,
+                bucket,
+                func.count(Candidate.id),
+                func.coalesce(func.sum(Candidate.total_score), 0.0),
+                func.coalesce(func.sum(Candidate.experience_years), 0),
+                func.coalesce(func.sum(Candidate.education_level), 0)
+            )
+            .filter(Candidate.job_id == job_id)
+            .group_by(Candidate.status, bucket)
+            .all()
+        )
+
+        histogram = [0] * SCORE_BUCKETS
+        statuses: Dict[str, int] = {}
+        totals = [0, 0.0, 0.0, 0.0]
+        for status, bucket_index, count, score_sum, experience_sum, education_sum in rows:
+            histogram[bucket_index] += count
+            status = status or "pending"
+            statuses[status] = statuses.get(status, 0) + count
+            for index, value in enumerate((count, score_sum, experience_sum, education_sum)):
+                totals[index] += value
+
+        # Skill counts come from the facet bitmaps, one row per skill
+        universe, bitmaps = self.facet_service.match(db, job_id, None)
+        vocabulary = self.feature_service.vocabulary
+        skills = {}
+        for name, bitmap in bitmaps.items():
+            count = (bitmap & universe).bit_count()
+            if count:
+                skills[str(vocabulary.skill_id(name))] = count
+
+        return JobStats(
+            job_id=job_id,
+            candidate_count=totals[0],
+            score_sum=float(totals[1]),
+            experience_sum=float(totals[2]),
+            education_sum=float(totals[3]),
+            score_histogram=histogram,
+            status_counts=statuses,
+            skill_counts=skills
+        )
+
+    def rebuild(self, db: Session, job_id: int) -> JobStats:
+        """Recompute and store the summary row (flushed, not committed)"""
+        db.flush()  # The aggregate has to see the caller's pending candidate changes
+        summary = self.summarize(db, job_id)
+        stats = db.query(JobStats).filter(JobStats.job_id == job_id).with_for_update().first()
+        if stats is None:
+            try:
+                with db.begin_nested():
+                    db.add(summary)
+                return summary
+            except IntegrityError:
+                # Another transaction created the row first; overwrite it under its lock
+                stats = db.query(JobStats).filter(JobStats.job_id == job_id).with_for_update().one()
+        for column in (
+            "candidate_count", "score_sum", "experience_sum", "education_sum",
+            "score_histogram", "status_counts", "skill_counts"
+        ):
+            setattr(stats, column, getattr(summary, column))
+        db.flush()
+        return stats
+
+    def job_stats(self, db: Session, job: Job) -> Dict[str, Any]:
+        stats = db.query(JobStats).filter(JobStats.job_id == job.id).first()
+        if stats is None:
+            stats = self.summarize(db, job.id)
+
+        count = stats.candidate_count
+        vocabulary = self.feature_service.vocabulary
+        job_features = self.feature_service.job_features(job)
+        required = self.feature_service.decode_bits(job_features["required_bits"])
+        preferred = self.feature_service.decode_bits(job_features["preferred_bits"])
+        skill_counts = stats.skill_counts or {}
+
+        coverage = []
+        for skill_id in range((required | preferred).bit_length()):
+            bit = 1 << skill_id
+            if not (required | preferred) & bit or skill_id >= len(vocabulary):
+                continue
+            candidates = skill_counts.get(str(skill_id), 0)
+            coverage.append({
+                "skill": vocabulary.names[skill_id],
+                "required": bool(required & bit),
+                "candidates": candidates,
+                "coverage": round(candidates / count, 4) if count else 0.0
+            })
+        coverage.sort(key=lambda entry: (not entry["required"], -entry["candidates"], entry["skill"]))
+
+        histogram = stats.score_histogram or [0] * SCORE_BUCKETS
+        status_counts = {status: 0 for status in STATUSES}
+        status_counts.update(stats.status_counts or {})
+        return {
+            "job_id": job.id,
+            "candidate_count": count,
+            "average_score": round(stats.score_sum / count, 4) if count else 0.0,
+            "average_experience_years": round(stats.experience_sum / count, 2) if count else 0.0,
+            "average_education_level": round(stats.education_sum / count, 2) if count else 0.0,
+            "score_histogram": [
+                {"min": index / SCORE_BUCKETS, "max": (index + 1) / SCORE_BUCKETS, "count": histogram[index]}
+                for index in range(SCORE_BUCKETS)
+            ],
+            "status_counts": status_counts,
+            "skill_coverage": coverage,
+            "updated_at": stats.updated_at
+        }
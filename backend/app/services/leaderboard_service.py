@@ -0,0 +1,362 @@
+import math
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.services.job_stats_service import STATUSES
+
+try:
+    import redis
+except ImportError:  # Only the in-memory leaderboard is available
+    redis = None
+
+_REDIS_PREFIX = "cvbot:leaderboard:v2:"  # v2: members are encoded IDs; boards of the old format are not read
+_REDIS_ID_SPAN = 10 ** 15  # Members are zero-padded (span - 1 - id), see RedisLeaderboard._member
+_CLOCK_SLACK = timedelta(seconds=1)  # Databases may store timestamps with second resolution
+_STATUS_CODE = case({status: code for code, status in enumerate(STATUSES, start=1)}, value=Candidate.status, else_=0)
+
+
+class SortedBoard:
+    """Candidates of one ranking, best first.
+
+    Entries are kept as (-score, candidate_id) in a sorted list: ranks and
+    score cut-offs are binary searches, and an update moves one entry.
+    Equal scores rank the older (lower ID) candidate first.
+    """
+
+    def __init__(self):
+        self.keys: List[Tuple[float, int]] = []
+        self.scores: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def set(self, candidate_id: int, score: float) -> None:
+        previous = self.scores.get(candidate_id)
+        if previous == score:
+            return
+        if previous is not None:
+            del self.keys[bisect_left(self.keys, (-previous, candidate_id))]
+        insort(self.keys, (-score, candidate_id))
+        self.scores[candidate_id] = score
+
+    def discard(self, candidate_id: int) -> None:
+        previous = self.scores.pop(candidate_id, None)
+        if previous is not None:
+            del self.keys[bisect_left(self.keys, (-previous, candidate_id))]
+
+    def rank(self, candidate_id: int) -> Optional[int]:
+        """0-based position, or None if absent"""
+        score = self.scores.get(candidate_id)
+        return None if score is None else bisect_left(self.keys, (-score, candidate_id))
+
+    def range(self, skip: int, limit: int, min_score: float) -> List[Tuple[int, float]]:
+        end = min(skip + limit, bisect_right(self.keys, (-min_score, math.inf)))
+        return [(candidate_id, -score) for score, candidate_id in self.keys[skip:end]]
+
+
+class MemoryLeaderboard:
+    """Leaderboards in this process, checked against the database on every read"""
+
+    name = "memory"
+    shared = False
+
+    def __init__(self):
+        self.boards: Dict[int, Dict[Optional[str], SortedBoard]] = {}  # job -> status (None: all) -> board
+        self.statuses: Dict[int, Dict[int, str]] = {}  # job -> candidate -> status
+        self._lock = threading.Lock()  # For threaded callers; bulk parse workers are separate processes with no boards
+
+    def loaded(self, job_id: int) -> bool:
+        return job_id in self.boards
+
+    def load(self, job_id: int, rows: Iterable[Tuple[int, float, str]]) -> None:
+        boards: Dict[Optional[str], SortedBoard] = {None: SortedBoard()}
+        statuses: Dict[int, str] = {}
+        for candidate_id, score, status in rows:
+            for key in (None, status):
+                board = boards.get(key)
+                if board is None:
+                    board = boards[key] = SortedBoard()
+                board.keys.append((-score, candidate_id))
+                board.scores[candidate_id] = score
+            statuses[candidate_id] = status
+        for board in boards.values():
+            board.keys.sort()  # Rows arrive best first, so this is a linear pass
+        with self._lock:
+            self.boards[job_id] = boards
+            self.statuses[job_id] = statuses
+
+    def update(self, job_id: int, candidate_id: int, score: float, status: str) -> None:
+        with self._lock:
+            boards = self.boards.get(job_id)
+            if boards is None:
+                return  # Loaded from the database on first read
+            previous = self.statuses[job_id].get(candidate_id)
+            if previous is not None and previous != status:
+                boards[previous].discard(candidate_id)
+            boards[None].set(candidate_id, score)
+            boards.setdefault(status, SortedBoard()).set(candidate_id, score)
+            self.statuses[job_id][candidate_id] = status
+
+    def discard(self, job_id: int, candidate_id: int) -> None:
+        with self._lock:
+            boards = self.boards.get(job_id)
+            status = self.statuses.get(job_id, {}).pop(candidate_id, None)
+            if boards is None or status is None:
+                return
+            boards[None].discard(candidate_id)
+            boards[status].discard(candidate_id)
+
+    def checksum(self, job_id: int) -> Tuple[int, int]:
+        """(candidates, sum of their IDs) on the job's board"""
+        with self._lock:
+            scores = self.boards[job_id][None].scores
+            return len(scores), sum(scores)
+
+    def top(
+        self, job_id: int, skip: int, limit: int, min_score: float, status: Optional[str]
+    ) -> List[Tuple[int, float]]:
+        with self._lock:
+            board = self.boards[job_id].get(status)
+            return board.range(skip, limit, min_score) if board is not None else []
+
+    def rank(self, job_id: int, candidate_id: int, status: Optional[str]) -> Optional[Tuple[int, float, int]]:
+        with self._lock:
+            board = self.boards[job_id].get(status)
+            position = board.rank(candidate_id) if board is not None else None
+            if position is None:
+                return None
+            return position, board.scores[candidate_id], len(board)
+
+
+class RedisLeaderboard:
+    """Leaderboards as Redis sorted sets, shared by all workers.
+
+    Per job: a sorted set of all candidates, one per status, a hash of
+    each candidate's status (to move it between status sets) and a
+    marker set once the job was loaded from the database. Equal scores
+    are ordered by member, descending, so members encode the candidate ID
+    inverted and zero-padded: the older (lower ID) candidate ranks first,
+    as in SortedBoard and the SQL ordering.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: Optional[str] = None):
+        self.client = redis.Redis.from_url(url or settings.REDIS_URL)
+
+    @staticmethod
+    def _key(job_id: int, status: Optional[str] = None) -> str:
+        return f"{_REDIS_PREFIX}{job_id}" + (f":status:{status}" if status else "")
+
+    @staticmethod
+    def _member(candidate_id: int) -> str:
+        return f"{_REDIS_ID_SPAN - 1 - candidate_id:015d}"
+
+    @staticmethod
+    def _candidate_id(member: Any) -> int:
+        return _REDIS_ID_SPAN - 1 - int(member)
+
+    def loaded(self, job_id: int) -> bool:
+        return bool(self.client.exists(f"{self._key(job_id)}:loaded"))
+
+    def load(self, job_id: int, rows: Iterable[Tuple[int, float, str]]) -> None:
+        boards: Dict[str, Dict[str, float]] = {self._key(job_id): {}}
+        statuses: Dict[str, str] = {}
+        for candidate_id, score, status in rows:
+            member = self._member(candidate_id)
+            boards[self._key(job_id)][member] = score
+            boards.setdefault(self._key(job_id, status), {})[member] = score
+            statuses[member] = status
+
+        pipe = self.client.pipeline()
+        pipe.delete(*boards, f"{self._key(job_id)}:statuses")
+        for key, members in boards.items():
+            if members:
+                pipe.zadd(key, members)
+        if statuses:
+            pipe.hset(f"{self._key(job_id)}:statuses", mapping=statuses)
+        pipe.set(f"{self._key(job_id)}:loaded", 1)
+        pipe.execute()
+
+    def update(self, job_id: int, candidate_id: int, score: float, status: str) -> None:
+        if not self.loaded(job_id):
+            return
+        member = self._member(candidate_id)
+        previous = self.client.hget(f"{self._key(job_id)}:statuses", member)
+        pipe = self.client.pipeline()
+        if previous is not None and previous.decode() != status:
+            pipe.zrem(self._key(job_id, previous.decode()), member)
+        pipe.zadd(self._key(job_id), {member: score})
+        pipe.zadd(self._key(job_id, status), {member: score})
+        pipe.hset(f"{self._key(job_id)}:statuses", member, status)
+        pipe.execute()
+
+    def discard(self, job_id: int, candidate_id: int) -> None:
+        member = self._member(candidate_id)
+        status = self.client.hget(f"{self._key(job_id)}:statuses", member)
+        pipe = self.client.pipeline()
+        pipe.zrem(self._key(job_id), member)
+        if status is not None:
+            pipe.zrem(self._key(job_id, status.decode()), member)
+        pipe.hdel(f"{self._key(job_id)}:statuses", member)
+        pipe.execute()
+
+    def top(
+        self, job_id: int, skip: int, limit: int, min_score: float, status: Optional[str]
+    ) -> List[Tuple[int, float]]:
+        rows = self.client.zrevrangebyscore(
+            self._key(job_id, status), "+inf", min_score, start=skip, num=limit, withscores=True
+        )
+        return [(self._candidate_id(member), score) for member, score in rows]
+
+    def rank(self, job_id: int, candidate_id: int, status: Optional[str]) -> Optional[Tuple[int, float, int]]:
+        pipe = self.client.pipeline()
+        pipe.zrevrank(self._key(job_id, status), self._member(candidate_id))
+        pipe.zscore(self._key(job_id, status), self._member(candidate_id))
+        pipe.zcard(self._key(job_id, status))
+        position, score, size = pipe.execute()
+        return None if position is None else (position, score, size)
+
+
+LEADERBOARD_BACKENDS = {MemoryLeaderboard.name: MemoryLeaderboard, RedisLeaderboard.name: RedisLeaderboard}
+
+
+def create_leaderboard_backend(name: Optional[str] = None):
+    name = name or settings.LEADERBOARD_BACKEND
+    if name not in LEADERBOARD_BACKENDS:
+        raise ValueError(f"Unknown leaderboard backend '{name}' (choose from {', '.join(LEADERBOARD_BACKENDS)})")
+    if name == RedisLeaderboard.name and redis is None:
+        print("redis is not installed, keeping leaderboards in memory")
+        return MemoryLeaderboard()
+    return LEADERBOARD_BACKENDS[name]()
+
+
+class LeaderboardService:
+    """Each job's candidates ranked by total score, overall and per status.
+
+    A job's leaderboard is loaded from the candidates table (through the
+    job/score index) on first use and afterwards updated one candidate at
+    a time when it is scored, rescored or changes status, so top-k pages
+    and the rank of a candidate never sort the job. Reads return None
+    when the backend fails; callers then query the database directly.
+
+    Boards in process memory miss writes made by other workers and
+    scripts, so each read first compares a per-job signature (candidate
+    count, ID sum, score sum, a status checksum and the latest change
+    time, one aggregate on the database side) with the one the board was last synced at. On a
+    mismatch the candidates changed since then are applied, and the board
+    is reloaded when its members still differ (deletions).
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or create_leaderboard_backend()
+        self.signatures: Dict[int, Tuple[Any, ...]] = {}  # job -> signature the memory board is synced at
+
+    @staticmethod
+    def _changed_at():
+        return func.coalesce(Candidate.updated_at, Candidate.created_at)
+
+    def _signature(self, db: Session, job_id: int) -> Tuple[Any, ...]:
+        return tuple(
+            db.query(
+                func.count(Candidate.id),
+                func.coalesce(func.sum(Candidate.id), 0),
+                func.coalesce(func.sum(Candidate.total_score), 0.0),
+                func.coalesce(func.sum(Candidate.id * _STATUS_CODE), 0),
+                func.max(self._changed_at())
+            )
+            .filter(Candidate.job_id == job_id)
+            .one()
+        )
+
+    def _ensure_loaded(self, db: Session, job_id: int) -> None:
+        if self.backend.shared:
+            if not self.backend.loaded(job_id):
+                self._load(db, job_id)
+            return
+
+        signature = self._signature(db, job_id)  # Before reading rows, so later writes show up next time
+        synced = self.signatures.get(job_id)
+        if synced == signature and self.backend.loaded(job_id):
+            return
+        if synced is None or synced[4] is None or not self.backend.loaded(job_id):
+            self._load(db, job_id)
+        else:
+            changed = (
+                db.query(Candidate.id, Candidate.total_score, Candidate.status)
+                .filter(Candidate.job_id == job_id, self._changed_at() >= synced[4] - _CLOCK_SLACK)
+                .all()
+            )
+            for candidate_id, score, status in changed:
+                self.backend.update(job_id, candidate_id, score or 0.0, status or "pending")
+            if self.backend.checksum(job_id) != (signature[0], int(signature[1])):
+                self._load(db, job_id)
+        self.signatures[job_id] = signature
+
+    def _load(self, db: Session, job_id: int) -> None:
+        rows = (
+            db.query(Candidate.id, Candidate.total_score, Candidate.status)
+            .filter(Candidate.job_id == job_id)
+            .order_by(Candidate.total_score.desc(), Candidate.id)
+            .all()
+        )
+        self.backend.load(job_id, [
+            (candidate_id, score or 0.0, status or "pending") for candidate_id, score, status in rows
+        ])
+
+    def record(self, candidates: Iterable[Candidate]) -> None:
+        """Apply the committed score and status of candidates"""
+        for candidate in candidates:
+            try:
+                self.backend.update(
+                    candidate.job_id, candidate.id, candidate.total_score or 0.0, candidate.status or "pending"
+                )
+            except Exception as e:
+                print(f"Leaderboard update failed for candidate {candidate.id}: {e}")
+
+    def discard(self, job_id: int, candidate_id: int) -> None:
+        """Remove a deleted candidate"""
+        try:
+            self.backend.discard(job_id, candidate_id)
+        except Exception as e:
+            print(f"Leaderboard update failed for candidate {candidate_id}: {e}")
+
+    def top(
+        self,
+        db: Session,
+        job_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        min_score: float = 0.0,
+        status: Optional[str] = None
+    ) -> Optional[List[Tuple[int, float]]]:
+        """(candidate_id, total_score) of one page of the job's ranking"""
+        try:
+            self._ensure_loaded(db, job_id)
+            return self.backend.top(job_id, skip, limit, min_score, status)
+        except Exception as e:
+            print(f"Leaderboard read failed for job {job_id}: {e}")
+            return None
+
+    def rank(
+        self, db: Session, job_id: int, candidate_id: int, status: Optional[str] = None
+    ) -> Optional[Tuple[int, float, int]]:
+        """(1-based rank, total_score, candidates ranked), None if not on the board"""
+        try:
+            self._ensure_loaded(db, job_id)
+            found = self.backend.rank(job_id, candidate_id, status)
+        except Exception as e:
+            print(f"Leaderboard read failed for job {job_id}: {e}")
+            return None
+        if found is None:
+            return None
+        position, score, size = found
+        return position + 1, score, size
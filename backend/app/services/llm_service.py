@@ -1,6 +1,9 @@
+import time
+
 import httpx
 from typing import Dict, Any, List
 from app.core.config import settings
+from app.core.metrics import record_provider_call
 
 
 class LLMService:
@@ -8,8 +11,8 @@ class LLMService:
         self.api_key = settings.DEEPSEEK_API_KEY
         self.base_url = settings.DEEPSEEK_BASE_URL
 
-    async def _call_api(self, messages: List[Dict[str, str]], max_tokens: int = 1000) -> str:
-        """Make API call to DeepSeek"""
+    async def _call_api(self, messages: List[Dict[str, str]], max_tokens: int = 1000, operation: str = "chat") -> str:
+        """Make API call to DeepSeek; `operation` labels the call in metrics"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -22,6 +25,7 @@ class LLMService:
             "temperature": 0.1
         }
 
+        start = time.perf_counter()
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.post(
@@ -32,8 +36,11 @@ class LLMService:
                 )
                 response.raise_for_status()
                 result = response.json()
-                return result["choices"][0]["message"]["content"]
+                content = result["choices"][0]["message"]["content"]
+                record_provider_call("deepseek", operation, time.perf_counter() - start, True, result.get("usage"))
+                return content
             except Exception as e:
+                record_provider_call("deepseek", operation, time.perf_counter() - start, False)
                 print(f"LLM API error: {e}")
                 # Return fallback response
                 return self._get_fallback_response()
@@ -66,7 +73,7 @@ class LLMService:
             {"role": "user", "content": prompt}
         ]
 
-        response = await self._call_api(messages)
+        response = await self._call_api(messages, operation="extract_requirements")
 
         try:
             import json
@@ -111,7 +118,7 @@ class LLMService:
             {"role": "user", "content": prompt}
         ]
 
-        response = await self._call_api(messages, max_tokens=1500)
+        response = await self._call_api(messages, max_tokens=1500, operation="questionnaire")
 
         try:
             import json
@@ -153,7 +160,7 @@ class LLMService:
                 ]
             }
 
-    async def explain_candidate_match(self, job_description: str, resume_text: str, score_breakdown: Dict[str, float]) -> str:
+    async def explain_candidate_match(self, job_description: str, resume_text: str, score_breakdown: Dict[str, Any]) -> str:
         """Generate explanation for candidate match"""
         prompt = f"""
         Explain why this candidate matches (or doesn't match) the job requirements:
@@ -177,5 +184,5 @@ class LLMService:
             {"role": "user", "content": prompt}
         ]
 
-        response = await self._call_api(messages, max_tokens=500)
+        response = await self._call_api(messages, max_tokens=500, operation="explain_match")
         return response.strip()
\ No newline at end of file
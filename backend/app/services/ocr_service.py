@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import pytesseract
+from pdf2image import convert_from_path
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.utils.uploads import open_mapped
+
+_SHA256_NAME = re.compile(r"[0-9a-f]{64}")  # Blob store file names are the content hash
+
+
+def ocr_pdf_page(file_path: str, page_number: int, dpi: int, lang: str, timeout: float) -> str:
+    """Rasterize one page (1-based) and run Tesseract on it.
+
+    Runs in a worker process; only the path crosses the process boundary,
+    not the rendered image.
+    """
+    images = convert_from_path(file_path, dpi=dpi, first_page=page_number, last_page=page_number, grayscale=True)
+    if not images:
+        return ""
+    return pytesseract.image_to_string(images[0], lang=lang, timeout=timeout)
+
+
+class OCRResult(NamedTuple):
+    text: str
+    pages: int
+    cached: bool
+    elapsed_ms: float
+
+    def info(self) -> Dict[str, Any]:
+        return {"pages": self.pages, "cached": self.cached, "elapsed_ms": self.elapsed_ms}
+
+
+class OCRService:
+    """OCR for scanned PDFs, one page per worker process.
+
+    Results are cached on disk under the file's SHA-256 together with the
+    settings that change the output (DPI, language, page limit), so a
+    re-uploaded scan is never OCRed twice. Blob store files are named by
+    their SHA-256 and are not hashed again. Higher OCR_DPI improves accuracy
+    on small print at roughly quadratic cost in time and memory.
+    """
+
+    def __init__(
+        self,
+        dpi: int = settings.OCR_DPI,
+        max_pages: int = settings.OCR_MAX_PAGES,
+        workers: int = settings.OCR_WORKERS,
+        lang: str = settings.OCR_LANG,
+        cache_dir: str = settings.OCR_CACHE_DIR,
+        page_ocr: Callable[[str, int, int, str, float], str] = ocr_pdf_page
+    ):
+        self.dpi = dpi
+        self.max_pages = max_pages
+        self.workers = workers
+        self.lang = lang
+        self.cache_dir = cache_dir
+        self.page_ocr = page_ocr  # Must be a module-level function so workers can import it
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")  # Forking a threaded server is unsafe
+            )
+        return self._executor
+
+    @staticmethod
+    def _known_sha256(file_path: str) -> Optional[str]:
+        """Hash a blob store file is named after; no need to read it again"""
+        name = os.path.basename(file_path)
+        return name if _SHA256_NAME.fullmatch(name) else None
+
+    @staticmethod
+    def _file_sha256(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _cache_path(self, sha256: str) -> str:
+        return os.path.join(self.cache_dir, f"{sha256}-{self.dpi}dpi-{self.lang}-{self.max_pages}p.json")
+
+    def _read_cache(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: str, entry: Dict[str, Any]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(entry, f)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            print(f"OCR cache write failed: {e}")
+
+    def _page_count(self, file_path: str) -> int:
+        """Pages to OCR, read from the page tree without rendering anything"""
+        with open_mapped(file_path) as fp:
+            document = PDFDocument(PDFParser(fp))
+            return sum(1 for _ in islice(PDFPage.create_pages(document), self.max_pages))
+
+    async def extract_pdf_text(self, file_path: str) -> OCRResult:
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+
+        sha256 = self._known_sha256(file_path) or await loop.run_in_executor(None, self._file_sha256, file_path)
+        cache_path = self._cache_path(sha256)
+        cached = self._read_cache(cache_path)
+        record_cache("ocr", cached is not None)
+        if cached is not None:
+            return OCRResult(cached["text"], cached["pages"], True, round((time.monotonic() - start) * 1000, 1))
+
+        pages = await loop.run_in_executor(None, self._page_count, file_path)
+        texts = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.executor, self.page_ocr, file_path, page_number, self.dpi, self.lang,
+                settings.OCR_PAGE_TIMEOUT_SECONDS
+            )
+            for page_number in range(1, pages + 1)
+        ), return_exceptions=True)
+
+        failed = [(n, e) for n, e in enumerate(texts, start=1) if isinstance(e, BaseException)]
+        for page_number, error in failed:
+            print(f"OCR failed on page {page_number} of {file_path}: {error}")
+        text = "\n".join(page_text.strip() for page_text in texts if isinstance(page_text, str))
+
+        # Failures may be transient (timeouts), so only complete results are cached
+        if not failed:
+            self._write_cache(cache_path, {"text": text, "pages": pages})
+        return OCRResult(text, pages, False, round((time.monotonic() - start) * 1000, 1))
@@ -0,0 +1,175 @@
+import io
+import time
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, resolve1
+from pdfminer.psparser import LIT
+
+from app.core.config import settings
+
+_FORM = LIT("Form")
+
+
+class PDFExtractionTimeout(Exception):
+    pass
+
+
+class PDFExtraction(NamedTuple):
+    text: str
+    pages: int  # Pages extracted
+    truncated: bool  # Stopped at the page cap
+    timed_out: bool  # Stopped at the deadline; text holds the pages finished before it
+    text_layer: bool  # False means a scanned PDF: no fonts on the probed pages
+    elapsed_ms: float
+
+    def info(self) -> Dict[str, Any]:
+        """Summary stored with the parsed resume"""
+        return {
+            "engine": "pdfminer",
+            "pages": self.pages,
+            "truncated": self.truncated,
+            "timed_out": self.timed_out,
+            "text_layer": self.text_layer,
+            "elapsed_ms": self.elapsed_ms
+        }
+
+
+class _DeadlineTextConverter(TextConverter):
+    """TextConverter that gives up once the deadline passes.
+
+    The check runs on every text string and path the interpreter emits, so
+    a single pathological page cannot run past the deadline for long.
+    """
+
+    def __init__(self, *args, deadline: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deadline = deadline
+
+    def _check_deadline(self) -> None:
+        if time.monotonic() > self.deadline:
+            raise PDFExtractionTimeout()
+
+    def render_string(self, *args, **kwargs) -> None:
+        self._check_deadline()
+        super().render_string(*args, **kwargs)
+
+    def paint_path(self, *args, **kwargs) -> None:
+        self._check_deadline()
+        super().paint_path(*args, **kwargs)
+
+    def render_image(self, name, stream) -> None:
+        # Images carry no text; skip them without decoding
+        self._check_deadline()
+
+
+class PDFTextExtractor:
+    """pdfminer text extraction with bounded cost.
+
+    - At most `max_pages` pages are interpreted.
+    - A wall-clock `timeout` applies to the whole document. It is checked
+      cooperatively between pages and while a page is interpreted.
+    - A cheap probe of the first pages' font resources detects scanned PDFs
+      before any content stream is interpreted.
+    - Layout analysis skips text-box grouping (`boxes_flow=None`), which
+      dominates the cost on dense pages; boxes are read top to bottom.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = settings.PDF_MAX_PAGES,
+        timeout: float = settings.PDF_TIMEOUT_SECONDS,
+        probe_pages: int = settings.PDF_TEXT_LAYER_PROBE_PAGES,
+        laparams: Optional[LAParams] = None
+    ):
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.probe_pages = probe_pages
+        self.laparams = laparams or LAParams(boxes_flow=None, detect_vertical=False, all_texts=False)
+
+    @classmethod
+    def _has_fonts(cls, resources: Any, depth: int = 0) -> bool:
+        """Whether a resource dictionary (or a form XObject in it) declares fonts"""
+        resources = resolve1(resources)
+        if not isinstance(resources, dict):
+            return False
+        if resolve1(resources.get("Font")):
+            return True
+        if depth >= 2:
+            return False
+        xobjects = resolve1(resources.get("XObject"))
+        if not isinstance(xobjects, dict):
+            return False
+        for xobject in xobjects.values():
+            xobject = resolve1(xobject)
+            if (
+                isinstance(xobject, PDFStream)
+                and xobject.get("Subtype") is _FORM
+                and cls._has_fonts(xobject.get("Resources"), depth + 1)
+            ):
+                return True
+        return False
+
+    def _page_texts(self, pages: Iterable[PDFPage], deadline: float) -> Iterator[str]:
+        resource_manager = PDFResourceManager(caching=True)
+        output = io.StringIO()
+        device = _DeadlineTextConverter(resource_manager, output, laparams=self.laparams, deadline=deadline)
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        try:
+            for page in pages:
+                if time.monotonic() > deadline:
+                    raise PDFExtractionTimeout()
+                interpreter.process_page(page)
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        finally:
+            device.close()
+
+    def iter_pages(self, fp: BinaryIO, deadline: Optional[float] = None) -> Iterator[str]:
+        """Text of each page in order, up to the page cap.
+
+        Only one page's layout is held in memory at a time. Raises
+        PDFExtractionTimeout once the deadline passes.
+        """
+        document = PDFDocument(PDFParser(fp))
+        if deadline is None:
+            deadline = time.monotonic() + self.timeout
+        yield from self._page_texts(islice(PDFPage.create_pages(document), self.max_pages), deadline)
+
+    def has_text_layer(self, pages: List[PDFPage]) -> bool:
+        """Cheap check for fonts on the first pages; no content stream is parsed"""
+        probed = pages[:self.probe_pages]
+        return not probed or any(self._has_fonts(page.resources) for page in probed)
+
+    def extract(self, fp: BinaryIO) -> PDFExtraction:
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        def elapsed_ms() -> float:
+            return round((time.monotonic() - start) * 1000, 1)
+
+        # Page objects are only dictionaries; content streams are parsed later, page by page
+        document = PDFDocument(PDFParser(fp))
+        pages = list(islice(PDFPage.create_pages(document), self.max_pages + 1))
+        truncated = len(pages) > self.max_pages
+        pages = pages[:self.max_pages]
+
+        if not self.has_text_layer(pages):
+            return PDFExtraction("", 0, truncated, False, False, elapsed_ms())
+
+        texts = []
+        timed_out = False
+        try:
+            for text in self._page_texts(pages, deadline):
+                texts.append(text)
+        except PDFExtractionTimeout:
+            timed_out = True
+
+        return PDFExtraction("".join(texts), len(texts), truncated, timed_out, True, elapsed_ms())
@@ -1,295 +1,155 @@
 import os
-import re
-from typing import Dict, Any, List, Tuple
+import time
+from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 import json
 
-# Document parsing
-from pdfminer.high_level import extract_text as pdf_extract_text
-from docx import Document
-import pytesseract
-from PIL import Image
-
 # NLP for text processing
 import numpy as np
 
+from app.core.config import settings
+from app.core.metrics import stage
+from app.services.feature_service import FeatureService
+from app.services.pdf_extraction import PDFTextExtractor
+from app.services.docx_extraction import DOCXTextExtractor
+from app.services.field_extraction import ResumeFieldExtractor
+from app.services.ocr_service import OCRService
+from app.services.skill_taxonomy import SkillTaxonomy, TaxonomyStore, taxonomy_store
+from app.services.text_chunking import ResumeChunker
+from app.utils.uploads import open_mapped
 
-class ResumeParserService:
-    def __init__(self):
-        self.skills_database = self._load_skills_database()
-
-    def _load_skills_database(self) -> Dict[str, List[str]]:
-        """Load predefined skills database with synonyms"""
-        return {
-            "programming": [
-                "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-                "php", "ruby", "swift", "kotlin", "scala", "r", "matlab", "sql"
-            ],
-            "web_development": [
-                "html", "css", "react", "angular", "vue", "nodejs", "express", "django",
-                "flask", "spring", "laravel", "rails", "nextjs", "nuxtjs"
-            ],
-            "databases": [
-                "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra",
-                "oracle", "sqlite", "dynamodb", "firebase"
-            ],
-            "cloud": [
-                "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
-                "jenkins", "gitlab", "github actions"
-            ],
-            "data_science": [
-                "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "keras",
-                "spark", "hadoop", "tableau", "powerbi", "jupyter"
-            ],
-            "mobile": [
-                "android", "ios", "react native", "flutter", "xamarin", "ionic",
-                "swift", "kotlin", "objective-c"
-            ]
-        }
 
-    async def parse_resume(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
-        """Parse resume and extract text and structured data"""
+class ResumeParserService:
+    def __init__(self, taxonomy: Optional[TaxonomyStore] = None):
+        self.taxonomy = taxonomy or taxonomy_store
+        self.feature_service = FeatureService()
+        self.pdf_extractor = PDFTextExtractor()
+        self.docx_extractor = DOCXTextExtractor()
+        self.chunker = ResumeChunker()
+        self.field_extractor = ResumeFieldExtractor()
+        self.ocr_service = OCRService()
+
+    async def parse_resume(self, file_path: str, file_extension: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Parse resume and extract text and structured data.
+
+        `file_extension` selects the format for files stored without one
+        (e.g. content-addressed blobs).
+        """
         # Extract text from file
-        text = await self._extract_text(file_path)
+        with stage("parse", "extract_text"):
+            text, extraction = await self._extract_text(file_path, file_extension)
 
         # Parse structured data
-        structured_data = await self._parse_structured_data(text)
+        with stage("parse", "structure"):
+            structured_data = await self._parse_structured_data(text)
+        structured_data["extraction"] = extraction
 
         return text, structured_data
 
-    async def _extract_text(self, file_path: str) -> str:
-        """Extract text from PDF or DOCX file"""
-        file_extension = Path(file_path).suffix.lower()
+    async def _extract_text(self, file_path: str, file_extension: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Extract text from PDF or DOCX file.
 
-        try:
-            if file_extension == '.pdf':
-                text = pdf_extract_text(file_path)
-                # If text extraction failed (scanned PDF), use OCR
-                if not text.strip():
-                    text = await self._ocr_extract_text(file_path)
-            elif file_extension in ['.docx', '.doc']:
-                doc = Document(file_path)
-                text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            else:
-                raise ValueError(f"Unsupported file format: {file_extension}")
+        Also returns how the text was obtained (engine, pages, timing) so
+        slow or truncated documents are visible.
+        """
+        file_extension = (file_extension or Path(file_path).suffix).lower()
+        start = time.monotonic()
 
-            return text.strip()
+        if file_extension == '.doc':
+            raise ValueError("Legacy .doc files are not supported; save the resume as .docx or PDF")
+        if file_extension not in ('.pdf', '.docx'):
+            raise ValueError(f"Unsupported file format: {file_extension}")
+
+        try:
+            # Parsers read from a memory map instead of a buffered copy
+            with open_mapped(file_path) as document:
+                if file_extension == '.pdf':
+                    extraction = self.pdf_extractor.extract(document)
+                    text, info = extraction.text, extraction.info()
+                    if extraction.timed_out or extraction.truncated:
+                        print(f"PDF extraction stopped early for {file_path}: {info}")
+                else:
+                    text = self.docx_extractor.extract(document)
+                    info = {"engine": "docx-stream"}
+
+            # If text extraction failed (scanned PDF), use OCR
+            if file_extension == '.pdf' and not text.strip():
+                text, info["ocr"] = await self._ocr_extract_text(file_path)
 
         except Exception as e:
-            # Fallback to OCR if parsing fails
+            # A broken DOCX is not an image; only PDFs can be rescued by OCR
+            if file_extension != '.pdf':
+                raise ValueError(f"Could not read DOCX file: {e}")
             print(f"Text extraction failed, trying OCR: {e}")
-            return await self._ocr_extract_text(file_path)
-
-    async def _ocr_extract_text(self, file_path: str) -> str:
-        """Extract text using OCR (for scanned documents)"""
-        try:
-            # Convert PDF to images if needed
-            if file_path.endswith('.pdf'):
-                # This would require pdf2image library
-                # For now, return empty string as fallback
-                return ""
+            text, ocr_info = await self._ocr_extract_text(file_path)
+            info = {"engine": "ocr", "error": str(e), "ocr": ocr_info}
 
-            # OCR for image files
-            image = Image.open(file_path)
-            text = pytesseract.image_to_string(image)
-            return text.strip()
+        info["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+        if info["elapsed_ms"] > settings.TEXT_EXTRACTION_SLOW_MS:
+            print(f"Slow text extraction ({info['elapsed_ms']} ms) for {file_path}: {info}")
+        return text.strip(), info
 
+    async def _ocr_extract_text(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract text from a scanned PDF using OCR"""
+        try:
+            with stage("parse", "ocr"):
+                result = await self.ocr_service.extract_pdf_text(file_path)
+            return result.text.strip(), result.info()
         except Exception as e:
             print(f"OCR extraction failed: {e}")
-            return ""
+            return "", {"error": str(e)}
 
     async def _parse_structured_data(self, text: str) -> Dict[str, Any]:
         """Parse structured data from resume text"""
+        # One taxonomy version for the whole resume, even if a reload happens meanwhile
+        taxonomy = self.taxonomy.current()
+        # Experience, education, certifications, roles and summary come from one scan
+        fields = self.field_extractor.extract(text)
         structured_data = {
-            "skills": await self._extract_skills(text),
-            "experience_years": await self._extract_experience_years(text),
-            "education": await self._extract_education(text),
-            "certifications": await self._extract_certifications(text),
-            "previous_roles": await self._extract_previous_roles(text),
-            "summary": await self._extract_summary(text)
+            "skills": await self._extract_skills(text, taxonomy),
+            **fields._asdict(),
+            "taxonomy_version": taxonomy.version
         }
 
-        return structured_data
-
-    async def _extract_skills(self, text: str) -> List[str]:
-        """Extract technical skills from text"""
-        text_lower = text.lower()
-        found_skills = []
-
-        # Search for skills from database
-        for category, skills in self.skills_database.items():
-            for skill in skills:
-                # Use regex to find whole words
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill)
-
-        # Remove duplicates and return
-        return list(set(found_skills))
-
-    async def _extract_experience_years(self, text: str) -> int:
-        """Extract years of experience from text"""
-        # Look for patterns like "5 years of experience", "3+ years", etc.
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'(\d+)\+?\s*years?\s*experience',
-            r'experience\s*:?\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*exp',
-        ]
-
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            years.extend([int(match) for match in matches])
-
-        # Return the maximum years found, or 0 if none
-        return max(years) if years else 0
-
-    async def _extract_education(self, text: str) -> List[str]:
-        """Extract education information"""
-        education_keywords = [
-            "bachelor", "master", "phd", "doctorate", "mba", "bsc", "msc",
-            "bachelor's", "master's", "university", "college", "degree"
-        ]
-
-        education = []
-        lines = text.split('\n')
-
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in education_keywords):
-                # Clean and add the education line
-                clean_line = line.strip()
-                if clean_line and len(clean_line) > 10:  # Filter out short matches
-                    education.append(clean_line)
-
-        return education[:3]  # Return top 3 education entries
-
-    async def _extract_certifications(self, text: str) -> List[str]:
-        """Extract certifications"""
-        cert_patterns = [
-            r'certified\s+(.+?)(?:\n|$)',
-            r'certification\s*:?\s*(.+?)(?:\n|$)',
-            r'cert\.\s*(.+?)(?:\n|$)',
-        ]
-
-        certifications = []
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            certifications.extend([match.strip() for match in matches])
-
-        return certifications[:5]  # Return top 5 certifications
+        # Normalized features so scoring reduces to integer/bit arithmetic
+        structured_data["features"] = self.feature_service.resume_features(structured_data)
 
-    async def _extract_previous_roles(self, text: str) -> List[str]:
-        """Extract previous job roles/titles"""
-        # Common job title patterns
-        role_patterns = [
-            r'(software engineer|developer|programmer|analyst|manager|director|lead|senior|junior|intern)',
-            r'(data scientist|product manager|project manager|tech lead|architect|consultant)',
-            r'(designer|researcher|specialist|coordinator|administrator|executive)'
-        ]
-
-        roles = []
-        for pattern in role_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            roles.extend(matches)
-
-        # Remove duplicates and return
-        return list(set(roles))[:5]
-
-    async def _extract_summary(self, text: str) -> str:
-        """Extract summary/objective section"""
-        summary_keywords = ["summary", "objective", "profile", "about"]
-
-        lines = text.split('\n')
-        summary_lines = []
-        capturing = False
-
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-
-            # Check if this line starts a summary section
-            if any(keyword in line_lower for keyword in summary_keywords):
-                capturing = True
-                # Skip the header line itself
-                continue
-
-            if capturing:
-                # Stop capturing if we hit another section
-                if line.strip() and (
-                    line_lower.startswith(('experience', 'education', 'skills', 'work'))
-                    or line.isupper()
-                ):
-                    break
-
-                # Add non-empty lines to summary
-                if line.strip():
-                    summary_lines.append(line.strip())
-
-        summary_text = ' '.join(summary_lines)
-        # Return first 300 characters
-        return summary_text[:300] + "..." if len(summary_text) > 300 else summary_text
-
-    async def create_chunks(self, text: str, chunk_size: int = 400, overlap: int = 50) -> List[Dict[str, Any]]:
-        """Split resume text into chunks for embeddings"""
-        # Split text into sections first
-        sections = await self._split_into_sections(text)
-
-        chunks = []
-        for section_name, section_text in sections.items():
-            # Split each section into smaller chunks
-            words = section_text.split()
-            for i in range(0, len(words), chunk_size - overlap):
-                chunk_words = words[i:i + chunk_size]
-                chunk_text = ' '.join(chunk_words)
-
-                if len(chunk_text.strip()) > 50:  # Only include meaningful chunks
-                    chunks.append({
-                        "text": chunk_text,
-                        "type": section_name,
-                        "word_count": len(chunk_words)
-                    })
-
-        return chunks
-
-    async def _split_into_sections(self, text: str) -> Dict[str, str]:
-        """Split resume into logical sections"""
-        sections = {
-            "summary": "",
-            "experience": "",
-            "education": "",
-            "skills": "",
-            "other": ""
-        }
-
-        lines = text.split('\n')
-        current_section = "other"
-
-        section_keywords = {
-            "summary": ["summary", "objective", "profile", "about"],
-            "experience": ["experience", "work", "employment", "career", "professional"],
-            "education": ["education", "academic", "degree", "university", "college"],
-            "skills": ["skills", "technical", "competencies", "technologies", "tools"]
-        }
-
-        for line in lines:
-            line_clean = line.strip()
-            if not line_clean:
-                continue
-
-            line_lower = line_clean.lower()
-
-            # Check if this line indicates a new section
-            for section, keywords in section_keywords.items():
-                if any(keyword in line_lower for keyword in keywords):
-                    current_section = section
-                    break
-
-            # Add line to current section
-            sections[current_section] += line_clean + " "
-
-        # Clean up sections
-        for section in sections:
-            sections[section] = sections[section].strip()
+        return structured_data
 
-        return sections
\ No newline at end of file
+    async def _extract_skills(self, text: str, taxonomy: Optional[SkillTaxonomy] = None) -> List[str]:
+        """Canonical names of the taxonomy skills (or their synonyms) found in the text"""
+        return (taxonomy or self.taxonomy.current()).match(text)
+
+    def refresh_skills(
+        self,
+        text: str,
+        structured_data: Dict[str, Any],
+        taxonomy: Optional[SkillTaxonomy] = None
+    ) -> Dict[str, Any]:
+        """Structured data with skills re-extracted under the current taxonomy.
+
+        Only the skills and the features derived from them depend on the
+        taxonomy, so stored resume text is matched again without re-reading
+        the file. Data already at the current version is returned unchanged.
+        """
+        taxonomy = taxonomy or self.taxonomy.current()
+        if structured_data.get("taxonomy_version") == taxonomy.version:
+            return structured_data
+        refreshed = dict(structured_data)
+        refreshed["skills"] = taxonomy.match(text)
+        refreshed["taxonomy_version"] = taxonomy.version
+        refreshed["features"] = self.feature_service.resume_features(refreshed)
+        return refreshed
+
+    async def create_chunks(
+        self,
+        text: str,
+        chunk_size: Optional[int] = None,
+        overlap: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Split resume text into chunks for embeddings.
+
+        Sizes are in tokens and default to settings.CHUNK_SIZE / CHUNK_OVERLAP;
+        use `self.chunker.iter_chunks` to consume chunks lazily.
+        """
+        return list(self.chunker.iter_chunks(text, chunk_size, overlap))
@@ -0,0 +1,256 @@
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate, CandidateChunk
+from app.models.job import Job
+from app.services.scoring_service import ScoringService
+from app.services.search_service import InvertedIndex, tokenize
+from app.services.vector_compression import VectorCompressor, create_vector_compressor
+
+_RECONCILE_BATCH = 500  # Missing chunks loaded per query when a job is reconciled
+
+
+class VectorIndex:
+    """Exact top-k cosine search over an append-only set of vectors.
+
+    With a compressor, the index is stored compressed once it holds
+    fit_size vectors: the compressor is fitted on those, they are encoded,
+    and later vectors are encoded as they are folded in. Smaller indexes
+    stay in full precision.
+    """
+
+    def __init__(self, compressor: Optional[VectorCompressor] = None, fit_size: Optional[int] = None):
+        self.ids: List[int] = []
+        self._pending: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None  # Per-row scales of int8 codes
+        self.dimension: Optional[int] = None
+        self.compressor = compressor
+        self.fit_size = fit_size or settings.EMBEDDING_COMPRESSION_FIT_SIZE
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def compressed(self) -> bool:
+        return self.compressor is not None and self.compressor.fitted and self._matrix is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored vectors"""
+        matrix = self.matrix
+        return matrix.nbytes + (self._scales.nbytes if self._scales is not None else 0)
+
+    def add(self, doc_id: int, vector: Iterable[float]) -> bool:
+        """Add a vector; vectors of a different dimension are skipped"""
+        vector = np.asarray(vector, dtype=np.float32)
+        if self.dimension is None:
+            self.dimension = vector.shape[0]
+        if vector.shape != (self.dimension,):
+            return False
+        norm = np.linalg.norm(vector)
+        self._pending.append(vector / norm if norm else vector)
+        self.ids.append(doc_id)
+        return True
+
+    def _append(self, rows: np.ndarray, scales: Optional[np.ndarray]) -> None:
+        self._matrix = rows if self._matrix is None else np.vstack([self._matrix, rows])
+        if scales is not None:
+            self._scales = scales if self._scales is None else np.concatenate([self._scales, scales])
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Stored rows: unit vectors, or their encoded form once compressed"""
+        if self._pending:
+            pending = np.vstack(self._pending)
+            self._pending = []
+            if self.compressed:
+                self._append(*self.compressor.encode(pending))
+            else:
+                self._append(pending, None)
+                if self.compressor is not None and len(self.ids) >= self.fit_size:
+                    self._matrix, self._scales = self.compressor.fit(self._matrix).encode(self._matrix)
+        if self._matrix is None:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+        return self._matrix
+
+    def search(self, query: Iterable[float], k: int) -> List[Tuple[int, float]]:
+        matrix = self.matrix
+        query = np.asarray(query, dtype=np.float32)
+        if not len(self.ids) or query.shape != (self.dimension,):
+            return []
+        norm = np.linalg.norm(query)
+        query = query / norm if norm else query
+        if self.compressed:
+            scores = self.compressor.scores(matrix, self._scales, self.compressor.encode_query(query))
+        else:
+            scores = matrix @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+
+def reciprocal_rank_fusion(rankings: List[List[int]], rrf_k: int = 60) -> Dict[int, float]:
+    """Combine ranked ID lists: score(d) = sum over lists of 1 / (rrf_k + rank)"""
+    fused: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (rrf_k + rank)
+    return fused
+
+
+class HybridRetrievalService:
+    """Rank a job's candidates by fusing BM25 and vector retrieval over chunks.
+
+    Both indexes are per process, loaded per job on first use and refreshed
+    from the database by chunk ID watermark, with the same count and ID sum
+    check as CandidateSearchService for chunks committed out of ID order.
+    Vector indexes are append-only, so a job whose chunks were deleted is
+    dropped and loaded again.
+    """
+
+    def __init__(self, scoring_service: Optional[ScoringService] = None):
+        self.scoring_service = scoring_service or ScoringService()
+        self.lexical_index = InvertedIndex()
+        self.vector_indexes: Dict[int, VectorIndex] = {}
+        self.chunk_candidates: Dict[int, int] = {}
+        self.job_watermarks: Dict[int, int] = {}
+
+    def _add_chunk(
+        self, job_id: int, chunk_id: int, candidate_id: int, text: str, embedding, backend: Optional[str]
+    ) -> None:
+        self.lexical_index.add_document(chunk_id, text, job_id)
+        # Fallback vectors live in another space; the chunk stays lexical-only until re-embedded
+        if embedding and self.scoring_service.comparable(backend):
+            if job_id not in self.vector_indexes:
+                # Each job's vectors are a corpus of their own, with their own fitted compressor
+                self.vector_indexes[job_id] = VectorIndex(create_vector_compressor())
+            self.vector_indexes[job_id].add(chunk_id, embedding)
+        self.chunk_candidates[chunk_id] = candidate_id
+
+    def index_chunks(self, candidate: Candidate, chunks: List[CandidateChunk]) -> None:
+        """Index chunks of a freshly processed candidate if its job is loaded"""
+        if candidate.job_id not in self.job_watermarks:
+            return
+        for chunk in chunks:
+            if chunk.id not in self.chunk_candidates:
+                self._add_chunk(
+                    candidate.job_id, chunk.id, candidate.id, chunk.chunk_text,
+                    chunk.embedding_vector, chunk.embedding_backend
+                )
+
+    def _chunk_rows(self, db: Session, job_id: int):
+        return (
+            db.query(
+                CandidateChunk.id, CandidateChunk.candidate_id,
+                CandidateChunk.chunk_text, CandidateChunk.embedding_vector, CandidateChunk.embedding_backend
+            )
+            .join(Candidate, Candidate.id == CandidateChunk.candidate_id)
+            .filter(Candidate.job_id == job_id)
+        )
+
+    def _drop_job(self, job_id: int) -> None:
+        for chunk_id in list(self.lexical_index.documents(job_id)):
+            self.lexical_index.remove_document(chunk_id)
+            self.chunk_candidates.pop(chunk_id, None)
+        self.vector_indexes.pop(job_id, None)
+        self.job_watermarks.pop(job_id, None)
+
+    def _refresh_job(self, db: Session, job_id: int) -> None:
+        watermark = self.job_watermarks.get(job_id, 0)
+        rows = (
+            self._chunk_rows(db, job_id)
+            .filter(CandidateChunk.id > watermark)
+            .order_by(CandidateChunk.id)
+            .yield_per(1000)
+        )
+        for chunk_id, candidate_id, text, embedding, backend in rows:
+            if chunk_id not in self.chunk_candidates:
+                self._add_chunk(job_id, chunk_id, candidate_id, text, embedding, backend)
+            watermark = chunk_id
+        self.job_watermarks[job_id] = watermark
+
+        count, id_sum = (
+            db.query(func.count(CandidateChunk.id), func.sum(CandidateChunk.id))
+            .join(Candidate, Candidate.id == CandidateChunk.candidate_id)
+            .filter(Candidate.job_id == job_id)
+            .one()
+        )
+        indexed = self.lexical_index.documents(job_id)
+        if (count, int(id_sum or 0)) == (len(indexed), sum(indexed)):
+            return
+        stored = {chunk_id for (chunk_id,) in db.query(CandidateChunk.id).join(
+            Candidate, Candidate.id == CandidateChunk.candidate_id
+        ).filter(Candidate.job_id == job_id)}
+        if indexed - stored:
+            self._drop_job(job_id)
+            self._refresh_job(db, job_id)
+            return
+        missing = sorted(stored - indexed)
+        for start in range(0, len(missing), _RECONCILE_BATCH):
+            for chunk_id, candidate_id, text, embedding, backend in self._chunk_rows(db, job_id).filter(
+                CandidateChunk.id.in_(missing[start:start + _RECONCILE_BATCH])
+            ):
+                self._add_chunk(job_id, chunk_id, candidate_id, text, embedding, backend)
+
+    @staticmethod
+    def _job_query_terms(job: Job) -> List[str]:
+        requirements = job.requirements or {}
+        extra = " ".join(
+            (requirements.get("skills_required") or []) +
+            (requirements.get("skills_preferred") or []) +
+            (requirements.get("certifications") or [])
+        )
+        return [term for term, _, _ in tokenize(f"{job.title} {job.description} {extra}")]
+
+    def _candidate_ranking(self, chunk_hits: List[Tuple[int, float]]) -> List[int]:
+        """Collapse ranked chunks into ranked candidates (best chunk wins)"""
+        ranking = []
+        seen = set()
+        for chunk_id, _ in chunk_hits:
+            candidate_id = self.chunk_candidates.get(chunk_id)
+            if candidate_id is not None and candidate_id not in seen:
+                seen.add(candidate_id)
+                ranking.append(candidate_id)
+        return ranking
+
+    async def rank_job(
+        self,
+        db: Session,
+        job: Job,
+        limit: int = 20,
+        k: int = 100,
+        rrf_k: int = 60
+    ) -> List[Dict[str, Any]]:
+        """Top candidates for a job using reciprocal-rank fusion of top-k chunk hits"""
+        self._refresh_job(db, job.id)
+
+        lexical_hits = self.lexical_index.search(self._job_query_terms(job), groups=[job.id], limit=k)
+        vector_hits = []
+        vector_index = self.vector_indexes.get(job.id)
+        if vector_index is not None and len(vector_index):
+            job_embedding, backend = await self.scoring_service.embed_job(job)
+            if self.scoring_service.comparable(backend):  # A fallback query would rank noise
+                vector_hits = vector_index.search(job_embedding, k)
+
+        lexical_ranking = self._candidate_ranking(lexical_hits)
+        vector_ranking = self._candidate_ranking(vector_hits)
+        fused = reciprocal_rank_fusion([lexical_ranking, vector_ranking], rrf_k)
+
+        lexical_ranks = {cid: rank for rank, cid in enumerate(lexical_ranking, start=1)}
+        vector_ranks = {cid: rank for rank, cid in enumerate(vector_ranking, start=1)}
+        top = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            {
+                "candidate_id": candidate_id,
+                "fusion_score": round(score, 6),
+                "lexical_rank": lexical_ranks.get(candidate_id),
+                "vector_rank": vector_ranks.get(candidate_id)
+            }
+            for candidate_id, score in top
+        ]
@@ -1,17 +1,25 @@
-import httpx
+import hashlib
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import json
 
 from app.core.config import settings
+from app.core.metrics import embedding_fallbacks, record_cache
 from app.models.candidate import Candidate, CandidateChunk
 from app.models.job import Job
+from app.services.embedding_backends import create_embedding_backend
+from app.services.feature_service import FeatureService
 
 
 class ScoringService:
     def __init__(self):
-        self.api_key = settings.DEEPSEEK_API_KEY
-        self.base_url = settings.DEEPSEEK_BASE_URL
+        self.feature_service = FeatureService()
+        self.embedding_backend = create_embedding_backend(settings.EMBEDDING_BACKEND)
+        self.fallback_backend = (
+            create_embedding_backend(settings.EMBEDDING_FALLBACK)
+            if settings.EMBEDDING_FALLBACK and settings.EMBEDDING_FALLBACK != settings.EMBEDDING_BACKEND else None
+        )
+        self.job_embeddings: Dict[int, Tuple[str, List[float]]] = {}
 
         # Scoring weights
         self.weights = {
@@ -22,47 +30,77 @@ class ScoringService:
         }
 
     async def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding vector for text using DeepSeek API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "model": settings.EMBEDDING_MODEL,
-            "input": text
-        }
-
+        """Embedding vector for one text"""
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embedding vectors for a batch of texts, in order"""
+        embeddings, _ = await self._embed(texts)
+        return embeddings
+
+    async def embed_texts(self, texts: List[str]) -> Tuple[List[List[float]], str]:
+        """Embedding vectors for a batch of texts and the backend that produced them"""
+        return await self._embed(texts)
+
+    async def _embed(self, texts: List[str]) -> Tuple[List[List[float]], str]:
+        """Embeddings and the name of the backend they came from"""
+        if not texts:
+            return [], self.embedding_backend.name
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/embeddings",
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result["data"][0]["embedding"]
-
+            return await self.embedding_backend.embed_batch(texts), self.embedding_backend.name
         except Exception as e:
-            print(f"Embedding generation failed: {e}")
-            # Return a random embedding as fallback
-            return np.random.normal(0, 0.1, 1536).tolist()
+            if self.fallback_backend is None:
+                raise
+            print(f"Embedding generation failed, using the {self.fallback_backend.name} backend: {e}")
+            embedding_fallbacks.labels(backend=self.fallback_backend.name).inc(len(texts))
+            return await self.fallback_backend.embed_batch(texts), self.fallback_backend.name
+
+    def comparable(self, backend: Optional[str], other: Optional[str] = None) -> bool:
+        """Whether vectors of two backends share a space; None is the primary backend.
+
+        Chunks stored before the backend was recorded count as primary.
+        """
+        primary = self.embedding_backend.name
+        return (backend or primary) == (other or primary)
+
+    async def embed_job(self, job: Job) -> Tuple[List[float], str]:
+        """Job description embedding and its backend, cached until the description changes"""
+        digest = hashlib.sha256(job.description.encode("utf-8")).hexdigest()
+        cached = self.job_embeddings.get(job.id)
+        record_cache("job_embedding", bool(cached and cached[0] == digest))
+        if cached and cached[0] == digest:
+            return cached[1], self.embedding_backend.name
+        embeddings, backend = await self._embed([job.description])
+        if job.id is not None and backend == self.embedding_backend.name:  # Retry the primary backend next time
+            self.job_embeddings[job.id] = (digest, embeddings[0])
+        return embeddings[0], backend
+
+    async def get_job_embedding(self, job: Job) -> List[float]:
+        """Job description embedding, cached until the description changes"""
+        return (await self.embed_job(job))[0]
 
     async def calculate_candidate_score(
         self,
         candidate: Candidate,
         job: Job,
-        chunks: List[CandidateChunk]
-    ) -> Dict[str, float]:
-        """Calculate comprehensive candidate score"""
+        chunks: List[CandidateChunk],
+        job_embedding: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """Calculate comprehensive candidate score.
+
+        A job_embedding passed in must come from the primary backend. The
+        breakdown's semantic_unavailable is set when no chunk could be
+        compared with the job (see score_candidates).
+        """
 
         # Generate job description embedding
-        job_embedding = await self.generate_embedding(job.description)
+        backend = None
+        if job_embedding is None:
+            job_embedding, backend = await self.embed_job(job)
 
-        # Calculate semantic similarity
-        semantic_score = await self._calculate_semantic_similarity(chunks, job_embedding)
+        # Calculate semantic similarity, skipping chunks embedded in another vector space
+        comparable_chunks = [chunk for chunk in chunks if self.comparable(chunk.embedding_backend, backend)]
+        semantic_score = await self._calculate_semantic_similarity(comparable_chunks, job_embedding)
 
         # Calculate keyword overlap
         keyword_score = await self._calculate_keyword_overlap(candidate, job)
@@ -86,7 +124,8 @@ class ScoringService:
             "keyword_overlap": round(keyword_score, 3),
             "experience_match": round(experience_score, 3),
             "education_match": round(education_score, 3),
-            "total_weighted_score": round(total_score, 3)
+            "total_weighted_score": round(total_score, 3),
+            "semantic_unavailable": bool(chunks) and not comparable_chunks
         }
 
     async def _calculate_semantic_similarity(
@@ -124,24 +163,24 @@ class ScoringService:
     async def _calculate_keyword_overlap(self, candidate: Candidate, job: Job) -> float:
         """Calculate keyword overlap score"""
         try:
-            job_requirements = job.requirements or {}
-            candidate_data = candidate.structured_data or {}
+            job_features = self.feature_service.job_features(job)
+            candidate_bits = self.feature_service.decode_bits(
+                self.feature_service.candidate_features(candidate)["skill_bits"]
+            )
 
-            required_skills = set(skill.lower() for skill in job_requirements.get("skills_required", []))
-            preferred_skills = set(skill.lower() for skill in job_requirements.get("skills_preferred", []))
-            candidate_skills = set(skill.lower() for skill in candidate_data.get("skills", []))
+            total_required = job_features["required_count"]
+            total_preferred = job_features["preferred_count"]
 
-            if not (required_skills or preferred_skills):
+            if not (total_required or total_preferred):
                 return 0.5  # Neutral score if no specific skills required
 
             # Calculate overlap scores
-            required_overlap = len(candidate_skills.intersection(required_skills))
-            preferred_overlap = len(candidate_skills.intersection(preferred_skills))
+            required_bits = self.feature_service.decode_bits(job_features["required_bits"])
+            preferred_bits = self.feature_service.decode_bits(job_features["preferred_bits"])
+            required_overlap = (candidate_bits & required_bits).bit_count()
+            preferred_overlap = (candidate_bits & preferred_bits).bit_count()
 
             # Weight required skills more heavily
-            total_required = len(required_skills)
-            total_preferred = len(preferred_skills)
-
             required_score = required_overlap / total_required if total_required > 0 else 1.0
             preferred_score = preferred_overlap / total_preferred if total_preferred > 0 else 1.0
 
@@ -155,24 +194,14 @@ class ScoringService:
     async def _calculate_experience_match(self, candidate: Candidate, job: Job) -> float:
         """Calculate experience match score"""
         try:
-            job_requirements = job.requirements or {}
-            candidate_data = candidate.structured_data or {}
-
-            required_years = job_requirements.get("min_experience_years", 0)
-            candidate_years = candidate_data.get("experience_years", 0)
+            required_years = self.feature_service.job_features(job)["min_experience_years"]
+            candidate_years = self.feature_service.candidate_features(candidate)["experience_years"]
 
             if required_years == 0:
                 return 1.0  # Perfect score if no specific experience required
 
-            # Calculate score based on experience ratio
-            if candidate_years >= required_years:
-                # Bonus for having more experience, but diminishing returns
-                excess_years = candidate_years - required_years
-                bonus = min(excess_years * 0.1, 0.3)  # Max 30% bonus
-                return min(1.0 + bonus, 1.0)
-            else:
-                # Penalty for having less experience
-                return candidate_years / required_years
+            # Full score once the requirement is met, proportional penalty below it
+            return min(candidate_years / required_years, 1.0)
 
         except Exception as e:
             print(f"Experience match calculation failed: {e}")
@@ -181,35 +210,12 @@ class ScoringService:
     async def _calculate_education_match(self, candidate: Candidate, job: Job) -> float:
         """Calculate education match score"""
         try:
-            job_requirements = job.requirements or {}
-            candidate_data = candidate.structured_data or {}
-
-            required_education = job_requirements.get("education_level", "").lower()
-            candidate_education = candidate_data.get("education", [])
+            required_level = self.feature_service.job_features(job)["education_level"]
+            candidate_level = self.feature_service.candidate_features(candidate)["education_level"]
 
-            if not required_education or required_education == "any":
+            if required_level == 0:
                 return 1.0  # Perfect score if no specific education required
 
-            # Education hierarchy
-            education_levels = {
-                "high school": 1,
-                "associate": 2,
-                "bachelor": 3,
-                "master": 4,
-                "phd": 5,
-                "doctorate": 5
-            }
-
-            required_level = education_levels.get(required_education, 0)
-
-            # Check candidate's highest education level
-            candidate_level = 0
-            for edu in candidate_education:
-                edu_lower = edu.lower()
-                for level_name, level_value in education_levels.items():
-                    if level_name in edu_lower:
-                        candidate_level = max(candidate_level, level_value)
-
             if candidate_level >= required_level:
                 return 1.0
             elif candidate_level > 0:
@@ -221,29 +227,111 @@ class ScoringService:
             print(f"Education match calculation failed: {e}")
             return 0.0
 
-    async def calculate_similarity_matrix(self, candidates: List[Candidate], job: Job) -> Dict[str, Any]:
-        """Calculate similarity matrix for ranking candidates"""
-        try:
-            scores = []
-            for candidate in candidates:
-                score_data = {
-                    "candidate_id": candidate.id,
-                    "name": candidate.name,
-                    "total_score": candidate.total_score,
-                    "breakdown": candidate.score_breakdown
-                }
-                scores.append(score_data)
-
-            # Sort by total score
-            scores.sort(key=lambda x: x["total_score"], reverse=True)
-
-            return {
-                "job_id": job.id,
-                "candidate_scores": scores,
-                "total_candidates": len(candidates),
-                "average_score": sum(s["total_score"] for s in scores) / len(scores) if scores else 0
-            }
-
-        except Exception as e:
-            print(f"Similarity matrix calculation failed: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+    async def score_candidates(
+        self,
+        candidates: List[Candidate],
+        job: Job,
+        chunks_by_candidate: Dict[int, List[CandidateChunk]],
+        job_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Score many candidates against one job without touching their records.
+
+        Produces the same breakdown as calculate_candidate_score, but embeds
+        the job once and computes the structured components in one batch.
+        semantic_unavailable is set when a candidate has chunks but none of
+        them share the job embedding's space (e.g. fallback vectors), so its
+        semantic score of 0 says nothing about the resume.
+        """
+        if not candidates:
+            return []
+        backend = None
+        if job_embedding is None:
+            job_embedding, backend = await self.embed_job(job)
+
+        job_vector = np.asarray(job_embedding, dtype=float)
+        job_norm = np.linalg.norm(job_vector)
+        structured = self.calculate_structured_scores(candidates, job)
+
+        breakdowns = []
+        for candidate, (keyword_score, experience_score, education_score) in zip(candidates, structured):
+            candidate_chunks = chunks_by_candidate.get(candidate.id, [])
+            vectors = [
+                chunk.embedding_vector for chunk in candidate_chunks
+                if chunk.embedding_vector and len(chunk.embedding_vector) == len(job_vector)
+                and self.comparable(chunk.embedding_backend, backend)
+            ]
+            semantic_score = 0.0
+            if vectors and job_norm:
+                matrix = np.asarray(vectors, dtype=float)
+                norms = np.linalg.norm(matrix, axis=1)
+                norms[norms == 0] = 1.0
+                similarities = np.sort(matrix @ job_vector / (norms * job_norm))[::-1][:3]
+                semantic_score = float(similarities.mean())
+
+            total_score = (
+                semantic_score * self.weights["semantic_similarity"] +
+                keyword_score * self.weights["keyword_overlap"] +
+                experience_score * self.weights["experience_match"] +
+                education_score * self.weights["education_match"]
+            )
+            breakdowns.append({
+                "semantic_similarity": round(semantic_score, 3),
+                "keyword_overlap": round(float(keyword_score), 3),
+                "experience_match": round(float(experience_score), 3),
+                "education_match": round(float(education_score), 3),
+                "total_weighted_score": round(float(total_score), 3),
+                "semantic_unavailable": bool(candidate_chunks) and not vectors
+            })
+        return breakdowns
+
+    def calculate_structured_scores(self, candidates: List[Candidate], job: Job) -> np.ndarray:
+        """Keyword, experience and education scores for many candidates at once.
+
+        Returns an (n, 3) array with the same values as the per-candidate
+        methods, computed with vectorized bit and integer arithmetic.
+        """
+        job_features = self.feature_service.job_features(job)
+        features = [self.feature_service.candidate_features(c) for c in candidates]
+        if not features:
+            return np.zeros((0, 3))
+
+        skill_matrix = self.feature_service.pack_bitsets(
+            [self.feature_service.decode_bits(f["skill_bits"]) for f in features]
+        )
+        required_mask, preferred_mask = self.feature_service.pack_bitsets([
+            self.feature_service.decode_bits(job_features["required_bits"]),
+            self.feature_service.decode_bits(job_features["preferred_bits"])
+        ])
+
+        # Keyword overlap: popcount of candidate bits AND job masks
+        total_required = job_features["required_count"]
+        total_preferred = job_features["preferred_count"]
+        if total_required or total_preferred:
+            required_overlap = np.unpackbits(skill_matrix & required_mask, axis=1).sum(axis=1)
+            preferred_overlap = np.unpackbits(skill_matrix & preferred_mask, axis=1).sum(axis=1)
+            required_score = required_overlap / total_required if total_required else 1.0
+            preferred_score = preferred_overlap / total_preferred if total_preferred else 1.0
+            keyword = required_score * 0.7 + preferred_score * 0.3 + np.zeros(len(features))
+        else:
+            keyword = np.full(len(features), 0.5)
+
+        # Experience match
+        years = np.array([f["experience_years"] for f in features], dtype=float)
+        required_years = job_features["min_experience_years"]
+        if required_years:
+            experience = np.minimum(years / required_years, 1.0)
+        else:
+            experience = np.ones(len(features))
+
+        # Education match
+        levels = np.array([f["education_level"] for f in features], dtype=float)
+        required_level = job_features["education_level"]
+        if required_level:
+            education = np.where(
+                levels >= required_level, 1.0,
+                np.where(levels > 0, levels / required_level, 0.3)
+            )
+        else:
+            education = np.ones(len(features))
+
+        return np.column_stack([keyword, experience, education])
@@ -0,0 +1,333 @@
+import html
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterable
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+
+from app.models.candidate import Candidate
+from app.models.job import Job
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*", re.IGNORECASE)
+QUERY_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+_RECONCILE_BATCH = 500  # Missing candidates loaded per query when a job is reconciled
+
+
+def tokenize(text: str) -> List[Tuple[str, int, int]]:
+    """Lowercase terms with their character offsets"""
+    return [(m.group().lower(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """Split a query into free terms and quoted phrases"""
+    terms, phrases = [], []
+    for match in QUERY_PATTERN.finditer(query):
+        if match.group(1):
+            phrase = [term for term, _, _ in tokenize(match.group(1))]
+            if len(phrase) == 1:
+                terms.extend(phrase)
+            elif phrase:
+                phrases.append(phrase)
+        else:
+            terms.extend(term for term, _, _ in tokenize(match.group(2)))
+    return terms, phrases
+
+
+class InvertedIndex:
+    """Positional inverted index with BM25 ranking.
+
+    Documents belong to a group (e.g. a job) and postings are kept per
+    group, so searches scoped to some groups never walk the postings of
+    documents in other groups. Scoped searches also take document
+    frequencies and lengths from those groups only, so scores do not
+    depend on which other groups happen to be loaded.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, Dict[int, List[int]]]] = defaultdict(dict)  # term -> group -> doc -> positions
+        self.doc_freqs: Dict[str, int] = defaultdict(int)
+        self.doc_lengths: Dict[int, int] = {}
+        self.doc_groups: Dict[int, int] = {}
+        self.doc_terms: Dict[int, Set[str]] = {}
+        self.group_docs: Dict[int, Set[int]] = defaultdict(set)
+        self.group_lengths: Dict[int, int] = defaultdict(int)
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self.doc_lengths
+
+    def documents(self, group: int) -> Set[int]:
+        return self.group_docs.get(group, set())
+
+    def add_document(self, doc_id: int, text: str, group: int = 0) -> None:
+        if doc_id in self.doc_lengths:
+            self.remove_document(doc_id)
+
+        positions: Dict[str, List[int]] = defaultdict(list)
+        tokens = tokenize(text or "")
+        for position, (term, _, _) in enumerate(tokens):
+            positions[term].append(position)
+
+        for term, term_positions in positions.items():
+            self.postings[term].setdefault(group, {})[doc_id] = term_positions
+            self.doc_freqs[term] += 1
+        self.doc_lengths[doc_id] = len(tokens)
+        self.doc_groups[doc_id] = group
+        self.doc_terms[doc_id] = set(positions)
+        self.group_docs[group].add(doc_id)
+        self.group_lengths[group] += len(tokens)
+        self.total_length += len(tokens)
+
+    def remove_document(self, doc_id: int) -> None:
+        group = self.doc_groups.pop(doc_id, None)
+        for term in self.doc_terms.pop(doc_id, ()):
+            groups = self.postings.get(term, {})
+            postings = groups.get(group)
+            if postings is not None and postings.pop(doc_id, None) is not None:
+                if not postings:
+                    del groups[group]
+                if not groups:
+                    del self.postings[term]
+                self.doc_freqs[term] -= 1
+                if not self.doc_freqs[term]:
+                    del self.doc_freqs[term]
+        length = self.doc_lengths.pop(doc_id, 0)
+        self.total_length -= length
+        if group is not None:
+            self.group_docs[group].discard(doc_id)
+            self.group_lengths[group] -= length
+            if not self.group_docs[group]:
+                del self.group_docs[group]
+                del self.group_lengths[group]
+
+    @staticmethod
+    def _idf(df: int, n: int) -> float:
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def _positions(self, term: str, doc_id: int) -> Optional[List[int]]:
+        return self.postings.get(term, {}).get(self.doc_groups.get(doc_id), {}).get(doc_id)
+
+    def _phrase_positions(self, doc_id: int, phrase: List[str]) -> List[int]:
+        """Start positions of the phrase within the document"""
+        first = self._positions(phrase[0], doc_id)
+        if not first:
+            return []
+        following = []
+        for term in phrase[1:]:
+            positions = self._positions(term, doc_id)
+            if not positions:
+                return []
+            following.append(set(positions))
+        return [
+            start for start in first
+            if all(start + offset + 1 in positions for offset, positions in enumerate(following))
+        ]
+
+    def search(
+        self,
+        terms: List[str],
+        phrases: Optional[List[List[str]]] = None,
+        groups: Optional[Iterable[int]] = None,
+        limit: int = 20
+    ) -> List[Tuple[int, float]]:
+        """Rank documents by BM25 over all query terms; every phrase must match"""
+        phrases = phrases or []
+        allowed = set(groups) if groups is not None else None
+        if allowed is None:
+            n, total_length = len(self.doc_lengths), self.total_length
+        else:
+            allowed &= set(self.group_docs)
+            n = sum(len(self.group_docs[group]) for group in allowed)
+            total_length = sum(self.group_lengths[group] for group in allowed)
+        if not n:
+            return []
+        avg_length = total_length / n or 1.0
+
+        scores: Dict[int, float] = defaultdict(float)
+        query_terms = list(dict.fromkeys(terms + [term for phrase in phrases for term in phrase]))
+        for term in query_terms:
+            groups_postings = self.postings.get(term)
+            if not groups_postings:
+                continue
+            if allowed is None:
+                selected = list(groups_postings.values())
+                idf = self._idf(self.doc_freqs[term], n)
+            else:
+                selected = [groups_postings[group] for group in allowed if group in groups_postings]
+                idf = self._idf(sum(len(postings) for postings in selected), n)
+            for postings in selected:
+                for doc_id, positions in postings.items():
+                    tf = len(positions)
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if phrases:
+            scores = {
+                doc_id: score for doc_id, score in scores.items()
+                if all(self._phrase_positions(doc_id, phrase) for phrase in phrases)
+            }
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def highlight_snippets(
+    text: str,
+    terms: List[str],
+    phrases: List[List[str]],
+    max_snippets: int = 3,
+    window: int = 80
+) -> List[str]:
+    """Short HTML excerpts around query matches, with matches wrapped in <mark>.
+
+    Resume text is untrusted: every segment is escaped before the tags
+    are added.
+    """
+    tokens = tokenize(text)
+    wanted = set(terms)
+    spans = [(start, end) for term, start, end in tokens if term in wanted]
+    for phrase in phrases:
+        for i in range(len(tokens) - len(phrase) + 1):
+            if all(tokens[i + j][0] == phrase[j] for j in range(len(phrase))):
+                spans.append((tokens[i][1], tokens[i + len(phrase) - 1][2]))
+    spans.sort()
+
+    snippets = []
+    last_end = -1
+    for start, end in spans:
+        if start < last_end:
+            continue
+        left = max(0, start - window)
+        right = min(len(text), end + window)
+        marked = [(s, e) for s, e in spans if s >= left and e <= right]
+        parts, cursor = [], left
+        for s, e in marked:
+            if s < cursor:
+                continue
+            parts.append(html.escape(text[cursor:s]))
+            parts.append(f"<mark>{html.escape(text[s:e])}</mark>")
+            cursor = e
+        parts.append(html.escape(text[cursor:right]))
+        snippet = " ".join("".join(parts).split())
+        snippets.append(("..." if left > 0 else "") + snippet + ("..." if right < len(text) else ""))
+        last_end = right
+        if len(snippets) >= max_snippets:
+            break
+    return snippets
+
+
+class CandidateSearchService:
+    """Keyword search over candidate resume text.
+
+    The index lives in process memory. Each job is loaded on first use and
+    then kept current: uploads are indexed directly, and every search picks
+    up rows written by other workers since the last refresh. IDs are
+    assigned at insert but become visible at commit, so a lower ID can
+    appear after the watermark passed it; a per-job count and ID sum
+    check catches those (and deleted rows) and reconciles the job.
+    """
+
+    def __init__(self):
+        self.index = InvertedIndex()
+        self.job_watermarks: Dict[int, int] = {}
+
+    def index_candidate(self, candidate: Candidate) -> None:
+        # The watermark is left alone so rows from other workers are not skipped
+        self.index.add_document(candidate.id, candidate.resume_text, candidate.job_id)
+
+    def _add_rows(self, rows) -> None:
+        for candidate_id, candidate_job_id, resume_text in rows:
+            self.index.add_document(candidate_id, resume_text, candidate_job_id)
+
+    def _refresh_jobs(self, db: Session, job_ids: List[int]) -> None:
+        if not job_ids:
+            return
+        # One query for all jobs, each past its own watermark
+        watermark = case(
+            {job_id: self.job_watermarks.get(job_id, -1) for job_id in job_ids},
+            value=Candidate.job_id, else_=-1
+        )
+        rows = (
+            db.query(Candidate.id, Candidate.job_id, Candidate.resume_text)
+            .filter(Candidate.job_id.in_(job_ids), Candidate.id > watermark)
+            .order_by(Candidate.id)
+            .all()
+        )
+        self._add_rows(rows)
+        for job_id in job_ids:
+            self.job_watermarks.setdefault(job_id, 0)
+        for candidate_id, job_id, _ in rows:
+            self.job_watermarks[job_id] = max(self.job_watermarks[job_id], candidate_id)
+
+        # (count, sum of IDs) per job: cheap to aggregate, changes with any missed insert or delete
+        checksums = {
+            job_id: (count, int(id_sum or 0))
+            for job_id, count, id_sum in db.query(Candidate.job_id, func.count(Candidate.id), func.sum(Candidate.id))
+            .filter(Candidate.job_id.in_(job_ids))
+            .group_by(Candidate.job_id)
+            .all()
+        }
+        for job_id in job_ids:
+            indexed = self.index.documents(job_id)
+            if checksums.get(job_id, (0, 0)) == (len(indexed), sum(indexed)):
+                continue
+            stored = {candidate_id for (candidate_id,) in db.query(Candidate.id).filter(Candidate.job_id == job_id)}
+            for candidate_id in indexed - stored:
+                self.index.remove_document(candidate_id)
+            missing = sorted(stored - indexed)
+            for start in range(0, len(missing), _RECONCILE_BATCH):
+                self._add_rows(
+                    db.query(Candidate.id, Candidate.job_id, Candidate.resume_text)
+                    .filter(Candidate.id.in_(missing[start:start + _RECONCILE_BATCH]))
+                    .all()
+                )
+
+    async def search(
+        self,
+        db: Session,
+        user_id: int,
+        query: str,
+        job_id: Optional[int] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        job_query = db.query(Job.id).filter(Job.created_by == user_id)
+        if job_id is not None:
+            job_query = job_query.filter(Job.id == job_id)
+        job_ids = [row[0] for row in job_query.all()]
+        if job_id is not None and not job_ids:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        terms, phrases = parse_query(query)
+        if not (terms or phrases):
+            raise HTTPException(status_code=400, detail="Empty search query")
+
+        self._refresh_jobs(db, job_ids)
+        hits = self.index.search(terms, phrases, groups=job_ids, limit=limit)
+        if not hits:
+            return []
+
+        candidates = {
+            c.id: c for c in db.query(Candidate).filter(Candidate.id.in_([doc_id for doc_id, _ in hits])).all()
+        }
+        results = []
+        for doc_id, score in hits:
+            candidate = candidates.get(doc_id)
+            if candidate is None:
+                continue
+            results.append({
+                "candidate_id": candidate.id,
+                "job_id": candidate.job_id,
+                "name": candidate.name,
+                "total_score": candidate.total_score,
+                "search_score": round(score, 4),
+                "snippets": highlight_snippets(candidate.resume_text, terms, phrases)
+            })
+        return results
@@ -0,0 +1,211 @@
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skills_taxonomy.json"
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(term: str) -> str:
+    return _WHITESPACE.sub(" ", term.strip().lower())
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Regex alternation of the terms, factored by shared prefixes.
+
+    A flat alternation tries every term at every position; the trie form
+    tries at most one branch per character, and greedy optional suffixes
+    prefer the longest term ("javascript" over "java").
+    """
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class SkillVocabulary:
+    """Stable mapping between skill names and integer IDs.
+
+    Aliases (synonyms) resolve to the ID of their canonical skill but never
+    get an ID of their own.
+    """
+
+    def __init__(self, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for skill in skills:
+            key = skill.lower()
+            if key not in self.ids:
+                self.ids[key] = len(self.names)
+                self.names.append(key)
+        self.aliases = {alias.lower(): name.lower() for alias, name in (aliases or {}).items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        key = _normalize(skill)
+        key = self.aliases.get(key, key)
+        return key if key in self.ids else None
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        name = self.canonical(skill)
+        return None if name is None else self.ids[name]
+
+    def to_bitset(self, skills: Iterable[str]) -> int:
+        """Encode skill names as an integer bitset (unknown skills are ignored)"""
+        bits = 0
+        for skill in skills:
+            skill_id = self.skill_id(skill)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def from_bitset(self, bits: int) -> List[str]:
+        return [name for skill_id, name in enumerate(self.names) if bits >> skill_id & 1]
+
+
+class SkillTaxonomy:
+    """One version of the skills taxonomy, compiled for matching.
+
+    Each skill has a canonical name, a display label, categories and
+    synonyms. IDs must be 0..n-1 in file order; they index the skill
+    bitsets stored on candidates and jobs, so skills may only ever be
+    appended.
+    """
+
+    def __init__(self, version: str, skills: List[Dict[str, Any]]):
+        self.version = str(version)
+        self.labels: Dict[str, str] = {}
+        self.categories: Dict[str, List[str]] = {}
+        self.surface_forms: Dict[str, str] = {}  # Normalized name or synonym -> canonical name
+        aliases: Dict[str, str] = {}
+
+        for position, skill in enumerate(skills):
+            name = _normalize(skill["name"])
+            if skill.get("id", position) != position:
+                raise ValueError(f"Skill '{name}' has id {skill.get('id')}, expected {position}")
+            self.labels[name] = skill.get("label") or name
+            for category in skill.get("categories") or []:
+                self.categories.setdefault(category, []).append(name)
+            for form in [name] + [_normalize(synonym) for synonym in skill.get("synonyms") or []]:
+                owner = self.surface_forms.setdefault(form, name)
+                if owner != name:
+                    raise ValueError(f"'{form}' is listed for both '{owner}' and '{name}'")
+                if form != name:
+                    aliases[form] = name
+
+        self.vocabulary = SkillVocabulary(list(self.labels), aliases)
+        # Whole terms only: not preceded by a word character, not followed by
+        # one or by "+"/"#" (so "c" never matches inside "c++" or "c#")
+        self._pattern = re.compile(r"(?<!\w)" + _trie_pattern(self.surface_forms) + r"(?![\w+#])")
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillTaxonomy":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data.get("skills"), list) or "version" not in data:
+            raise ValueError(f"{path} is not a skills taxonomy: 'version' and 'skills' are required")
+        return cls(data["version"], data["skills"])
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    def match(self, text: str) -> List[str]:
+        """Canonical names of the skills mentioned in the text, in ID order"""
+        found = {
+            self.surface_forms[_normalize(match.group())]
+            for match in self._pattern.finditer(text.lower())
+        }
+        return sorted(found, key=self.vocabulary.ids.__getitem__)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        return self.vocabulary.canonical(skill)
+
+    def label(self, skill: str) -> str:
+        name = self.canonical(skill)
+        return self.labels[name] if name else skill
+
+    def check_successor(self, previous: "SkillTaxonomy") -> None:
+        """Raise ValueError unless this version only appends to `previous`"""
+        for skill_id, name in enumerate(previous.vocabulary.names):
+            if skill_id >= len(self) or self.vocabulary.names[skill_id] != name:
+                current = self.vocabulary.names[skill_id] if skill_id < len(self) else None
+                raise ValueError(
+                    f"Skill id {skill_id} was '{name}' in version {previous.version} and is "
+                    f"{current!r} in version {self.version}; skills can only be appended"
+                )
+
+
+class TaxonomyStore:
+    """Process-wide holder of the current taxonomy with hot reload.
+
+    A reload compiles the new version completely before swapping a single
+    reference, so readers see either the old or the new taxonomy, never a
+    mix. Callers take `current()` once per operation and use that object
+    throughout. The file's mtime is also polled every `check_interval`
+    seconds, which brings every worker process to the new version after
+    the file is replaced.
+    """
+
+    def __init__(self, path: Optional[str] = None, check_interval: Optional[float] = None):
+        self.path = str(path or settings.SKILLS_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH)
+        self.check_interval = settings.TAXONOMY_CHECK_INTERVAL_SECONDS if check_interval is None else check_interval
+        self._taxonomy: Optional[SkillTaxonomy] = None
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> SkillTaxonomy:
+        taxonomy = self._taxonomy
+        if taxonomy is None:
+            return self.reload()
+        if self.check_interval > 0 and time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            try:
+                if os.stat(self.path).st_mtime_ns != self._mtime:
+                    taxonomy = self.reload()
+            except (OSError, ValueError) as e:
+                print(f"Skills taxonomy reload failed, keeping version {taxonomy.version}: {e}")
+        return taxonomy
+
+    def reload(self) -> SkillTaxonomy:
+        """Load and compile the taxonomy file, then make it current.
+
+        Raises OSError or ValueError (leaving the current version in place)
+        if the file is unreadable, invalid or renumbers existing skills.
+        """
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            taxonomy = SkillTaxonomy.from_file(self.path)
+            if self._taxonomy is not None:
+                taxonomy.check_successor(self._taxonomy)
+                if taxonomy.version != self._taxonomy.version:
+                    print(f"Skills taxonomy updated: {self._taxonomy.version} -> {taxonomy.version}")
+            self._taxonomy, self._mtime = taxonomy, mtime
+            self._checked_at = time.monotonic()
+            return taxonomy
+
+
+taxonomy_store = TaxonomyStore()
@@ -0,0 +1,311 @@
+import json
+import os
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate, CandidateChunk
+from app.models.job import Job
+from app.services.retrieval_service import VectorIndex
+from app.services.scoring_service import ScoringService
+
+try:
+    import faiss
+except ImportError:  # Fall back to exact NumPy search
+    faiss = None
+
+_RECONCILE_BATCH = 500  # Missing candidates loaded per query when a pool is reconciled
+_MAX_REMOVED_FRACTION = 0.25  # Rebuild a pool once this share of its entries was removed
+
+
+class CandidatePoolIndex:
+    """Candidate-level vectors for one user's jobs.
+
+    Each candidate is represented by the normalized mean of its chunk
+    embeddings. With faiss installed the vectors live in an HNSW graph
+    (approximate inner-product search); otherwise an exact VectorIndex is used.
+    Neither supports deletion, so removed candidates are kept as
+    tombstones, filtered from results, until the pool is rebuilt.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.candidate_ids: List[int] = []
+        self.job_ids: List[int] = []
+        self.known: set = set()
+        self.removed: set = set()  # Tombstones of deleted candidates
+        self.watermark = 0  # Highest chunk ID already folded into the index
+        if faiss is not None:
+            self.index = faiss.IndexHNSWFlat(dimension, settings.TALENT_POOL_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        else:
+            self.index = VectorIndex()
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids) - len(self.removed)
+
+    @property
+    def live(self) -> set:
+        return self.known - self.removed
+
+    def remove(self, candidate_ids) -> None:
+        self.removed.update(set(candidate_ids) & self.known)
+
+    def add(self, candidate_ids: List[int], job_ids: List[int], vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if faiss is not None:
+            self.index.add(vectors)
+        else:
+            for position, vector in enumerate(vectors, start=len(self.candidate_ids)):
+                self.index.add(position, vector)
+        self.candidate_ids.extend(candidate_ids)
+        self.job_ids.extend(job_ids)
+        self.known.update(candidate_ids)
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[int, int, float]]:
+        """Top-k (candidate_id, job_id, similarity) for a normalized query"""
+        if not len(self):
+            return []
+        k = min(k + len(self.removed), len(self.candidate_ids))
+        if faiss is not None:
+            self.index.hnsw.efSearch = max(settings.TALENT_POOL_EF_SEARCH, k)
+            scores, positions = self.index.search(query.reshape(1, -1).astype(np.float32), k)
+            hits = [(int(p), float(s)) for p, s in zip(positions[0], scores[0]) if p >= 0]
+        else:
+            hits = self.index.search(query, k)
+        return [
+            (self.candidate_ids[p], self.job_ids[p], score) for p, score in hits
+            if self.candidate_ids[p] not in self.removed
+        ]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if faiss is not None:
+            faiss.write_index(self.index, f"{path}.index.tmp")
+            os.replace(f"{path}.index.tmp", f"{path}.index")
+        else:
+            with open(f"{path}.npy.tmp", "wb") as f:
+                np.save(f, self.index.matrix)
+            os.replace(f"{path}.npy.tmp", f"{path}.npy")
+
+        meta = {
+            "dimension": self.dimension,
+            "watermark": self.watermark,
+            "candidate_ids": self.candidate_ids,
+            "job_ids": self.job_ids,
+            "removed": sorted(self.removed),
+            "backend": "faiss" if faiss is not None else "numpy"
+        }
+        with open(f"{path}.json.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{path}.json.tmp", f"{path}.json")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["CandidatePoolIndex"]:
+        if not os.path.exists(f"{path}.json"):
+            return None
+        try:
+            with open(f"{path}.json") as f:
+                meta = json.load(f)
+            if meta.get("backend") != ("faiss" if faiss is not None else "numpy"):
+                return None
+
+            pool = cls(meta["dimension"])
+            if faiss is not None:
+                pool.index = faiss.read_index(f"{path}.index")
+            else:
+                for position, vector in enumerate(np.load(f"{path}.npy")):
+                    pool.index.add(position, vector)
+            pool.candidate_ids = meta["candidate_ids"]
+            pool.job_ids = meta["job_ids"]
+            pool.known = set(pool.candidate_ids)
+            pool.removed = set(meta.get("removed", []))
+            pool.watermark = meta["watermark"]
+            return pool
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            print(f"Talent pool index load failed, rebuilding: {e}")
+            return None
+
+
+class TalentPoolService:
+    """Find strong existing candidates from any of a user's jobs for a new job.
+
+    Pools advance by chunk ID watermark. Chunks can commit out of ID
+    order and candidates can be deleted, so every refresh also compares
+    the pool's candidates (count and ID sum) with the database: missing
+    candidates are folded in, and a pool holding deleted ones is rebuilt.
+    """
+
+    def __init__(self, scoring_service: Optional[ScoringService] = None):
+        self.scoring_service = scoring_service or ScoringService()
+        self.pools: Dict[int, CandidatePoolIndex] = {}
+
+    @staticmethod
+    def _index_path(user_id: int) -> str:
+        return os.path.join(settings.FAISS_INDEX_PATH, f"talent_pool_user_{user_id}")
+
+    def _chunk_rows(self, db: Session, user_id: int):
+        """Chunks of the user's jobs whose vectors share the primary backend's space"""
+        return (
+            db.query(
+                CandidateChunk.id, CandidateChunk.candidate_id, Candidate.job_id,
+                CandidateChunk.embedding_vector, CandidateChunk.embedding_backend
+            )
+            .join(Candidate, Candidate.id == CandidateChunk.candidate_id)
+            .join(Job, Job.id == Candidate.job_id)
+            .filter(
+                Job.created_by == user_id,
+                or_(
+                    CandidateChunk.embedding_backend.is_(None),
+                    CandidateChunk.embedding_backend == self.scoring_service.embedding_backend.name
+                )
+            )
+        )
+
+    @staticmethod
+    def _fold(pool: Optional[CandidatePoolIndex], rows) -> Tuple[Optional[CandidatePoolIndex], Optional[int]]:
+        """Add candidates of the given chunk rows; returns the pool and the last chunk ID seen"""
+        sums: Dict[int, np.ndarray] = {}
+        candidate_jobs: Dict[int, int] = {}
+        counts: Dict[int, int] = defaultdict(int)
+        last_chunk_id = None
+        for chunk_id, candidate_id, job_id, embedding, _ in rows:
+            last_chunk_id = chunk_id
+            if not embedding:
+                continue
+            vector = np.asarray(embedding, dtype=np.float32)
+            if pool is None:
+                pool = CandidatePoolIndex(vector.shape[0])
+            if vector.shape != (pool.dimension,) or candidate_id in pool.known:
+                continue
+            norm = np.linalg.norm(vector)
+            vector = vector / norm if norm else vector
+            sums[candidate_id] = sums[candidate_id] + vector if candidate_id in sums else vector
+            candidate_jobs[candidate_id] = job_id
+            counts[candidate_id] += 1
+
+        if sums:
+            candidate_ids = list(sums)
+            matrix = np.vstack([sums[cid] / counts[cid] for cid in candidate_ids])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            pool.add(candidate_ids, [candidate_jobs[cid] for cid in candidate_ids], matrix / norms)
+        return pool, last_chunk_id
+
+    def _reconcile(self, db: Session, user_id: int, pool: CandidatePoolIndex) -> Optional[CandidatePoolIndex]:
+        """Fold in candidates the watermark skipped; rebuild if deleted ones are still pooled"""
+        candidate_ids = self._chunk_rows(db, user_id).with_entities(CandidateChunk.candidate_id).distinct()
+        pooled = candidate_ids.subquery()
+        count, id_sum = db.query(func.count(pooled.c.candidate_id), func.sum(pooled.c.candidate_id)).one()
+        live = pool.live
+        if (count, int(id_sum or 0)) == (len(live), sum(live)):
+            return pool
+
+        stored = {candidate_id for (candidate_id,) in candidate_ids}
+        if live - stored:
+            pool.remove(live - stored)
+        if len(pool.removed) > _MAX_REMOVED_FRACTION * len(pool.candidate_ids):
+            rows = self._chunk_rows(db, user_id).order_by(CandidateChunk.id).yield_per(2000)
+            rebuilt, watermark = self._fold(None, rows)
+            if rebuilt is not None:
+                rebuilt.watermark = watermark or 0
+            return rebuilt
+
+        missing = sorted(stored - pool.known)
+        for start in range(0, len(missing), _RECONCILE_BATCH):
+            pool, _ = self._fold(pool, self._chunk_rows(db, user_id).filter(
+                CandidateChunk.candidate_id.in_(missing[start:start + _RECONCILE_BATCH])
+            ).order_by(CandidateChunk.id))
+        return pool
+
+    def discard(self, user_id: int, candidate_id: int) -> None:
+        """Drop a deleted candidate from the user's loaded pool"""
+        pool = self.pools.get(user_id)
+        if pool is not None:
+            pool.remove([candidate_id])
+
+    def _refresh(self, db: Session, user_id: int) -> Optional[CandidatePoolIndex]:
+        """Fold chunks written since the last refresh into the user's pool"""
+        pool = self.pools.get(user_id)
+        if pool is None:
+            pool = CandidatePoolIndex.load(self._index_path(user_id))
+
+        saved = (pool.watermark, len(pool.known), len(pool.removed)) if pool is not None else None
+        rows = (
+            self._chunk_rows(db, user_id)
+            .filter(CandidateChunk.id > (pool.watermark if pool is not None else 0))
+            .order_by(CandidateChunk.id)
+            .yield_per(2000)
+        )
+        pool, last_chunk_id = self._fold(pool, rows)
+        if pool is None:
+            self.pools.pop(user_id, None)
+            return None
+        if last_chunk_id is not None:
+            pool.watermark = last_chunk_id
+
+        pool = self._reconcile(db, user_id, pool)
+        if pool is None:
+            self.pools.pop(user_id, None)
+            return None
+
+        if saved != (pool.watermark, len(pool.known), len(pool.removed)):
+            try:
+                pool.save(self._index_path(user_id))
+            except OSError as e:
+                print(f"Talent pool index save failed: {e}")
+
+        self.pools[user_id] = pool
+        return pool
+
+    async def find_candidates(
+        self,
+        db: Session,
+        job: Job,
+        user_id: int,
+        limit: int = 20,
+        include_same_job: bool = False
+    ) -> List[Dict[str, Any]]:
+        """ANN retrieval over the user's candidate pool, then full re-scoring for this job"""
+        pool = self._refresh(db, user_id)
+        if pool is None or not len(pool):
+            return []
+
+        job_embedding, backend = await self.scoring_service.embed_job(job)
+        query = np.asarray(job_embedding, dtype=np.float32)
+        if not self.scoring_service.comparable(backend) or query.shape != (pool.dimension,):
+            return []
+        norm = np.linalg.norm(query)
+        hits = pool.search(query / norm if norm else query, settings.TALENT_POOL_CANDIDATES)
+        if not include_same_job:
+            hits = [hit for hit in hits if hit[1] != job.id]
+        if not hits:
+            return []
+
+        similarity = {candidate_id: score for candidate_id, _, score in hits}
+        candidates = db.query(Candidate).filter(Candidate.id.in_(list(similarity))).all()
+        chunks_by_candidate: Dict[int, List[CandidateChunk]] = defaultdict(list)
+        for chunk in db.query(CandidateChunk).filter(CandidateChunk.candidate_id.in_(list(similarity))).all():
+            chunks_by_candidate[chunk.candidate_id].append(chunk)
+
+        breakdowns = await self.scoring_service.score_candidates(
+            candidates, job, chunks_by_candidate, job_embedding
+        )
+        results = [
+            {
+                "candidate_id": candidate.id,
+                "name": candidate.name,
+                "email": candidate.email,
+                "source_job_id": candidate.job_id,
+                "status": candidate.status,
+                "pool_similarity": round(similarity[candidate.id], 4),
+                "total_score": breakdown["total_weighted_score"],
+                "score_breakdown": breakdown
+            }
+            for candidate, breakdown in zip(candidates, breakdowns)
+        ]
+        results.sort(key=lambda r: r["total_score"], reverse=True)
+        return results[:limit]
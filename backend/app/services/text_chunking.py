@@ -0,0 +1,123 @@
+import re
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from app.core.config import settings
+
+# Header lines per section. A line is a header only if it consists of one of
+# these phrases (optionally decorated, e.g. "== SKILLS ==") or starts with
+# one followed by a colon ("Skills: Python, Docker"); a sentence that merely
+# mentions "work" or "tools" is body text.
+SECTION_HEADERS = {
+    "summary": [
+        "summary", "professional summary", "career summary", "executive summary", "objective",
+        "career objective", "profile", "professional profile", "personal profile", "about me", "about"
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "relevant experience", "employment",
+        "employment history", "work history", "career history", "professional background"
+    ],
+    "education": [
+        "education", "academic background", "academics", "academic qualifications", "qualifications",
+        "education and training"
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "core competencies", "competencies",
+        "technologies", "technical expertise", "expertise", "tools", "tools and technologies", "tech stack"
+    ],
+    # Headers that close the sections above
+    "other": [
+        "certifications", "certificates", "projects", "personal projects", "awards", "achievements",
+        "languages", "interests", "hobbies", "references", "publications", "volunteering",
+        "volunteer experience", "contact", "contact information"
+    ]
+}
+
+
+def phrase_alternatives(phrases) -> str:
+    # Longest first so "work experience" is not cut short by "work"
+    return "|".join(re.escape(p).replace(r"\ ", r"\s+") for p in sorted(phrases, key=len, reverse=True))
+
+
+_HEADER_PATTERN = re.compile(
+    r"^[^\w]*(?:"
+    + "|".join(f"(?P<{section}>{phrase_alternatives(phrases)})" for section, phrases in SECTION_HEADERS.items())
+    + r")(?:\s*[:|]\s*(?P<rest>.+)|[^\w]*)$",
+    re.IGNORECASE
+)
+_LINE_PATTERN = re.compile(r"[^\n]+")
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_MIN_CHUNK_CHARS = 50  # Shorter chunks carry too little meaning to embed
+
+
+class ResumeChunker:
+    """Section segmentation and token-window chunking for embeddings.
+
+    Both passes are single scans with precompiled patterns and yield
+    results as they go; sections are joined once, never grown by
+    concatenation. Tokens are words and punctuation marks, which tracks
+    embedding-model token counts far better than whitespace splitting.
+    """
+
+    def classify_header(self, line: str) -> Optional[Tuple[str, str]]:
+        """(section, inline text) if the line is a section header"""
+        match = _HEADER_PATTERN.match(line)
+        if match is None:
+            return None
+        section = next(name for name in SECTION_HEADERS if match.group(name))
+        return section, (match.group("rest") or "").strip()
+
+    def iter_sections(self, text: str) -> Iterator[Tuple[str, str]]:
+        """(section, text) blocks in document order; text before any header is "other" """
+        section = "other"
+        lines = []
+        for line_match in _LINE_PATTERN.finditer(text):
+            line = line_match.group().strip()
+            if not line:
+                continue
+            header = self.classify_header(line)
+            if header is None:
+                lines.append(line)
+                continue
+            if lines:
+                yield section, " ".join(lines)
+            section, inline = header
+            lines = [inline] if inline else []
+        if lines:
+            yield section, " ".join(lines)
+
+    def iter_chunks(
+        self,
+        text: str,
+        chunk_size: Optional[int] = None,
+        overlap: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Overlapping windows of at most `chunk_size` tokens within each section"""
+        chunk_size = chunk_size or settings.CHUNK_SIZE
+        overlap = settings.CHUNK_OVERLAP if overlap is None else overlap
+        if not 0 <= overlap < chunk_size:
+            raise ValueError("Chunk overlap must be smaller than the chunk size")
+
+        def chunk(section: str, body: str, window: Deque[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+            chunk_text = body[window[0][0]:window[-1][1]]
+            if len(chunk_text) <= _MIN_CHUNK_CHARS:
+                return None
+            return {"text": chunk_text, "type": section, "token_count": len(window)}
+
+        for section, body in self.iter_sections(text):
+            window: Deque[Tuple[int, int]] = deque()
+            fresh = 0  # Tokens not yet part of an emitted chunk
+            for token in _TOKEN_PATTERN.finditer(body):
+                window.append(token.span())
+                fresh += 1
+                if len(window) == chunk_size:
+                    result = chunk(section, body, window)
+                    if result:
+                        yield result
+                    for _ in range(chunk_size - overlap):
+                        window.popleft()
+                    fresh = 0
+            if fresh:
+                result = chunk(section, body, window)
+                if result:
+                    yield result
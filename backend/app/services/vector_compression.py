@@ -0,0 +1,141 @@
+import abc
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+_SCAN_BLOCK_VALUES = 131072  # int8 codes widened to float32 at a time while scanning (512 KB, stays in cache)
+_RANDOM_PROJECTION_SEED = 1536  # Same projection in every process for a given shape
+_PCA_SAMPLE = 4096  # Rows used to fit PCA on larger corpora
+
+
+class VectorReducer(abc.ABC):
+    """Linear map to fewer dimensions, fitted to one corpus of unit vectors.
+
+    Projections are not centered: the inner products between corpus
+    vectors and queries are what has to survive, and a dot product in the
+    reduced space approximates the full one without renormalizing.
+    """
+
+    name = ""
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.projection: Optional[np.ndarray] = None  # (input dimensions, output dimensions)
+
+    @abc.abstractmethod
+    def fit(self, matrix: np.ndarray) -> "VectorReducer":
+        """Set `projection` from the corpus rows in `matrix`"""
+
+    def transform(self, matrix: np.ndarray) -> np.ndarray:
+        return np.asarray(matrix, dtype=np.float32) @ self.projection
+
+
+class PCAReducer(VectorReducer):
+    """Top eigenvectors of the corpus' second moment matrix (uncentered PCA).
+
+    Larger corpora are fitted on a random sample of _PCA_SAMPLE rows.
+    """
+
+    name = "pca"
+
+    def fit(self, matrix: np.ndarray) -> "PCAReducer":
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if len(matrix) > _PCA_SAMPLE:
+            rows = np.random.default_rng(_RANDOM_PROJECTION_SEED).choice(len(matrix), _PCA_SAMPLE, replace=False)
+            matrix = matrix[rows]
+        _, eigenvectors = np.linalg.eigh(matrix.T @ matrix)  # Ascending eigenvalues
+        self.projection = np.ascontiguousarray(eigenvectors[:, ::-1][:, :self.dimensions], dtype=np.float32)
+        return self
+
+
+class RandomProjectionReducer(VectorReducer):
+    """Gaussian random projection; fitting only needs the input dimension"""
+
+    name = "random"
+
+    def fit(self, matrix: np.ndarray) -> "RandomProjectionReducer":
+        rng = np.random.default_rng(_RANDOM_PROJECTION_SEED)
+        shape = (matrix.shape[1], self.dimensions)
+        self.projection = (rng.standard_normal(shape) / np.sqrt(self.dimensions)).astype(np.float32)
+        return self
+
+
+REDUCERS = {PCAReducer.name: PCAReducer, RandomProjectionReducer.name: RandomProjectionReducer}
+
+
+class VectorCompressor:
+    """Reduce and/or int8-quantize a corpus of normalized vectors.
+
+    encode() returns (codes, scales): float32 rows in the reduced space
+    and no scales, or int8 codes with one float32 scale per vector
+    (max |value| / 127). Similarity is computed on the encoded form: the
+    query is reduced but kept in float32, dotted with the codes and
+    multiplied by each row's scale, so nothing is decoded up front.
+
+    Only the per-job VectorIndex of hybrid search uses it; candidate
+    scoring and the talent pool work on the full float vectors.
+    """
+
+    def __init__(self, reducer: Optional[VectorReducer] = None, quantize: bool = False):
+        self.reducer = reducer
+        self.quantize = quantize
+        self.fitted = reducer is None
+
+    @property
+    def name(self) -> str:
+        parts = [f"{self.reducer.name}{self.reducer.dimensions}"] if self.reducer else []
+        return "+".join(parts + (["int8"] if self.quantize else [])) or "float32"
+
+    def fit(self, matrix: np.ndarray) -> "VectorCompressor":
+        if self.reducer is not None:
+            self.reducer.fit(matrix)
+        self.fitted = True
+        return self
+
+    def encode(self, matrix: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if self.reducer is not None:
+            matrix = self.reducer.transform(matrix)
+        if not self.quantize:
+            return np.ascontiguousarray(matrix), None
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    def encode_query(self, query: np.ndarray) -> np.ndarray:
+        query = np.asarray(query, dtype=np.float32)
+        return self.reducer.transform(query) if self.reducer is not None else query
+
+    @staticmethod
+    def scores(codes: np.ndarray, scales: Optional[np.ndarray], query: np.ndarray) -> np.ndarray:
+        """Dot products of an encoded query with every encoded row"""
+        if scales is None:
+            return codes @ query
+        scores = np.empty(len(codes), dtype=np.float32)
+        rows = max(1, _SCAN_BLOCK_VALUES // max(codes.shape[1], 1))
+        for start in range(0, len(codes), rows):
+            block = codes[start:start + rows]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+        return scores * scales
+
+
+def create_vector_compressor(spec: Optional[str] = None, dimensions: Optional[int] = None) -> Optional[VectorCompressor]:
+    """Compressor for a spec such as "pca", "random+int8" or "int8"; None when empty"""
+    spec = settings.EMBEDDING_COMPRESSION if spec is None else spec
+    parts = [part.strip().lower() for part in spec.split("+") if part.strip()]
+    if not parts:
+        return None
+
+    reducer = None
+    quantize = False
+    for part in parts:
+        if part == "int8" and not quantize:
+            quantize = True
+        elif part in REDUCERS and reducer is None:
+            reducer = REDUCERS[part](dimensions or settings.EMBEDDING_COMPRESSED_DIM)
+        else:
+            raise ValueError(f"Invalid embedding compression '{spec}' (combine one of {', '.join(REDUCERS)} with int8)")
+    return VectorCompressor(reducer, quantize)
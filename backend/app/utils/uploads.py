@@ -0,0 +1,186 @@
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, NamedTuple, Optional
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class StoredUpload(NamedTuple):
+    path: str
+    sha256: str
+    size: int
+
+
+async def stream_upload(file: UploadFile, directory: str, max_size: int, block_size: int) -> StoredUpload:
+    """Copy an upload to a temp file in fixed-size blocks.
+
+    The SHA-256 is computed as blocks arrive and the size limit is enforced
+    before anything past it is written, so memory use is bounded by the block
+    size. The caller moves the returned temp file into place with
+    `commit_upload` or deletes it.
+    """
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while True:
+                block = await file.read(block_size)
+                if not block:
+                    break
+                size += len(block)
+                if size > max_size:
+                    raise HTTPException(status_code=413, detail="File too large")
+                digest.update(block)
+                await run_in_threadpool(buffer.write, block)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return StoredUpload(temp_path, digest.hexdigest(), size)
+
+
+def store_stream(source: BinaryIO, directory: str, max_size: int, block_size: int) -> StoredUpload:
+    """Blocking counterpart of `stream_upload` for local files and archive members"""
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                size += len(block)
+                if size > max_size:
+                    raise HTTPException(status_code=413, detail="File too large")
+                digest.update(block)
+                buffer.write(block)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return StoredUpload(temp_path, digest.hexdigest(), size)
+
+
+def commit_upload(upload: StoredUpload, destination: str) -> str:
+    """Atomically move a streamed upload to its final path"""
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    os.replace(upload.path, destination)
+    return destination
+
+
+class MappedFile(io.RawIOBase):
+    """Binary file object over a memory map.
+
+    mmap objects have file-like methods but are not io.IOBase instances,
+    which pdfminer and zipfile (python-docx) expect.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._mapped.read(None if size is None or size < 0 else size)
+
+    def readinto(self, buffer) -> int:
+        data = self._mapped.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+
+@contextmanager
+def open_mapped(path: str) -> Iterator[io.RawIOBase]:
+    """Read-only memory-mapped file object, so parsers read without buffered copies"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield io.BytesIO(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield MappedFile(mapped)
+
+
+class RequestSizeLimitMiddleware:
+    """Reject oversized request bodies before they are parsed.
+
+    Bodies with a Content-Length above the limit are refused immediately;
+    chunked bodies are counted as they arrive and cut off at the limit.
+    Limits are configured per path prefix.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        self.limits = sorted(limits.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def _limit_for(self, path: str):
+        for prefix, limit in self.limits:
+            if path.startswith(prefix):
+                return limit
+        return None
+
+    async def _reject(self, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json")]
+        })
+        await send({"type": "http.response.body", "body": b'{"detail":"Request body too large"}'})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limit = self._limit_for(scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope.get("headers") or []).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except HTTPException as e:
+            if e.status_code != 413 or response_started:
+                raise
+            await self._reject(send)
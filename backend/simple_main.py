@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 from typing import Dict, List
 
+from app.services.skill_taxonomy import taxonomy_store
+
 app = FastAPI(
     title="CV_Bot API",
     description="AI-powered resume scanner and ranking system",
@@ -153,21 +155,9 @@ async def upload_resume(
         # If file reading fails, use a placeholder
         resume_content = f"Resume file: {file.filename}. Unable to extract text content for analysis."
 
-    # Parse skills from resume content
-    all_skills = [
-        "Python", "JavaScript", "TypeScript", "React", "Node.js", "Django", "Flask", "FastAPI",
-        "SQL", "PostgreSQL", "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "Azure", "GCP",
-        "Git", "Linux", "Java", "C++", "C#", "Go", "Rust", "PHP", "Ruby", "Swift", "Kotlin",
-        "HTML", "CSS", "Vue.js", "Angular", "Express", "Spring", "Hibernate", "REST", "GraphQL",
-        "TensorFlow", "PyTorch", "Pandas", "NumPy", "Scikit-learn", "Tableau", "Power BI",
-        "Jenkins", "CI/CD", "Agile", "Scrum", "DevOps", "Microservices", "API", "JSON"
-    ]
-
-    found_skills = []
-    content_lower = resume_content.lower()
-    for skill in all_skills:
-        if skill.lower() in content_lower:
-            found_skills.append(skill)
+    # Parse skills from resume content with the shared skills taxonomy
+    taxonomy = taxonomy_store.current()
+    found_skills = [taxonomy.label(skill) for skill in taxonomy.match(resume_content)]
 
     # If no skills found, provide minimal set
     if not found_skills:
@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Settings are read at import time: point them at a throwaway database and directories
+_TMP = tempfile.mkdtemp(prefix="cvbot-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'test.db')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_TMP, "uploads")
+os.environ["OCR_CACHE_DIR"] = os.path.join(_TMP, "ocr_cache")
+os.environ["PROFILE_DIR"] = os.path.join(_TMP, "profiles")
+os.environ["EMBEDDING_BACKEND"] = "local"
+os.environ["LEADERBOARD_BACKEND"] = "memory"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.job import Job  # noqa: E402
+from app.models.candidate import Candidate, CandidateChunk  # noqa: E402,F401
+from app.models.skill_facet import JobSkillFacet  # noqa: E402,F401
+from app.models.minhash import CandidateLSHBucket  # noqa: E402,F401
+from app.models.upload_blob import UploadBlob  # noqa: E402,F401
+from app.models.job_stats import JobStats  # noqa: E402,F401
+from app.services.feature_service import FeatureService  # noqa: E402
+
+engine.echo = False
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user(db):
+    user = User(email="hr@example.com", hashed_password="x", full_name="HR")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def job(db, user):
+    job = Job(
+        title="Backend Engineer",
+        description="Python developer with SQL",
+        requirements={"skills_required": ["python", "sql"], "skills_preferred": ["docker"]},
+        created_by=user.id
+    )
+    FeatureService().apply_requirement_features(job)
+    db.add(job)
+    db.commit()
+    return job
+
+
+@pytest.fixture
+def make_candidate(db):
+    """Insert a scored candidate with the given skills into a job's facets"""
+    from app.services.facet_service import SkillFacetService
+
+    facet_service = SkillFacetService()
+
+    def make(job, skills=(), score=0.5, status="pending", name="Candidate", **fields):
+        candidate = Candidate(
+            job_id=job.id,
+            name=name,
+            email=f"{name.lower().replace(' ', '.')}@example.com",
+            resume_filename="resume.pdf",
+            resume_text=fields.pop("resume_text", f"{name} knows {' '.join(skills)}"),
+            structured_data={"skills": list(skills), "education": [], "experience_years": 0},
+            total_score=score,
+            status=status,
+            **fields
+        )
+        facet_service.feature_service.apply_resume_features(candidate)
+        db.add(candidate)
+        db.flush()
+        facet_service.add_candidate(db, candidate)
+        db.commit()
+        return candidate
+
+    return make
+
+
+RESUME_TEXT = "Jane Doe\nSkills: Python, SQL, Docker\nBachelor of Science\n5 years of experience"
+
+
+@pytest.fixture
+def candidate_service(monkeypatch):
+    """CandidateService with text extraction and the LLM stubbed out"""
+    from app.services.candidate_service import CandidateService
+
+    service = CandidateService()
+
+    async def parse_resume(path, extension):
+        return RESUME_TEXT, {"skills": ["python", "sql", "docker"], "education": ["Bachelor"], "experience_years": 5}
+
+    async def explain(*args):
+        return "Good match"
+
+    monkeypatch.setattr(service.resume_parser, "parse_resume", parse_resume)
+    monkeypatch.setattr(service.llm_service, "explain_candidate_match", explain)
+    return service
+
+
+@pytest.fixture
+def upload(db, user, job, candidate_service):
+    """Upload resume bytes to the job through CandidateService.upload_resume"""
+    import asyncio
+    import io
+
+    from fastapi import UploadFile
+
+    def upload(content=b"%PDF-1.4 resume bytes", filename="resume.pdf", name="Jane Doe"):
+        file = UploadFile(file=io.BytesIO(content), filename=filename)
+        return asyncio.run(candidate_service.upload_resume(
+            db, job.id, file, name, "jane@example.com", None, user.id
+        ))
+
+    return upload
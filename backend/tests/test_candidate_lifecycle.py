@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.candidate import Candidate, CandidateChunk
+from app.models.minhash import CandidateLSHBucket
+from app.models.upload_blob import UploadBlob
+
+
+def test_delete_releases_blob_for_garbage_collection(db, user, candidate_service, upload):
+    first = upload()
+    second = upload()
+    blob = db.query(UploadBlob).one()
+    assert blob.ref_count == 2
+    path = candidate_service.blob_store.path_for(blob.sha256)
+
+    asyncio.run(candidate_service.delete_candidate(db, first.id, user.id))
+    db.refresh(blob)
+    assert blob.ref_count == 1
+    assert candidate_service.blob_store.garbage_collect(db)["removed_blobs"] == 0
+    assert os.path.exists(path)
+
+    # The copy was flagged as a duplicate of the deleted candidate
+    assert db.get(Candidate, second.id).duplicate_of_id is None
+
+    asyncio.run(candidate_service.delete_candidate(db, second.id, user.id))
+    assert db.query(Candidate).count() == 0
+    assert db.query(CandidateChunk).count() == 0
+    assert db.query(CandidateLSHBucket).count() == 0
+    assert candidate_service.blob_store.garbage_collect(db)["removed_blobs"] == 1
+    assert not os.path.exists(path)
+
+
+def test_http_errors_are_not_wrapped(db, candidate_service, upload, monkeypatch):
+    async def parse_resume(path, extension):
+        raise HTTPException(status_code=422, detail="Could not read the resume")
+
+    monkeypatch.setattr(candidate_service.resume_parser, "parse_resume", parse_resume)
+    with pytest.raises(HTTPException) as error:
+        upload()
+    assert error.value.status_code == 422
+    assert db.query(UploadBlob).count() == 0
+
+
+def test_failed_scoring_leaves_no_unscored_candidate(db, candidate_service, upload, monkeypatch):
+    async def process(*args):
+        raise RuntimeError("embedding service down")
+
+    monkeypatch.setattr(candidate_service, "_process_candidate_chunks", process)
+    with pytest.raises(HTTPException) as error:
+        upload()
+    assert error.value.status_code == 500
+    assert db.query(Candidate).count() == 0
+    assert db.query(UploadBlob).one().ref_count == 0
@@ -0,0 +1,80 @@
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from app.models.job import Job
+from app.models.user import User
+from app.services.dedup_service import DuplicateDetectionService, MinHasher
+
+RESUME = " ".join(
+    f"Worked on project {index} building python services with sql databases and docker deployments"
+    for index in range(20)
+)
+
+
+def _register(db, service, make_candidate, job, text, name, duplicate_of=None):
+    candidate = make_candidate(
+        job, ["python"], name=name, resume_text=text, minhash_signature=service.compute_signature(text)
+    )
+    if duplicate_of is not None:
+        candidate.duplicate_of_id = duplicate_of.id
+        candidate.duplicate_similarity = 0.95
+    service.index_candidate(db, candidate)
+    db.commit()
+    return candidate
+
+
+def test_similarity_estimates_jaccard():
+    hasher = MinHasher()
+    first = hasher.signature(RESUME)
+    assert hasher.similarity(first, hasher.signature(RESUME)) == 1.0
+    assert hasher.similarity(first, hasher.signature("completely unrelated marketing resume text here")) < 0.1
+
+
+def test_match_query_compiles_for_postgres_without_distinct_over_json(db, user):
+    service = DuplicateDetectionService()
+    query = service._match_query(db, service.hasher.signature(RESUME), user.id)
+    sql = str(query.statement.compile(dialect=postgresql.dialect()))
+    assert "DISTINCT" not in sql
+    assert "structured_data" not in sql and "score_breakdown" not in sql
+
+
+def test_find_duplicate_thresholds_and_scoping(db, user, job, make_candidate):
+    service = DuplicateDetectionService()
+    original = _register(db, service, make_candidate, job, RESUME, "Original")
+
+    edited = RESUME.replace("project 19 building", "project 19 maintaining")
+    found = service.find_duplicate(db, service.compute_signature(edited), user.id)
+    assert found is not None and found[0].id == original.id and found[1] >= 0.85
+
+    rewritten = " ".join(RESUME.split()[: len(RESUME.split()) // 2])
+    assert service.find_duplicate(db, service.compute_signature(rewritten), user.id) is None
+
+    other_user = User(email="other@example.com", hashed_password="x", full_name="Other")
+    db.add(other_user)
+    db.commit()
+    assert service.find_duplicate(db, service.compute_signature(RESUME), other_user.id) is None
+
+
+def test_find_duplicate_prefers_the_original(db, user, job, make_candidate):
+    service = DuplicateDetectionService()
+    original = _register(db, service, make_candidate, job, RESUME, "Original")
+    _register(db, service, make_candidate, job, RESUME, "Copy", duplicate_of=original)
+    found, similarity = service.find_duplicate(db, service.compute_signature(RESUME), user.id)
+    assert found.id == original.id and similarity == 1.0
+
+
+def test_duplicates_report_includes_job_ids(db, user, job, make_candidate):
+    service = DuplicateDetectionService()
+    other_job = Job(title="Data Engineer", description="SQL", created_by=user.id)
+    db.add(other_job)
+    db.commit()
+    original = _register(db, service, make_candidate, other_job, RESUME, "Original")
+    copy = _register(db, service, make_candidate, job, RESUME, "Copy", duplicate_of=original)
+
+    report = service.duplicates_report(db, job.id)
+    assert report["duplicate_count"] == 1
+    group = report["groups"][0]
+    assert group["original"]["job_id"] == other_job.id
+    assert group["duplicates"][0]["candidate_id"] == copy.id
+    assert group["duplicates"][0]["job_id"] == job.id
+    assert np.isclose(group["duplicates"][0]["similarity"], 0.95)
@@ -0,0 +1,45 @@
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "scripts"))
+
+import deepseek_stub  # noqa: E402
+from app.services.llm_service import LLMService  # noqa: E402
+
+
+def _stub_requirements(monkeypatch, description):
+    """Send the backend's real extraction prompt through the stub"""
+    async def call_api(self, messages, max_tokens=1000, operation="chat"):
+        prompt = "\n".join(message["content"] for message in messages if message["role"] != "system")
+        return json.dumps(deepseek_stub.extract_requirements(prompt))
+
+    monkeypatch.setattr(LLMService, "_call_api", call_api)
+    return asyncio.run(LLMService().extract_requirements(description))
+
+
+def test_instructions_do_not_leak_into_requirements(monkeypatch):
+    requirements = _stub_requirements(monkeypatch, "Cashier wanted. No degree needed.")
+
+    assert requirements["education_level"] == "Any"
+    assert requirements["skills_preferred"] == []
+    assert requirements["certifications"] == []
+
+
+def test_requirements_come_from_the_description(monkeypatch):
+    requirements = _stub_requirements(
+        monkeypatch,
+        "Backend engineer with 4+ years of Python and SQL.\nDocker is a plus.\nBachelor's degree in CS."
+    )
+
+    assert requirements["education_level"] == "Bachelor's"
+    assert requirements["min_experience_years"] == 4
+    assert [skill.lower() for skill in requirements["skills_required"]] == ["python", "sql"]
+    assert [skill.lower() for skill in requirements["skills_preferred"]] == ["docker"]
+
+
+def test_questionnaire_prompt_is_sliced_before_the_requirements():
+    prompt = "Create a questionnaire:\n\nJob Description: Barista\n\nRequirements: {'education_level': \"Master's\"}"
+
+    assert deepseek_stub.job_description(prompt).strip() == "Barista"
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from app.models.candidate import CandidateChunk
+from app.services.embedding_backends import EmbeddingBackend, HashingEmbeddingBackend
+from app.services.retrieval_service import HybridRetrievalService
+from app.services.scoring_service import ScoringService
+from app.services.talent_pool_service import TalentPoolService
+
+
+class FlakyBackend(HashingEmbeddingBackend):
+    """Stands in for the remote backend; fails while `failing` is set"""
+
+    name = "remote"
+
+    def __init__(self):
+        super().__init__(dimensions=64)
+        self.failing = False
+
+    async def embed_batch(self, texts):
+        if self.failing:
+            raise RuntimeError("embeddings unavailable")
+        return await super().embed_batch(texts)
+
+
+@pytest.fixture
+def primary():
+    return FlakyBackend()
+
+
+@pytest.fixture
+def scoring_service(primary):
+    service = ScoringService()
+    service.embedding_backend = primary
+    service.fallback_backend = HashingEmbeddingBackend(dimensions=64)
+    return service
+
+
+def _chunk(db, candidate, text, vector, backend):
+    chunk = CandidateChunk(
+        candidate_id=candidate.id, chunk_text=text, chunk_type="skills",
+        embedding_vector=vector, embedding_backend=backend
+    )
+    db.add(chunk)
+    db.commit()
+    return chunk
+
+
+def test_fallback_vectors_are_marked(scoring_service, primary):
+    _, backend = asyncio.run(scoring_service.embed_texts(["python developer"]))
+    assert backend == "remote"
+
+    primary.failing = True
+    _, backend = asyncio.run(scoring_service.embed_texts(["python developer"]))
+    assert backend == "local"
+    assert not scoring_service.comparable(backend)
+    assert scoring_service.comparable(None)  # Unmarked legacy chunks count as primary
+
+
+def test_scoring_skips_fallback_vectors(db, job, make_candidate, scoring_service):
+    candidate = make_candidate(job, ["python"])
+    vector = asyncio.run(scoring_service.get_job_embedding(job))
+    fallback = _chunk(db, candidate, job.description, vector, "local")
+
+    breakdown = asyncio.run(scoring_service.calculate_candidate_score(candidate, job, [fallback]))
+    batch = asyncio.run(scoring_service.score_candidates([candidate], job, {candidate.id: [fallback]}))
+    assert breakdown["semantic_similarity"] == 0.0
+    assert batch[0]["semantic_similarity"] == 0.0
+    assert breakdown["semantic_unavailable"] and batch[0]["semantic_unavailable"]
+
+    fallback.embedding_backend = "remote"
+    breakdown = asyncio.run(scoring_service.calculate_candidate_score(candidate, job, [fallback]))
+    batch = asyncio.run(scoring_service.score_candidates([candidate], job, {candidate.id: [fallback]}))
+    assert breakdown["semantic_similarity"] == pytest.approx(1.0)
+    assert not breakdown["semantic_unavailable"] and not batch[0]["semantic_unavailable"]
+
+
+def test_retrieval_and_talent_pool_skip_fallback_vectors(db, job, user, make_candidate, scoring_service, tmp_path,
+                                                         monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "FAISS_INDEX_PATH", str(tmp_path))
+    candidate = make_candidate(job, ["python"])
+    vector = asyncio.run(scoring_service.get_job_embedding(job))
+    fallback = _chunk(db, candidate, "python developer", vector, "local")
+
+    retrieval = HybridRetrievalService(scoring_service)
+    retrieval._refresh_job(db, job.id)
+    assert fallback.id in retrieval.lexical_index.documents(job.id)
+    assert job.id not in retrieval.vector_indexes
+
+    pool = TalentPoolService(scoring_service)
+    assert pool._refresh(db, user.id) is None
+
+
+def test_reembed_replaces_fallback_chunks_and_rescores(db, job, make_candidate, candidate_service, primary,
+                                                       scoring_service):
+    candidate_service.scoring_service = scoring_service
+    candidate = make_candidate(job, ["python"], score_breakdown={"semantic_similarity": 0.0})
+    vector = asyncio.run(scoring_service.get_job_embedding(job))
+    kept = _chunk(db, candidate, "python developer", vector, "remote")
+    fallback = _chunk(db, candidate, job.description, [0.0] * 64, "local")
+
+    primary.failing = True
+    scoring_service.job_embeddings.clear()
+    result = asyncio.run(candidate_service.reembed_chunks(db, job))
+    assert result == {"job_id": job.id, "reembedded": 0, "rescored": 0, "complete": False}
+
+    primary.failing = False
+    result = asyncio.run(candidate_service.reembed_chunks(db, job))
+    assert result == {"job_id": job.id, "reembedded": 1, "rescored": 1, "complete": True}
+
+    chunks = db.query(CandidateChunk).filter(CandidateChunk.candidate_id == candidate.id).order_by(CandidateChunk.id).all()
+    assert [chunk.id for chunk in chunks][0] == kept.id
+    assert chunks[1].id > fallback.id  # A new row, so watermark-based indexes pick it up
+    assert {chunk.embedding_backend for chunk in chunks} == {"remote"}
+    db.refresh(candidate)
+    assert candidate.score_breakdown["semantic_similarity"] == pytest.approx(1.0)
+
+
+def test_backends_must_implement_embed_batch():
+    class Incomplete(EmbeddingBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete(dimensions=8)
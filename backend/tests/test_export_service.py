@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.export_service import DEFAULT_EXPORT_COLUMNS, CandidateExportService
+
+
+def _csv(chunks):
+    return list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+
+def test_parse_columns():
+    assert CandidateExportService.parse_columns(None) == DEFAULT_EXPORT_COLUMNS
+    assert CandidateExportService.parse_columns(" Name, rank,name ,skills") == ["name", "rank", "skills"]
+    with pytest.raises(HTTPException) as error:
+        CandidateExportService.parse_columns("name,salary")
+    assert error.value.status_code == 400 and "salary" in error.value.detail
+    with pytest.raises(HTTPException):
+        CandidateExportService.parse_columns(" , ")
+
+
+def test_csv_follows_ranking_and_filters(db, job, make_candidate):
+    low = make_candidate(job, score=0.2, name="Low")
+    tie_first = make_candidate(job, ["python"], score=0.8, name="Tie First")
+    tie_second = make_candidate(job, ["python", "sql"], score=0.8, name="Tie Second", status="shortlisted")
+    service = CandidateExportService()
+
+    rows = _csv(service.stream(job.id, ["rank", "candidate_id", "skills", "total_score"]))
+    assert rows[0] == ["rank", "candidate_id", "skills", "total_score"]
+    assert [row[1] for row in rows[1:]] == [str(tie_first.id), str(tie_second.id), str(low.id)]
+    assert rows[2][2] == "python; sql"
+    assert [row[0] for row in rows[1:]] == ["1", "2", "3"]
+
+    rows = _csv(service.stream(job.id, ["rank", "name"], status="shortlisted"))
+    assert rows[1:] == [["1", "Tie Second"]]
+    rows = _csv(service.stream(job.id, ["name"], min_score=0.5))
+    assert [row[0] for row in rows[1:]] == ["Tie First", "Tie Second"]
+
+
+def test_csv_escapes_formulas(db, job, make_candidate):
+    make_candidate(job, score=0.5, name="=HYPERLINK(1)")
+
+    rows = _csv(CandidateExportService().stream(job.id, ["name", "total_score"]))
+
+    assert rows[1] == ["'=HYPERLINK(1)", "0.5"]
+
+
+def test_ndjson_batches(db, job, make_candidate, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    for index in range(5):
+        make_candidate(job, score=index / 10, name=f"Candidate {index}")
+
+    chunks = list(CandidateExportService().stream(job.id, ["rank", "name", "semantic_similarity"], "ndjson"))
+
+    assert len(chunks) == 3  # No header; 2 + 2 + 1 rows
+    records = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+    assert [record["name"] for record in records] == [f"Candidate {index}" for index in range(4, -1, -1)]
+    assert records[0] == {"rank": 1, "name": "Candidate 4", "semantic_similarity": None}
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.candidate import Candidate
+from app.models.skill_facet import JobSkillFacet
+from app.services import facet_service as facet_module
+from app.services.facet_service import SkillFacetService, SkillFilter
+from app.services.job_service import JobService
+
+
+def test_skill_filter_precedence():
+    skill_filter = SkillFilter('python AND docker OR "machine learning" NOT php')
+    bitmaps = {"python": 0b0011, "docker": 0b0001, "machine learning": 0b1100, "php": 0b1000}
+    # (python AND docker) OR (machine learning AND NOT php)
+    assert skill_filter.evaluate(bitmaps, 0b1111) == 0b0101
+
+
+def test_skill_filter_rejects_unbalanced_parentheses():
+    with pytest.raises(ValueError):
+        SkillFilter("(python OR java")
+
+
+def test_unknown_skill_is_a_client_error(db, job):
+    with pytest.raises(HTTPException) as error:
+        SkillFacetService().match(db, job.id, "cobol-on-mars")
+    assert error.value.status_code == 400
+
+
+def test_ranked_matches_bound_parameters_per_query(db, job, make_candidate, monkeypatch):
+    monkeypatch.setattr(facet_module, "_ORDINAL_SLICE", 3)
+    scores = [0.2, 0.9, 0.5, 0.9, 0.1, 0.7, 0.3, 0.6]
+    for index, score in enumerate(scores):
+        make_candidate(job, ["python"] if index % 4 != 3 else ["java"], score, name=f"C{index}")
+
+    service = SkillFacetService()
+    ids = service.ranked_matches(db, job.id, "python", skip=1, limit=3)
+    expected = (
+        db.query(Candidate.id)
+        .filter(Candidate.job_id == job.id, Candidate.name.notin_(["C3", "C7"]))
+        .order_by(Candidate.total_score.desc(), Candidate.id)
+        .offset(1)
+        .limit(3)
+        .all()
+    )
+    assert ids == [candidate_id for (candidate_id,) in expected]
+    assert [list(ordinals) for ordinals in service.ordinal_slices(0b1110111)] == [[0, 1, 2], [4, 5, 6]]
+
+
+def test_reads_do_not_commit_or_index(db, job, make_candidate):
+    make_candidate(job, ["python"], name="Indexed")
+    legacy = Candidate(job_id=job.id, name="Legacy", email="l@example.com", resume_filename="r.pdf",
+                       resume_text="python", structured_data={"skills": ["python"]}, skill_bits="0")
+    db.add(legacy)
+    db.commit()
+
+    service = SkillFacetService()
+    result, _ = service.match(db, job.id, "python")
+    assert result.bit_count() == 1
+    assert legacy.job_ordinal is None
+
+    assert service.index_pending(db, job.id) == 1
+    db.commit()
+    assert legacy.job_ordinal is not None
+
+
+def test_delete_job_drops_facets(db, user, job, make_candidate):
+    candidate = make_candidate(job, ["python"])
+    db.delete(candidate)
+    db.commit()
+    assert db.query(JobSkillFacet).filter(JobSkillFacet.job_id == job.id).count()
+
+    assert asyncio.run(JobService().delete_job(db, job.id, user.id))
+    assert db.query(JobSkillFacet).filter(JobSkillFacet.job_id == job.id).count() == 0
+
+
+def test_score_filter_skips_unindexed_candidates(db, job, make_candidate):
+    make_candidate(job, ["python"], score=0.8, name="Indexed")
+    db.add(Candidate(job_id=job.id, name="Legacy", email="l@example.com", resume_filename="r.pdf",
+                     resume_text="python", total_score=0.9))
+    db.commit()
+    assert SkillFacetService().facet_counts(db, job.id, "python", min_score=0.5)["total"] == 1
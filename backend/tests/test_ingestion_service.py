@@ -0,0 +1,72 @@
+import asyncio
+
+from app.models.candidate import Candidate, CandidateChunk
+from app.services.ingestion_service import IngestionBatch, IngestionService, parse_manifest
+
+
+def test_parse_manifest_keys_rows_by_filename():
+    rows = parse_manifest("Filename,Name,Email\nja.pdf, Jane ,jane@example.com\n,Nobody,x@example.com\n")
+    assert rows == {"ja.pdf": {"filename": "ja.pdf", "name": "Jane", "email": "jane@example.com"}}
+
+
+def test_duplicates_skip_embeddings_and_explanations(db, user, job, candidate_service, upload, monkeypatch, tmp_path):
+    original = upload(content=b"%PDF-1.4 same resume")
+    calls = {"embed": 0, "explain": 0}
+
+    async def embed(texts):
+        calls["embed"] += 1
+        return [[0.0] * 8 for _ in texts]
+
+    async def explain(*args):
+        calls["explain"] += 1
+        return "Bulk explanation"
+
+    monkeypatch.setattr(candidate_service.scoring_service, "generate_embeddings", embed)
+    monkeypatch.setattr(candidate_service.llm_service, "explain_candidate_match", explain)
+
+    (tmp_path / "copy.pdf").write_bytes(b"%PDF-1.4 same resume")
+    batch = IngestionBatch(job.id, user.id, str(tmp_path))
+    manifest = {"copy.pdf": {"name": "Jane Copy", "email": "jane.copy@example.com"}}
+    asyncio.run(IngestionService(candidate_service).ingest(db, batch, str(tmp_path), manifest))
+
+    assert batch.status == "completed" and batch.succeeded == 1, batch.to_dict()
+    assert calls == {"embed": 0, "explain": 0}
+    copy = db.get(Candidate, batch.candidate_ids[0])
+    assert copy.duplicate_of_id == original.id
+    assert copy.match_explanation == original.match_explanation
+    assert db.query(CandidateChunk).filter(CandidateChunk.candidate_id == copy.id).count() == \
+        db.query(CandidateChunk).filter(CandidateChunk.candidate_id == original.id).count()
+
+
+def test_writer_commits_before_waiting_on_enrich(db, user, job, candidate_service, monkeypatch, tmp_path):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "BULK_COMMIT_EVERY", 25)
+    service = IngestionService(candidate_service)
+    commits = []
+    commit = service._commit
+
+    def record_commit(db, batch, pending, on_progress):
+        commits.append(len(pending))
+        commit(db, batch, pending, on_progress)
+
+    async def parse(lookup_db, executor, item):
+        return f"Resume of {item.filename}\nSkills: Python", {"skills": ["python"], "experience_years": 2}
+
+    async def explain(*args):
+        await asyncio.sleep(0.01)  # A remote call: the writer drains its queue meanwhile
+        return "Explanation"
+
+    monkeypatch.setattr(service, "_commit", record_commit)
+    monkeypatch.setattr(service, "_parse", parse)
+    monkeypatch.setattr(candidate_service.llm_service, "explain_candidate_match", explain)
+    monkeypatch.setattr(settings, "BULK_EMBED_CONCURRENCY", 1)
+    for index in range(3):
+        (tmp_path / f"resume_{index}.pdf").write_bytes(b"%PDF-1.4 resume " + bytes([65 + index]) * 200)
+    manifest = {f"resume_{index}.pdf": {"email": f"c{index}@example.com"} for index in range(3)}
+
+    batch = IngestionBatch(job.id, user.id, str(tmp_path))
+    asyncio.run(service.ingest(db, batch, str(tmp_path), manifest))
+
+    assert batch.succeeded == 3, batch.to_dict()
+    assert [count for count in commits if count] == [1, 1, 1]
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.models.job import Job
+from app.models.job_stats import JobStats
+from app.services.job_service import JobService
+from app.services.job_stats_service import JobStatsService
+
+
+@pytest.fixture
+def foreign_keys(db):
+    """Enforce foreign keys like Postgres does (SQLite ignores them by default)"""
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    yield
+    db.rollback()
+    db.execute(text("PRAGMA foreign_keys=OFF"))
+
+
+def test_reading_stats_does_not_write(db, job, make_candidate):
+    make_candidate(job, ["python"], score=0.75)
+    make_candidate(job, ["sql"], score=0.25, status="shortlisted")
+
+    stats = JobStatsService().job_stats(db, job)
+
+    assert stats["candidate_count"] == 2
+    assert stats["average_score"] == 0.5
+    assert stats["status_counts"]["shortlisted"] == 1
+    assert not db.new and not db.dirty
+    assert db.query(JobStats).count() == 0
+
+
+def test_rebuild_and_incremental_updates_agree(db, job, make_candidate):
+    service = JobStatsService()
+    first = make_candidate(job, ["python"], score=0.75)
+    service.rebuild(db, job.id)
+    db.commit()
+
+    second = make_candidate(job, ["python", "sql"], score=0.35)
+    service.apply(db, job.id, None, service.contribution(second))
+    previous = service.contribution(first)
+    first.status = "rejected"
+    service.apply(db, job.id, previous, service.contribution(first))
+    db.commit()
+
+    incremental = service.job_stats(db, job)
+    row = db.query(JobStats).one()
+    rebuilt = service.rebuild(db, job.id)
+    assert rebuilt is row
+    assert service.job_stats(db, job) == incremental
+
+
+def test_concurrent_first_rebuild_overwrites_the_other_row(db, job, make_candidate, monkeypatch):
+    make_candidate(job, ["python"], score=0.75)
+    begin_nested = db.begin_nested
+
+    def racing_begin_nested():
+        # Another request stored the row between our lookup and insert
+        other = SessionLocal()
+        try:
+            other.add(JobStats(job_id=job.id, candidate_count=99, score_sum=0.0, experience_sum=0.0, education_sum=0.0))
+            other.commit()
+        finally:
+            other.close()
+        return begin_nested()
+
+    monkeypatch.setattr(db, "begin_nested", racing_begin_nested)
+    stats = JobStatsService().rebuild(db, job.id)
+    db.commit()
+
+    assert db.query(JobStats).count() == 1
+    assert stats.candidate_count == 1
+    assert db.query(JobStats).one().candidate_count == 1
+
+
+def test_delete_job_after_stats_were_viewed(db, user, job, foreign_keys):
+    service = JobService()
+    created = asyncio.run(_create_job(service, db, user))
+    asyncio.run(service.get_job_stats(db, created.id, user.id))
+    assert db.query(JobStats).filter(JobStats.job_id == created.id).count() == 1
+
+    assert asyncio.run(service.delete_job(db, created.id, user.id))
+    assert db.query(Job).filter(Job.id == created.id).first() is None
+    assert db.query(JobStats).filter(JobStats.job_id == created.id).count() == 0
+
+
+async def _create_job(service, db, user):
+    from app.schemas.job import JobCreate
+
+    async def extract_requirements(description):
+        return {"skills_required": ["python"], "skills_preferred": []}
+
+    async def generate_questionnaire(description, requirements):
+        return {}
+
+    service.llm_service.extract_requirements = extract_requirements
+    service.llm_service.generate_questionnaire = generate_questionnaire
+    return await service.create_job(db, JobCreate(title="Data Engineer", description="Python pipelines"), user.id)
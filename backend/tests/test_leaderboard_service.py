@@ -0,0 +1,77 @@
+import random
+
+from app.core.database import SessionLocal
+from app.models.candidate import Candidate
+from app.services.leaderboard_service import LeaderboardService, MemoryLeaderboard, RedisLeaderboard
+
+
+def _sql_order(db, job_id, status=None):
+    query = db.query(Candidate.id, Candidate.total_score).filter(Candidate.job_id == job_id)
+    if status:
+        query = query.filter(Candidate.status == status)
+    return [(candidate_id, score) for candidate_id, score in query.order_by(Candidate.total_score.desc(), Candidate.id)]
+
+
+def test_board_matches_sql_order_with_ties(db, job, make_candidate):
+    rng = random.Random(7)
+    for index in range(40):
+        make_candidate(job, score=rng.choice([0.2, 0.5, 0.5, 0.8]), status=rng.choice(["pending", "shortlisted"]),
+                       name=f"Candidate {index}")
+    service = LeaderboardService(MemoryLeaderboard())
+
+    assert service.top(db, job.id, 0, 100) == _sql_order(db, job.id)
+    assert service.top(db, job.id, 5, 10, status="shortlisted") == _sql_order(db, job.id, "shortlisted")[5:15]
+    expected = _sql_order(db, job.id)
+    candidate_id = expected[17][0]
+    assert service.rank(db, job.id, candidate_id) == (18, expected[17][1], len(expected))
+
+
+def test_board_picks_up_writes_from_other_processes(db, job, make_candidate):
+    first = make_candidate(job, score=0.9, name="First")
+    second = make_candidate(job, score=0.5, name="Second")
+    third = make_candidate(job, score=0.1, name="Third")
+    first_id, second_id, third_id = first.id, second.id, third.id
+    service = LeaderboardService(MemoryLeaderboard())
+    assert [candidate_id for candidate_id, _ in service.top(db, job.id)] == [first_id, second_id, third_id]
+
+    # Another worker rescored, inserted and deleted candidates without touching this board
+    other = SessionLocal()
+    try:
+        other.query(Candidate).filter(Candidate.id == third_id).one().total_score = 0.95
+        other.delete(other.query(Candidate).filter(Candidate.id == second_id).one())
+        late = Candidate(job_id=job.id, name="Late", email="late@example.com", resume_filename="late.pdf",
+                         resume_text="late", total_score=0.5, status="pending")
+        other.add(late)
+        other.commit()
+        late_id = late.id
+    finally:
+        other.close()
+    db.expire_all()
+
+    assert service.top(db, job.id) == [(third_id, 0.95), (first_id, 0.9), (late_id, 0.5)]
+    assert service.rank(db, job.id, second_id) is None
+    assert service.top(db, job.id) == _sql_order(db, job.id)
+
+
+def test_status_change_elsewhere_moves_between_boards(db, job, make_candidate):
+    candidate = make_candidate(job, score=0.7, name="Mover")
+    service = LeaderboardService(MemoryLeaderboard())
+    assert service.top(db, job.id, status="shortlisted") == []
+
+    other = SessionLocal()
+    try:
+        other.query(Candidate).filter(Candidate.id == candidate.id).one().status = "shortlisted"
+        other.commit()
+    finally:
+        other.close()
+
+    assert service.top(db, job.id, status="shortlisted") == [(candidate.id, 0.7)]
+    assert service.top(db, job.id, status="pending") == []
+
+
+def test_redis_members_rank_lower_ids_first_on_ties():
+    members = [RedisLeaderboard._member(candidate_id) for candidate_id in (3, 250, 12, 9999)]
+    # Redis orders equal scores by member, descending, in ZREVRANGEBYSCORE and ZREVRANK
+    ordered = sorted(members, reverse=True)
+    assert [RedisLeaderboard._candidate_id(member) for member in ordered] == [3, 12, 250, 9999]
+    assert RedisLeaderboard._candidate_id(b"%s" % members[1].encode()) == 250
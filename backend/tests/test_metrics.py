@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import settings
+from app.core.metrics import _Metric
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    monkeypatch.setattr(main, "_is_admin", lambda token: token == "admin-jwt")
+    return TestClient(main.app)
+
+
+def test_metrics_need_a_scraper_or_admin_token(client):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer user-jwt"}).status_code == 403
+
+    for token in ("scrape-secret", "admin-jwt"):
+        response = client.get("/metrics", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert "# TYPE cvbot_http_requests_total counter" in response.text
+
+
+def test_metric_types_must_implement_their_samples():
+    class Incomplete(_Metric):
+        kind = "gauge"
+
+        def _new_child(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete("cvbot_incomplete", "Missing _samples")
@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from app.services.ocr_service import OCRService
+from app.services.resume_parser_service import ResumeParserService
+
+_calls = []
+_lock = threading.Lock()
+
+
+def fake_page_ocr(file_path, page_number, dpi, lang, timeout):
+    """Stands in for rasterizing and Tesseract"""
+    with _lock:
+        _calls.append(page_number)
+    if os.path.basename(file_path).startswith("broken") and page_number == 2:
+        raise TimeoutError("tesseract timed out")
+    return f"  page {page_number} text  "
+
+
+def _scanned_pdf(path, pages=3):
+    images = [Image.new("L", (60, 80), color=255) for _ in range(pages)]
+    images[0].save(path, save_all=True, append_images=images[1:])
+    return str(path)
+
+
+@pytest.fixture
+def ocr(tmp_path):
+    _calls.clear()
+    service = OCRService(max_pages=2, cache_dir=str(tmp_path / "cache"), page_ocr=fake_page_ocr)
+    service._executor = ThreadPoolExecutor(2)  # Threads instead of processes; the stub needs no isolation
+    yield service
+    service._executor.shutdown()
+
+
+def test_pages_are_capped_joined_in_order_and_cached(ocr, tmp_path):
+    path = _scanned_pdf(tmp_path / "scan.pdf")
+    result = asyncio.run(ocr.extract_pdf_text(path))
+    assert result.text == "page 1 text\npage 2 text"
+    assert (result.pages, result.cached) == (2, False)
+    assert sorted(_calls) == [1, 2]
+
+    again = asyncio.run(ocr.extract_pdf_text(path))
+    assert again.cached and again.text == result.text
+    assert len(_calls) == 2
+
+
+def test_failed_pages_are_not_cached(ocr, tmp_path):
+    path = _scanned_pdf(tmp_path / "broken.pdf")
+    assert asyncio.run(ocr.extract_pdf_text(path)).text == "page 1 text"
+    asyncio.run(ocr.extract_pdf_text(path))
+    assert len(_calls) == 4
+
+
+def test_blob_names_are_used_as_cache_keys(ocr, tmp_path, monkeypatch):
+    source = _scanned_pdf(tmp_path / "scan.pdf")
+    with open(source, "rb") as f:
+        sha256 = hashlib.sha256(f.read()).hexdigest()
+    blob = tmp_path / sha256
+    os.rename(source, blob)
+
+    def no_hashing(file_path):
+        raise AssertionError("blob was hashed again")
+
+    monkeypatch.setattr(ocr, "_file_sha256", no_hashing)
+    asyncio.run(ocr.extract_pdf_text(str(blob)))
+    assert os.path.exists(ocr._cache_path(sha256))
+
+
+def test_parser_falls_back_to_ocr_for_scans(ocr, tmp_path):
+    parser = ResumeParserService()
+    parser.ocr_service = ocr
+    text, structured = asyncio.run(parser.parse_resume(_scanned_pdf(tmp_path / "scan.pdf")))
+    assert text == "page 1 text\npage 2 text"
+    assert structured["extraction"]["ocr"]["pages"] == 2
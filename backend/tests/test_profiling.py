@@ -0,0 +1,55 @@
+import asyncio
+import itertools
+import threading
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import RequestProfilerMiddleware
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _request(middleware):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/jobs/", "headers": []}
+    asyncio.run(middleware(scope, receive, send))
+    return sent
+
+
+def test_slow_profiles_are_saved_off_the_event_loop(monkeypatch):
+    saved = []
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUEST_MS", 1)
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling.time, "perf_counter", itertools.count(0, 10).__next__)
+    monkeypatch.setattr(
+        profiling.profile_store, "save", lambda profile: saved.append((profile, threading.get_ident()))
+    )
+
+    sent = _request(RequestProfilerMiddleware(_app))
+
+    assert sent[-1]["body"] == b"ok"
+    assert len(saved) == 1
+    profile, thread = saved[0]
+    assert profile["trigger"] == "slow" and profile["status"] == 200
+    assert thread != threading.get_ident()
+
+
+def test_zero_threshold_disables_slow_capture(monkeypatch):
+    saved = []
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUEST_MS", 0)
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling.profile_store, "save", saved.append)
+
+    _request(RequestProfilerMiddleware(_app))
+
+    assert saved == []
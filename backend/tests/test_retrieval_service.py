@@ -0,0 +1,77 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.models.candidate import CandidateChunk
+from app.services.retrieval_service import HybridRetrievalService, VectorIndex, reciprocal_rank_fusion
+from app.services.vector_compression import VectorReducer
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 1]], rrf_k=60)
+    assert fused[1] == pytest.approx(1 / 61 + 1 / 62)
+    assert fused[3] == pytest.approx(1 / 63 + 1 / 61)
+    assert fused[2] == pytest.approx(1 / 62)
+    assert sorted(fused, key=fused.get, reverse=True) == [1, 3, 2]
+
+
+def test_vector_index_top_k_and_dimension_check():
+    index = VectorIndex()
+    assert index.add(1, [1.0, 0.0])
+    assert index.add(2, [0.6, 0.8])
+    assert index.add(3, [0.0, 1.0])
+    assert not index.add(4, [1.0, 0.0, 0.0])
+    hits = index.search([0.0, 2.0], 2)
+    assert [doc_id for doc_id, _ in hits] == [3, 2]
+    assert hits[0][1] == pytest.approx(1.0)
+
+
+def _chunk(db, candidate, text, vector):
+    chunk = CandidateChunk(candidate_id=candidate.id, chunk_text=text, chunk_type="skills", embedding_vector=vector)
+    db.add(chunk)
+    db.commit()
+    return chunk
+
+
+def test_refresh_reconciles_late_and_deleted_chunks(db, job, make_candidate):
+    service = HybridRetrievalService()
+    first = make_candidate(job, ["python"], name="First")
+    second = make_candidate(job, ["python"], name="Second")
+    early = _chunk(db, first, "python developer", list(np.eye(4)[0]))
+    late = _chunk(db, second, "python engineer", list(np.eye(4)[1]))
+    service._refresh_job(db, job.id)
+    assert set(service.chunk_candidates) == {early.id, late.id}
+
+    # Simulate a lower chunk ID committed after the watermark moved past it
+    service.lexical_index.remove_document(early.id)
+    del service.chunk_candidates[early.id]
+    service._refresh_job(db, job.id)
+    assert service.chunk_candidates[early.id] == first.id
+
+    db.delete(late)
+    db.commit()
+    service._refresh_job(db, job.id)
+    assert set(service.chunk_candidates) == {early.id}
+    assert service.vector_indexes[job.id].ids == [early.id]
+
+
+def test_rank_job_fuses_both_rankings(db, job, make_candidate):
+    service = HybridRetrievalService()
+    job_vector = asyncio.run(service.scoring_service.get_job_embedding(job))
+    match = make_candidate(job, ["python"], name="Match")
+    other = make_candidate(job, ["java"], name="Other")
+    _chunk(db, match, "python developer with sql", job_vector)
+    _chunk(db, other, "java developer", list(-np.asarray(job_vector)))
+
+    ranking = asyncio.run(service.rank_job(db, job))
+    assert [entry["candidate_id"] for entry in ranking] == [match.id, other.id]
+    assert ranking[0]["lexical_rank"] == 1 and ranking[0]["vector_rank"] == 1
+
+
+def test_reducers_must_implement_fit():
+    class Incomplete(VectorReducer):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete(8)
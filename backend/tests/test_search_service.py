@@ -0,0 +1,110 @@
+import asyncio
+
+from app.services.search_service import CandidateSearchService, InvertedIndex, highlight_snippets, parse_query
+
+
+def test_parse_query_splits_phrases():
+    assert parse_query('python "machine learning" "go"') == (["python", "go"], [["machine", "learning"]])
+
+
+def test_bm25_prefers_rarer_and_denser_matches():
+    index = InvertedIndex()
+    index.add_document(1, "python python sql")
+    index.add_document(2, "python java java java java")
+    index.add_document(3, "sql sql")
+    hits = index.search(["python"])
+    assert [doc_id for doc_id, _ in hits] == [1, 2]
+
+
+def test_phrases_must_match_in_order():
+    index = InvertedIndex()
+    index.add_document(1, "machine learning engineer")
+    index.add_document(2, "learning machine engineer")
+    assert [doc_id for doc_id, _ in index.search([], [["machine", "learning"]])] == [1]
+
+
+def test_group_scope_only_walks_its_postings():
+    index = InvertedIndex()
+    index.add_document(1, "python", group=10)
+    index.add_document(2, "python", group=20)
+    assert [doc_id for doc_id, _ in index.search(["python"], groups=[20])] == [2]
+    assert set(index.postings["python"]) == {10, 20}
+
+    index.remove_document(2)
+    assert set(index.postings["python"]) == {10}
+    assert index.doc_freqs["python"] == 1
+    assert index.documents(20) == set()
+
+
+def test_highlight_marks_matches():
+    snippets = highlight_snippets("Senior Python developer", ["python"], [])
+    assert snippets == ["Senior <mark>Python</mark> developer"]
+
+
+def test_refresh_picks_up_late_commits_and_deletes(db, user, job, make_candidate):
+    service = CandidateSearchService()
+    first = make_candidate(job, ["python"], name="First")
+    second = make_candidate(job, ["python"], name="Second")
+    assert len(asyncio.run(service.search(db, user.id, "python"))) == 2
+
+    # A lower ID committed after the watermark moved past it
+    service.index.remove_document(first.id)
+    service.job_watermarks[job.id] = second.id
+    db.delete(second)
+    db.commit()
+
+    results = asyncio.run(service.search(db, user.id, "python"))
+    assert [result["candidate_id"] for result in results] == [first.id]
+    assert second.id not in service.index
+
+
+def test_highlight_escapes_resume_text():
+    text = 'Python <script>alert("x")</script> & <b>SQL</b>'
+    snippets = highlight_snippets(text, ["python", "script"], [])
+    assert snippets == [
+        "<mark>Python</mark> &lt;<mark>script</mark>&gt;alert(&quot;x&quot;)&lt;/<mark>script</mark>&gt; "
+        "&amp; &lt;b&gt;SQL&lt;/b&gt;"
+    ]
+    assert "<script" not in snippets[0] and "<b>" not in snippets[0]
+
+
+def test_scoped_scores_ignore_other_groups():
+    alone = InvertedIndex()
+    alone.add_document(1, "python developer", group=10)
+    alone.add_document(2, "java developer", group=10)
+
+    shared = InvertedIndex()
+    shared.add_document(1, "python developer", group=10)
+    shared.add_document(2, "java developer", group=10)
+    for doc_id in range(3, 50):
+        shared.add_document(doc_id, "python python python python", group=20)
+
+    assert shared.search(["python", "developer"], groups=[10]) == alone.search(["python", "developer"], groups=[10])
+
+
+def test_refresh_reads_all_jobs_in_one_query(db, user, job, make_candidate):
+    from sqlalchemy import event
+
+    from app.core.database import engine
+    from app.models.job import Job
+
+    other_job = Job(title="Other", description="Other", requirements={}, created_by=user.id)
+    db.add(other_job)
+    db.commit()
+    make_candidate(job, ["python"], name="First")
+    make_candidate(other_job, ["python"], name="Second")
+    service = CandidateSearchService()
+    asyncio.run(service.search(db, user.id, "python"))
+    third = make_candidate(other_job, ["python"], name="Third")
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        results = asyncio.run(service.search(db, user.id, "python"))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert third.id in [result["candidate_id"] for result in results]
+    refresh_queries = [s for s in statements if "resume_text" in s and "count" not in s and "candidates.id IN" not in s]
+    assert len(refresh_queries) == 1
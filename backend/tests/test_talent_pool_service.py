@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.models.candidate import Candidate, CandidateChunk
+from app.services.talent_pool_service import CandidatePoolIndex, TalentPoolService
+
+
+@pytest.fixture(autouse=True)
+def index_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "FAISS_INDEX_PATH", str(tmp_path))
+
+
+def _chunk(db, candidate, axis, chunk_id=None):
+    chunk = CandidateChunk(
+        id=chunk_id, candidate_id=candidate.id, chunk_text="text", chunk_type="skills",
+        embedding_vector=list(np.eye(4)[axis]), embedding_backend="local"
+    )
+    db.add(chunk)
+    db.commit()
+    return chunk
+
+
+def _pooled(service, db, user):
+    pool = service._refresh(db, user.id)
+    return {candidate_id for candidate_id, _, _ in pool.search(np.ones(4, dtype=np.float32) / 2, 10)}
+
+
+def test_chunks_committed_below_the_watermark_are_folded_in(db, user, job, make_candidate):
+    service = TalentPoolService()
+    early = make_candidate(job, name="Early")
+    late = make_candidate(job, name="Late")
+    _chunk(db, late, 1, chunk_id=10)
+    assert _pooled(service, db, user) == {late.id}
+
+    # A lower chunk ID that became visible after the watermark passed it
+    _chunk(db, early, 0, chunk_id=5)
+    assert _pooled(service, db, user) == {early.id, late.id}
+    assert service.pools[user.id].watermark == 10
+
+
+def test_deleted_candidates_leave_the_pool(db, user, job, make_candidate):
+    service = TalentPoolService()
+    candidates = [make_candidate(job, name=f"Candidate {index}") for index in range(6)]
+    for index, candidate in enumerate(candidates):
+        _chunk(db, candidate, index % 4)
+    assert len(_pooled(service, db, user)) == 6
+
+    # Deleted by another worker: tombstoned on the next refresh, also in the saved index
+    gone = candidates[0].id
+    db.query(CandidateChunk).filter(CandidateChunk.candidate_id == gone).delete()
+    db.query(Candidate).filter(Candidate.id == gone).delete()
+    db.commit()
+    assert gone not in _pooled(service, db, user)
+    assert CandidatePoolIndex.load(service._index_path(user.id)).removed == {gone}
+
+    # Past the tombstone limit the pool is rebuilt without them
+    for candidate in candidates[1:3]:
+        db.query(CandidateChunk).filter(CandidateChunk.candidate_id == candidate.id).delete()
+        db.query(Candidate).filter(Candidate.id == candidate.id).delete()
+    db.commit()
+    assert _pooled(service, db, user) == {candidate.id for candidate in candidates[3:]}
+    pool = service.pools[user.id]
+    assert pool.removed == set() and len(pool.candidate_ids) == 3
+
+
+def test_delete_candidate_discards_it_from_the_pool(db, user, job, make_candidate, candidate_service):
+    import asyncio
+
+    kept = make_candidate(job, name="Kept")
+    deleted = make_candidate(job, name="Deleted")
+    _chunk(db, kept, 0)
+    _chunk(db, deleted, 1)
+    service = candidate_service.talent_pool_service
+    assert _pooled(service, db, user) == {kept.id, deleted.id}
+    deleted_id = deleted.id
+
+    asyncio.run(candidate_service.delete_candidate(db, deleted_id, user.id))
+
+    assert service.pools[user.id].removed == {deleted_id}
+    assert _pooled(service, db, user) == {kept.id}
@@ -13,6 +13,10 @@ from app.core.database import Base
 from app.models.user import User
 from app.models.job import Job
 from app.models.candidate import Candidate, CandidateChunk
+from app.models.skill_facet import JobSkillFacet
+from app.models.minhash import CandidateLSHBucket
+from app.models.upload_blob import UploadBlob
+from app.models.job_stats import JobStats
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,31 @@
+"""Normalized scoring features
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('skill_bits', sa.String(), nullable=True))
+    op.add_column('candidates', sa.Column('education_level', sa.Integer(), default=0))
+    op.add_column('candidates', sa.Column('experience_years', sa.Integer(), default=0))
+    op.add_column('jobs', sa.Column('requirement_features', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'requirement_features')
+    op.drop_column('candidates', 'experience_years')
+    op.drop_column('candidates', 'education_level')
+    op.drop_column('candidates', 'skill_bits')
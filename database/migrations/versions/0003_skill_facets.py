@@ -0,0 +1,43 @@
+"""Skill facet bitmaps
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-01-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('job_ordinal', sa.Integer(), nullable=True))
+    op.create_index('ix_candidates_job_ordinal', 'candidates', ['job_id', 'job_ordinal'], unique=True)
+
+    op.create_table('job_skill_facets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('skill_id', sa.Integer(), nullable=False),
+        sa.Column('bitmap', sa.LargeBinary(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'skill_id', name='uq_job_skill_facet')
+    )
+    op.create_index(op.f('ix_job_skill_facets_id'), 'job_skill_facets', ['id'], unique=False)
+    op.create_index(op.f('ix_job_skill_facets_job_id'), 'job_skill_facets', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_skill_facets_job_id'), table_name='job_skill_facets')
+    op.drop_index(op.f('ix_job_skill_facets_id'), table_name='job_skill_facets')
+    op.drop_table('job_skill_facets')
+    op.drop_index('ix_candidates_job_ordinal', table_name='candidates')
+    op.drop_column('candidates', 'job_ordinal')
@@ -0,0 +1,47 @@
+"""MinHash near-duplicate detection
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-01-29 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('minhash_signature', sa.LargeBinary(), nullable=True))
+    op.add_column('candidates', sa.Column('duplicate_of_id', sa.Integer(), nullable=True))
+    op.add_column('candidates', sa.Column('duplicate_similarity', sa.Float(), nullable=True))
+    op.create_foreign_key('fk_candidates_duplicate_of_id', 'candidates', 'candidates', ['duplicate_of_id'], ['id'])
+
+    op.create_table('candidate_lsh_buckets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('candidate_id', sa.Integer(), nullable=False),
+        sa.Column('band', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_candidate_lsh_buckets_id'), 'candidate_lsh_buckets', ['id'], unique=False)
+    op.create_index(op.f('ix_candidate_lsh_buckets_candidate_id'), 'candidate_lsh_buckets', ['candidate_id'], unique=False)
+    op.create_index('ix_candidate_lsh_buckets_band_bucket', 'candidate_lsh_buckets', ['band', 'bucket'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidate_lsh_buckets_band_bucket', table_name='candidate_lsh_buckets')
+    op.drop_index(op.f('ix_candidate_lsh_buckets_candidate_id'), table_name='candidate_lsh_buckets')
+    op.drop_index(op.f('ix_candidate_lsh_buckets_id'), table_name='candidate_lsh_buckets')
+    op.drop_table('candidate_lsh_buckets')
+    op.drop_constraint('fk_candidates_duplicate_of_id', 'candidates', type_='foreignkey')
+    op.drop_column('candidates', 'duplicate_similarity')
+    op.drop_column('candidates', 'duplicate_of_id')
+    op.drop_column('candidates', 'minhash_signature')
@@ -0,0 +1,40 @@
+"""Content-addressed upload storage
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-02-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('upload_blobs',
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('sha256')
+    )
+
+    op.add_column('candidates', sa.Column('resume_sha256', sa.String(length=64), nullable=True))
+    op.create_foreign_key('fk_candidates_resume_sha256', 'candidates', 'upload_blobs', ['resume_sha256'], ['sha256'])
+    op.create_index(op.f('ix_candidates_resume_sha256'), 'candidates', ['resume_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidates_resume_sha256'), table_name='candidates')
+    op.drop_constraint('fk_candidates_resume_sha256', 'candidates', type_='foreignkey')
+    op.drop_column('candidates', 'resume_sha256')
+
+    op.drop_table('upload_blobs')
@@ -0,0 +1,28 @@
+"""Skills taxonomy version per candidate
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-02-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL: they predate the taxonomy and are all stale
+    op.add_column('candidates', sa.Column('taxonomy_version', sa.String(length=32), nullable=True))
+    op.create_index(op.f('ix_candidates_taxonomy_version'), 'candidates', ['taxonomy_version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidates_taxonomy_version'), table_name='candidates')
+    op.drop_column('candidates', 'taxonomy_version')
@@ -0,0 +1,26 @@
+"""Job and score index for candidate leaderboards
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-02-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Leaderboards load a job's candidates in score order from this index
+    op.create_index('ix_candidates_job_score', 'candidates', ['job_id', 'total_score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_job_score', table_name='candidates')
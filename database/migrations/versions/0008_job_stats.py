@@ -0,0 +1,43 @@
+"""Per-job dashboard summary rows
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2024-02-26 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows are created with each job; scripts/rebuild_job_stats.py builds them for existing jobs
+    op.create_table('job_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('candidate_count', sa.Integer(), nullable=False),
+        sa.Column('score_sum', sa.Float(), nullable=False),
+        sa.Column('experience_sum', sa.Float(), nullable=False),
+        sa.Column('education_sum', sa.Float(), nullable=False),
+        sa.Column('score_histogram', sa.JSON(), nullable=True),
+        sa.Column('status_counts', sa.JSON(), nullable=True),
+        sa.Column('skill_counts', sa.JSON(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_stats_id'), 'job_stats', ['id'], unique=False)
+    op.create_index(op.f('ix_job_stats_job_id'), 'job_stats', ['job_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_job_stats_job_id'), table_name='job_stats')
+    op.drop_index(op.f('ix_job_stats_id'), table_name='job_stats')
+    op.drop_table('job_stats')
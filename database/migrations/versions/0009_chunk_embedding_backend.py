@@ -0,0 +1,30 @@
+"""Embedding backend per candidate chunk
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2024-03-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows stay NULL and count as the primary backend; see scripts/reembed_chunks.py --include-unmarked
+    op.add_column('candidate_chunks', sa.Column('embedding_backend', sa.String(length=32), nullable=True))
+    op.create_index(
+        op.f('ix_candidate_chunks_embedding_backend'), 'candidate_chunks', ['embedding_backend'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidate_chunks_embedding_backend'), table_name='candidate_chunks')
+    op.drop_column('candidate_chunks', 'embedding_backend')
@@ -43,9 +43,9 @@ export default function UploadResumePage() {
     const file = event.target.files?.[0];
     if (file) {
       // Check file type
-      const allowedTypes = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'application/msword'];
+      const allowedTypes = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'];
       if (!allowedTypes.includes(file.type)) {
-        setError('Please select a PDF or Word document');
+        setError('Please select a PDF or DOCX file');
         return;
       }
 
@@ -213,7 +213,7 @@ export default function UploadResumePage() {
                   <div className="border-2 border-dashed border-gray-300 rounded-lg p-6 text-center hover:border-blue-400 transition-colors">
                     <input
                       type="file"
-                      accept=".pdf,.doc,.docx"
+                      accept=".pdf,.docx"
                       onChange={handleFileChange}
                       className="hidden"
                       id="resume-upload"
@@ -232,7 +232,7 @@ export default function UploadResumePage() {
                           )}
                         </div>
                         <p className="text-xs text-gray-500">
-                          PDF, DOC, or DOCX up to 10MB
+                          PDF or DOCX up to 10MB
                         </p>
                       </div>
                     </label>
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark resume section splitting and chunking on large synthetic resumes.
+
+Compares the previous implementation (string concatenation per line,
+keyword tests on every line, whole-list chunking) with ResumeChunker.
+
+Usage:
+    python scripts/benchmark_chunking.py [--sizes 1000 10000 100000] [--repeats 3] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.config import settings
+from app.services.text_chunking import ResumeChunker
+
+SECTION_KEYWORDS = {
+    "summary": ["summary", "objective", "profile", "about"],
+    "experience": ["experience", "work", "employment", "career", "professional"],
+    "education": ["education", "academic", "degree", "university", "college"],
+    "skills": ["skills", "technical", "competencies", "technologies", "tools"]
+}
+
+
+def previous_chunks(text: str, chunk_size: int, overlap: int):
+    """The replaced _split_into_sections + create_chunks, kept for comparison"""
+    sections = {"summary": "", "experience": "", "education": "", "skills": "", "other": ""}
+    current_section = "other"
+    for line in text.split("\n"):
+        line_clean = line.strip()
+        if not line_clean:
+            continue
+        line_lower = line_clean.lower()
+        for section, keywords in SECTION_KEYWORDS.items():
+            if any(keyword in line_lower for keyword in keywords):
+                current_section = section
+                break
+        sections[current_section] += line_clean + " "
+
+    chunks = []
+    for section_name, section_text in sections.items():
+        words = section_text.strip().split()
+        for i in range(0, len(words), chunk_size - overlap):
+            chunk_words = words[i:i + chunk_size]
+            chunk_text = " ".join(chunk_words)
+            if len(chunk_text.strip()) > 50:
+                chunks.append({"text": chunk_text, "type": section_name, "word_count": len(chunk_words)})
+    return chunks
+
+
+def synthetic_resume(lines: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    vocabulary = (
+        "built scalable services python kubernetes aws data pipelines spark airflow mentored engineers "
+        "designed apis postgresql redis latency reduced costs migrated legacy systems terraform ci"
+    ).split()
+    headers = ["Summary", "Work Experience", "Education", "Technical Skills", "Projects"]
+    out = ["Jane Doe", "jane@example.com"]
+    per_section = max(1, lines // len(headers))
+    for header in headers:
+        out.append(header)
+        out.extend(" ".join(rng.choice(vocabulary) for _ in range(12)) for _ in range(per_section))
+    return "\n".join(out)
+
+
+def timed(fn, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 2), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Resume lengths in lines")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per implementation")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    chunker = ResumeChunker()
+    results = []
+    for size in args.sizes:
+        text = synthetic_resume(size)
+        previous_ms, previous = timed(
+            lambda: previous_chunks(text, settings.CHUNK_SIZE, settings.CHUNK_OVERLAP), args.repeats
+        )
+        current_ms, current = timed(lambda: list(chunker.iter_chunks(text)), args.repeats)
+        results.append({
+            "lines": size,
+            "chars": len(text),
+            "previous_ms": previous_ms,
+            "previous_chunks": len(previous),
+            "chunker_ms": current_ms,
+            "chunker_chunks": len(current),
+            "speedup": round(previous_ms / current_ms, 2) if current_ms else None
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'lines':>8} {'chars':>10} {'previous ms':>12} {'chunker ms':>11} {'speedup':>8} {'chunks':>12}")
+    for r in results:
+        print(
+            f"{r['lines']:>8} {r['chars']:>10} {r['previous_ms']:>12} {r['chunker_ms']:>11} "
+            f"{str(r['speedup']):>8} {r['previous_chunks']:>5} /{r['chunker_chunks']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX text extraction: python-docx paragraphs vs the streaming extractor.
+
+Reports time, peak Python memory (tracemalloc) and characters extracted
+for each file. Without file arguments, synthetic resumes of increasing
+size (paragraphs, a skills table and a header) are generated.
+
+Usage:
+    python scripts/benchmark_docx.py [FILE.docx ...] [--repeats 5] [--json]
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from docx import Document
+
+from app.services.docx_extraction import DOCXTextExtractor
+
+
+def python_docx_text(data: bytes) -> str:
+    """The previous extraction path"""
+    document = Document(io.BytesIO(data))
+    return "\n".join(paragraph.text for paragraph in document.paragraphs)
+
+
+def streaming_text(data: bytes) -> str:
+    return DOCXTextExtractor().extract(io.BytesIO(data))
+
+
+def synthetic_resume(paragraphs: int) -> bytes:
+    document = Document()
+    document.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com | +1 555 0100"
+    document.add_heading("Experience", level=1)
+    for i in range(paragraphs):
+        document.add_paragraph(
+            f"Role {i}: built data pipelines in Python and Spark, deployed services on AWS with Kubernetes."
+        )
+    document.add_heading("Skills", level=1)
+    table = document.add_table(rows=0, cols=3)
+    for i in range(max(1, paragraphs // 10)):
+        cells = table.add_row().cells
+        cells[0].text, cells[1].text, cells[2].text = "Python", "PostgreSQL", f"Terraform {i}"
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def measure(extract, data: bytes, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        text = extract(data)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    extract(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "peak_kib": round(peak / 1024, 1),
+        "chars": len(text)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="DOCX files (default: generated resumes)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per extractor")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    if args.files:
+        samples = [(path, open(path, "rb").read()) for path in args.files]
+    else:
+        samples = [(f"synthetic-{n}-paragraphs", synthetic_resume(n)) for n in (50, 500, 5000)]
+
+    results = []
+    for name, data in samples:
+        results.append({
+            "file": name,
+            "bytes": len(data),
+            "python_docx": measure(python_docx_text, data, args.repeats),
+            "streaming": measure(streaming_text, data, args.repeats)
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'file':<28} {'extractor':<12} {'median ms':>10} {'peak KiB':>10} {'chars':>9}")
+    for r in results:
+        for extractor in ("python_docx", "streaming"):
+            m = r[extractor]
+            print(f"{r['file'][:28]:<28} {extractor:<12} {m['median_ms']:>10} {m['peak_kib']:>10} {m['chars']:>9}")
+
+
+if __name__ == "__main__":
+    main()
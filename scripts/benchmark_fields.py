@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark structured field extraction (experience, education,
+certifications, roles, summary) per KB of resume text.
+
+Compares the previous extractors (one or more re.findall passes per field,
+text lowered once per pattern) with the single-scan ResumeFieldExtractor.
+
+Usage:
+    python scripts/benchmark_fields.py [--sizes 2 20 200 2000] [--repeats 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.services.field_extraction import ResumeFieldExtractor
+
+
+def previous_fields(text: str) -> dict:
+    """The replaced _extract_* methods of ResumeParserService, kept for comparison"""
+    years = []
+    for pattern in [
+        r'(\d+)\+?\s*years?\s*of\s*experience',
+        r'(\d+)\+?\s*years?\s*experience',
+        r'experience\s*:?\s*(\d+)\+?\s*years?',
+        r'(\d+)\+?\s*yrs?\s*exp',
+    ]:
+        years.extend(int(match) for match in re.findall(pattern, text.lower()))
+
+    education_keywords = [
+        "bachelor", "master", "phd", "doctorate", "mba", "bsc", "msc",
+        "bachelor's", "master's", "university", "college", "degree"
+    ]
+    education = []
+    for line in text.split('\n'):
+        if any(keyword in line.lower() for keyword in education_keywords) and len(line.strip()) > 10:
+            education.append(line.strip())
+
+    certifications = []
+    for pattern in [r'certified\s+(.+?)(?:\n|$)', r'certification\s*:?\s*(.+?)(?:\n|$)', r'cert\.\s*(.+?)(?:\n|$)']:
+        certifications.extend(match.strip() for match in re.findall(pattern, text, re.IGNORECASE))
+
+    roles = []
+    for pattern in [
+        r'(software engineer|developer|programmer|analyst|manager|director|lead|senior|junior|intern)',
+        r'(data scientist|product manager|project manager|tech lead|architect|consultant)',
+        r'(designer|researcher|specialist|coordinator|administrator|executive)'
+    ]:
+        roles.extend(re.findall(pattern, text, re.IGNORECASE))
+
+    summary_lines = []
+    capturing = False
+    for line in text.split('\n'):
+        line_lower = line.lower().strip()
+        if any(keyword in line_lower for keyword in ["summary", "objective", "profile", "about"]):
+            capturing = True
+            continue
+        if capturing:
+            if line.strip() and (line_lower.startswith(('experience', 'education', 'skills', 'work')) or line.isupper()):
+                break
+            if line.strip():
+                summary_lines.append(line.strip())
+
+    return {
+        "experience_years": max(years) if years else 0,
+        "education": education[:3],
+        "certifications": certifications[:5],
+        "previous_roles": list(set(roles))[:5],
+        "summary": ' '.join(summary_lines)[:300]
+    }
+
+
+def synthetic_resume(kilobytes: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    vocabulary = (
+        "built scalable services python kubernetes aws data pipelines spark airflow mentored engineers "
+        "designed apis postgresql redis latency reduced costs migrated legacy systems terraform ci"
+    ).split()
+    titles = ["Senior Software Engineer", "Data Scientist", "Tech Lead", "Product Manager", "Developer"]
+    out = ["Jane Doe", "Summary", "Engineer with 8+ years of experience in distributed systems.", "Work Experience"]
+    position = 0
+    while sum(len(line) + 1 for line in out) < kilobytes * 1024:
+        year = 2023 - position % 5 * 3  # Overlapping roles between 2008 and 2023
+        out.append(f"{rng.choice(titles)} at Company {rng.randint(1, 99)}, Mar {year - 3} – Jun {year}")
+        out.extend(" ".join(rng.choice(vocabulary) for _ in range(14)) for _ in range(4))
+        position += 1
+    out += ["Education", "Master of Science in Computer Science, State University, 2010 - 2012",
+            "Certifications", "AWS Certified Solutions Architect", "Skills: Python, Go, Docker"]
+    return "\n".join(out)
+
+
+def timed(fn, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 20, 200, 2000], help="Resume sizes in KB")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per implementation")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    extractor = ResumeFieldExtractor()
+    results = []
+    for size in args.sizes:
+        text = synthetic_resume(size)
+        kilobytes = len(text.encode()) / 1024
+        previous_ms, previous = timed(lambda: previous_fields(text), args.repeats)
+        current_ms, current = timed(lambda: extractor.extract(text), args.repeats)
+        results.append({
+            "kilobytes": round(kilobytes, 1),
+            "previous_ms_per_kb": round(previous_ms / kilobytes, 4),
+            "extractor_ms_per_kb": round(current_ms / kilobytes, 4),
+            "speedup": round(previous_ms / current_ms, 2) if current_ms else None,
+            "previous_experience_years": previous["experience_years"],
+            "extractor_experience_years": current.experience_years
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'KB':>8} {'previous ms/KB':>15} {'extractor ms/KB':>16} {'speedup':>8} {'experience (prev/new)':>22}")
+    for r in results:
+        print(
+            f"{r['kilobytes']:>8} {r['previous_ms_per_kb']:>15} {r['extractor_ms_per_kb']:>16} "
+            f"{str(r['speedup']):>8} {r['previous_experience_years']:>14} /{r['extractor_experience_years']:>4}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the DeepSeek API, for offline performance testing.
+
+Serves the two endpoints the backend uses:
+
+    POST /chat/completions  Requirement-extraction and questionnaire prompts
+                            get schema-valid JSON built from the prompt (skills
+                            are matched with the backend's skills taxonomy);
+                            other prompts get a short match explanation.
+    POST /embeddings        Deterministic vectors: the normalized sum of one
+                            hash-seeded random vector per word, so equal texts
+                            embed identically and similar texts nearby.
+                            "input" may be a string or a list (batched).
+
+Latency, errors and rate limiting are injected to make batching, caching
+and retry behaviour measurable. GET /stats returns request counters.
+
+Point the backend at it with DEEPSEEK_BASE_URL=http://127.0.0.1:8900, or
+run `python scripts/test.py --offline`, which starts it when needed.
+
+Usage:
+    python scripts/deepseek_stub.py [--port 8900] [--latency-ms 300] [--embedding-latency-ms 40]
+                                    [--per-input-ms 2] [--error-rate 0.01] [--rate-limit 50]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.services.skill_taxonomy import taxonomy_store
+
+_WORD = re.compile(r"[a-z0-9+#.]+")
+_YEARS = re.compile(r"(\d{1,2})\+?\s*(?:years?|yrs?)", re.IGNORECASE)
+_PREFERRED = re.compile(r"nice to have|preferred|bonus|a plus|desirable", re.IGNORECASE)
+_EDUCATION = [("phd", "PhD"), ("doctorate", "PhD"), ("master", "Master's"), ("bachelor", "Bachelor's"),
+              ("degree", "Bachelor's")]
+_DESCRIPTION_START = "job description:"
+# Template lines that follow the description in the backend's extraction and questionnaire prompts
+_DESCRIPTION_END = re.compile(r"^\s*(?:Extract and return|Requirements:|Generate a JSON)", re.MULTILINE)
+_CERTIFICATIONS = re.compile(r"\b(?:[A-Z]{2,}[\w-]*\s+)?certifi(?:ed|cation)\b[^\n.,;]*", re.IGNORECASE)
+
+
+class Config:
+    def __init__(self, args):
+        self.dimensions = args.dimensions
+        self.latency = args.latency_ms / 1000
+        self.embedding_latency = args.embedding_latency_ms / 1000
+        self.per_input = args.per_input_ms / 1000
+        self.jitter = args.jitter
+        self.error_rate = args.error_rate
+        self.rate_limit = args.rate_limit
+        self.burst = args.burst or max(1.0, args.rate_limit)
+        self.max_batch = args.max_batch
+        self.rng = random.Random(args.seed)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self) -> Optional[float]:
+        """None if a request may proceed, else seconds until it could"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate
+
+
+class HashEmbedder:
+    """Bag-of-words feature hashing into dense unit vectors"""
+
+    def __init__(self, dimensions: int, cache_size: int = 50_000):
+        self.dimensions = dimensions
+        self.cache_size = cache_size
+        self._words: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _word_vector(self, word: str) -> np.ndarray:
+        vector = self._words.get(word)
+        if vector is None:
+            seed = int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+            vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+            self._words[word] = vector
+            if len(self._words) > self.cache_size:
+                self._words.popitem(last=False)
+        return vector
+
+    def embed(self, text: str) -> List[float]:
+        total = np.zeros(self.dimensions)
+        for word in _WORD.findall(text.lower()):
+            total += self._word_vector(word)
+        norm = np.linalg.norm(total)
+        if norm == 0:
+            total = self._word_vector("")
+            norm = np.linalg.norm(total)
+        return (total / norm).tolist()
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def job_description(prompt: str) -> str:
+    """The job description embedded in a prompt, without the instructions around it"""
+    start = prompt.lower().find(_DESCRIPTION_START)
+    if start < 0:
+        return prompt
+    text = prompt[start + len(_DESCRIPTION_START):]
+    end = _DESCRIPTION_END.search(text)
+    return text[:end.start()] if end else text
+
+
+def extract_requirements(prompt: str) -> Dict[str, Any]:
+    taxonomy = taxonomy_store.current()
+    description = job_description(prompt)
+    required, preferred = [], []
+    for line in description.splitlines():
+        target = preferred if _PREFERRED.search(line) else required
+        for skill in taxonomy.match(line):
+            if skill not in required and skill not in preferred:
+                target.append(skill)
+    years = [int(match) for match in _YEARS.findall(description)]
+    lowered = description.lower()
+    education = next(
+        (level for keyword, level in _EDUCATION if re.search(rf"(?<!\bno ){keyword}", lowered)), "Any"
+    )
+    return {
+        "skills_required": [taxonomy.label(skill) for skill in required],
+        "skills_preferred": [taxonomy.label(skill) for skill in preferred],
+        "min_experience_years": max(years) if years else 0,
+        "education_level": education,
+        "certifications": sorted({match.group().strip() for match in _CERTIFICATIONS.finditer(description)})[:5],
+        "location": None
+    }
+
+
+def generate_questionnaire(prompt: str) -> Dict[str, Any]:
+    requirements = extract_requirements(prompt)
+    skills = (requirements["skills_required"] + requirements["skills_preferred"])[:7] or ["the required technologies"]
+    return {
+        "technical_questions": [
+            {"question": f"Describe a project where you used {skill}.", "type": "text",
+             "category": skill, "weight": 5 if skill in requirements["skills_required"] else 3}
+            for skill in skills
+        ],
+        "experience_questions": [
+            {"question": "How many years of relevant experience do you have?", "type": "number",
+             "category": "experience", "weight": 4},
+            {"question": "Have you led a team or mentored other engineers?", "type": "boolean",
+             "category": "leadership", "weight": 3},
+            {"question": "Rate your experience with production systems at scale.", "type": "scale",
+             "category": "experience", "weight": 3}
+        ],
+        "behavioral_questions": [
+            {"question": "Describe a challenging project and how you overcame obstacles.", "type": "text",
+             "category": "problem_solving", "weight": 3},
+            {"question": "Tell us about a disagreement with a colleague and how it was resolved.", "type": "text",
+             "category": "collaboration", "weight": 2},
+            {"question": "How do you prioritize when deadlines conflict?", "type": "text",
+             "category": "organization", "weight": 2}
+        ],
+        "education_questions": [
+            {"question": "What is your highest level of education?", "type": "text",
+             "category": "education", "weight": 2},
+            {"question": "Which certifications do you hold?", "type": "text",
+             "category": "certifications", "weight": 1}
+        ]
+    }
+
+
+def explain_match(prompt: str) -> str:
+    skills = taxonomy_store.current().match(prompt)[:5]
+    strengths = ", ".join(skills) if skills else "general software engineering"
+    return (
+        f"The candidate shows relevant experience in {strengths}, which aligns with the role's core requirements.\n\n"
+        "Their background covers most of the listed responsibilities; gaps, if any, are in secondary skills "
+        "that can be learned on the job.\n\n"
+        "Overall recommendation: proceed to a technical interview."
+    )
+
+
+def create_app(config: Config) -> FastAPI:
+    app = FastAPI(title="DeepSeek stub")
+    embedder = HashEmbedder(config.dimensions)
+    bucket = TokenBucket(config.rate_limit, config.burst) if config.rate_limit > 0 else None
+    stats: Counter = Counter()
+
+    def error(status: int, message: str, error_type: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+        return JSONResponse({"error": {"message": message, "type": error_type}}, status_code=status, headers=headers)
+
+    async def admit(endpoint: str, delay: float) -> Optional[JSONResponse]:
+        """Apply rate limiting, latency and error injection; a response means the call fails"""
+        stats[f"{endpoint}.requests"] += 1
+        if bucket is not None:
+            retry_after = bucket.take()
+            if retry_after is not None:
+                stats[f"{endpoint}.rate_limited"] += 1
+                return error(429, "Rate limit reached", "rate_limit_error", {"Retry-After": f"{retry_after:.3f}"})
+        if delay > 0:
+            await asyncio.sleep(delay * config.rng.uniform(1 - config.jitter, 1 + config.jitter))
+        if config.error_rate > 0 and config.rng.random() < config.error_rate:
+            stats[f"{endpoint}.errors"] += 1
+            return error(config.rng.choice([500, 503]), "Injected server error", "server_error")
+        return None
+
+    @app.get("/")
+    async def root():
+        return {"status": "ok", "service": "deepseek-stub"}
+
+    @app.get("/stats")
+    async def get_stats():
+        return dict(stats)
+
+    @app.post("/chat/completions")
+    async def chat_completions(request: Request):
+        failure = await admit("chat", config.latency)
+        if failure is not None:
+            return failure
+        body = await request.json()
+        messages = body.get("messages") or []
+        system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system").lower()
+        prompt = "\n".join(m.get("content", "") for m in messages if m.get("role") != "system")
+
+        if "job descriptions" in system:
+            content, kind = json.dumps(extract_requirements(prompt)), "requirements"
+        elif "questionnaire" in system:
+            content, kind = json.dumps(generate_questionnaire(prompt)), "questionnaire"
+        else:
+            content, kind = explain_match(prompt), "explanation"
+        stats[f"chat.{kind}"] += 1
+
+        prompt_tokens = count_tokens(system + prompt)
+        completion_tokens = count_tokens(content)
+        return {
+            "id": f"stub-{stats['chat.requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "deepseek-chat"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @app.post("/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body.get("input")
+        inputs = [inputs] if isinstance(inputs, str) else list(inputs or [])
+        if not inputs or not all(isinstance(text, str) for text in inputs):
+            return error(400, "'input' must be a string or a list of strings", "invalid_request_error")
+        if len(inputs) > config.max_batch:
+            return error(400, f"At most {config.max_batch} inputs per request", "invalid_request_error")
+
+        failure = await admit("embeddings", config.embedding_latency + config.per_input * len(inputs))
+        if failure is not None:
+            return failure
+        stats["embeddings.inputs"] += len(inputs)
+        tokens = sum(count_tokens(text) for text in inputs)
+        return {
+            "object": "list",
+            "model": body.get("model", "deepseek-embedding"),
+            "data": [
+                {"object": "embedding", "index": index, "embedding": embedder.embed(text)}
+                for index, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens}
+        }
+
+    return app
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--dimensions", type=int, default=1536, help="Embedding size")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Chat completion latency")
+    parser.add_argument("--embedding-latency-ms", type=float, default=40.0, help="Fixed latency per embeddings request")
+    parser.add_argument("--per-input-ms", type=float, default=2.0, help="Added latency per embedded input")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Latency varies uniformly by +/- this fraction")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls failing with 500/503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before 429s; 0 disables")
+    parser.add_argument("--burst", type=float, default=None, help="Rate limit bucket size (default: one second's worth)")
+    parser.add_argument("--max-batch", type=int, default=256, help="Inputs allowed per embeddings request")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for jitter and error injection")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    if not 0 <= args.error_rate <= 1 or not 0 <= args.jitter < 1:
+        raise SystemExit("--error-rate must be within [0, 1] and --jitter within [0, 1)")
+    uvicorn.run(create_app(Config(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Ranking agreement, memory and scan time of compressed vector indexes.
+
+Every compression method is fitted on the corpus and its top-k ranking
+for each query compared with the full-precision (float32) ranking:
+recall@k (overlap of the two top-k sets), Kendall's tau over the
+full-precision top-k and whether the top hit agrees.
+
+The corpus is either the stored chunk embeddings of each job (queried
+with the job's embedding) or, with --synthetic N, N generated vectors
+with topical structure (so PCA has something to find) and generated
+queries, for sizes no database here holds.
+
+Usage:
+    python scripts/evaluate_compression.py [--job-id ID ...] [--top 10] [--json]
+    python scripts/evaluate_compression.py --synthetic 200000 [--dims 128 256] [--methods pca+int8 ...]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.config import settings
+from app.services.vector_compression import VectorCompressor, create_vector_compressor
+
+DEFAULT_METHODS = ["int8", "pca", "pca+int8", "random", "random+int8"]
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def synthetic_corpus(size: int, queries: int, dimension: int, topics: int = 64, seed: int = 7):
+    """Unit vectors mixing a few of `topics` random directions, plus noise"""
+    rng = np.random.default_rng(seed)
+    basis = rng.standard_normal((topics, dimension)).astype(np.float32)
+
+    def sample(count: int) -> np.ndarray:
+        weights = rng.dirichlet(np.full(topics, 0.1), size=count).astype(np.float32)
+        noise = rng.standard_normal((count, dimension)).astype(np.float32) * 0.02
+        return normalize(weights @ basis + noise)
+
+    return sample(size), sample(queries)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, len(scores))
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def kendall_tau(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """Kendall's tau-a between two score vectors over the same items"""
+    if len(reference) < 2:
+        return 1.0
+    upper = np.triu_indices(len(reference), k=1)
+    agreement = (
+        np.sign(reference[:, None] - reference[None, :])[upper] *
+        np.sign(candidate[:, None] - candidate[None, :])[upper]
+    )
+    return float(agreement.mean())
+
+
+def scan(compressor: VectorCompressor, codes, scales, query: np.ndarray, repeats: int):
+    """Scores of one query and the median time to compute them"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        scores = compressor.scores(codes, scales, compressor.encode_query(query))
+        timings.append(time.perf_counter() - start)
+    return scores, statistics.median(timings)
+
+
+def evaluate_corpus(corpus: np.ndarray, queries: np.ndarray, methods, dims, top: int, repeats: int):
+    baseline = VectorCompressor()
+    codes, scales = baseline.encode(corpus)
+    full_bytes = codes.nbytes
+    references = []
+    full_seconds = []
+    for query in queries:
+        scores, seconds = scan(baseline, codes, scales, query, repeats)
+        references.append(scores)
+        full_seconds.append(seconds)
+    full_ms = statistics.median(full_seconds) * 1000
+
+    results = [{
+        "method": baseline.name,
+        "bytes": full_bytes,
+        "memory_ratio": 1.0,
+        "fit_ms": 0.0,
+        "scan_ms": round(full_ms, 3),
+        "speedup": 1.0,
+        f"recall_at_{top}": 1.0,
+        "kendall_tau": 1.0,
+        "top1_agrees": 1.0
+    }]
+
+    for method in methods:
+        for dimension in (dims if any(r in method for r in ("pca", "random")) else [None]):
+            compressor = create_vector_compressor(method, dimension)
+            start = time.perf_counter()
+            compressor.fit(corpus)
+            codes, scales = compressor.encode(corpus)
+            fit_ms = (time.perf_counter() - start) * 1000
+            stored = codes.nbytes + (scales.nbytes if scales is not None else 0)
+
+            recalls, taus, top1, seconds = [], [], [], []
+            for query, reference in zip(queries, references):
+                scores, elapsed = scan(compressor, codes, scales, query, repeats)
+                seconds.append(elapsed)
+                expected = top_k(reference, top)
+                found = top_k(scores, top)
+                recalls.append(len(set(expected) & set(found)) / len(expected))
+                taus.append(kendall_tau(reference[expected], scores[expected]))
+                top1.append(float(expected[0] == found[0]))
+
+            scan_ms = statistics.median(seconds) * 1000
+            results.append({
+                "method": compressor.name,
+                "bytes": stored,
+                "memory_ratio": round(full_bytes / stored, 2),
+                "fit_ms": round(fit_ms, 1),
+                "scan_ms": round(scan_ms, 3),
+                "speedup": round(full_ms / scan_ms, 2) if scan_ms else None,
+                f"recall_at_{top}": round(statistics.mean(recalls), 4),
+                "kendall_tau": round(statistics.mean(taus), 4),
+                "top1_agrees": round(statistics.mean(top1), 4)
+            })
+    return results
+
+
+async def job_corpora(job_ids):
+    """(label, chunk vectors, job embedding) for each job with stored embeddings"""
+    from app.core.database import SessionLocal, engine
+    from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+    from app.models.job import Job
+    from app.models.candidate import Candidate, CandidateChunk
+    from app.services.scoring_service import ScoringService
+
+    engine.echo = False
+    db = SessionLocal()
+    scoring_service = ScoringService()
+    corpora = []
+    try:
+        query = db.query(Job)
+        if job_ids:
+            query = query.filter(Job.id.in_(job_ids))
+        for job in query.order_by(Job.id).all():
+            rows = (
+                db.query(CandidateChunk.embedding_vector)
+                .join(Candidate, Candidate.id == CandidateChunk.candidate_id)
+                .filter(Candidate.job_id == job.id, CandidateChunk.embedding_vector.isnot(None))
+                .yield_per(2000)
+            )
+            job_vector = np.asarray(await scoring_service.get_job_embedding(job), dtype=np.float32)
+            vectors = [row[0] for row in rows if row[0] and len(row[0]) == len(job_vector)]
+            if len(vectors) > 1:
+                corpora.append((f"job {job.id}", normalize(vectors), normalize(job_vector[None, :])))
+        return corpora
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job-id", type=int, action="append", help="Job to evaluate (repeatable, default: all)")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Evaluate N generated vectors instead of stored ones")
+    parser.add_argument("--queries", type=int, default=20, help="Generated queries with --synthetic")
+    parser.add_argument(
+        "--dimension", type=int, default=settings.EMBEDDING_DIMENSIONS, help="Vector size with --synthetic"
+    )
+    parser.add_argument(
+        "--methods", nargs="+", default=DEFAULT_METHODS, help="Compression specs, as in EMBEDDING_COMPRESSION"
+    )
+    parser.add_argument(
+        "--dims", type=int, nargs="+", default=[settings.EMBEDDING_COMPRESSED_DIM], help="Reduced dimensions to try"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Cut-off for ranking agreement")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed scans per query")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        corpus, queries = synthetic_corpus(args.synthetic, args.queries, args.dimension)
+        corpora = [(f"synthetic {args.synthetic}x{args.dimension}", corpus, queries)]
+    else:
+        corpora = asyncio.run(job_corpora(args.job_id))
+
+    report = [
+        {
+            "corpus": label,
+            "vectors": len(corpus),
+            "queries": len(queries),
+            "results": evaluate_corpus(corpus, queries, args.methods, args.dims, args.top, args.repeats)
+        }
+        for label, corpus, queries in corpora
+    ]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    recall = f"recall_at_{args.top}"
+    for entry in report:
+        print(f"{entry['corpus']}: {entry['vectors']} vectors, {entry['queries']} queries")
+        print(
+            f"  {'method':<16} {'MB':>9} {'smaller':>8} {'fit ms':>9} {'scan ms':>9} {'faster':>7} "
+            f"{recall:>12} {'tau':>7} {'top1':>6}"
+        )
+        for r in entry["results"]:
+            print(
+                f"  {r['method']:<16} {r['bytes'] / 1e6:>9.2f} {r['memory_ratio']:>7}x {r['fit_ms']:>9} "
+                f"{r['scan_ms']:>9} {str(r['speedup']):>6}x {r[recall]:>12.3f} {r['kendall_tau']:>7.3f} "
+                f"{r['top1_agrees']:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Offline evaluation of hybrid (BM25 + vector) candidate retrieval.
+
+For each job, compares the hybrid ranking against the current ranking
+(candidates ordered by total_score) and reports latency and top-k overlap.
+
+Usage:
+    python scripts/evaluate_hybrid.py [--job-id ID ...] [--top 10] [--k 100] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.services.retrieval_service import HybridRetrievalService
+
+
+def baseline_ranking(db, job_id: int, top: int):
+    """Current ranking: ORDER BY total_score DESC"""
+    rows = (
+        db.query(Candidate.id)
+        .filter(Candidate.job_id == job_id)
+        .order_by(Candidate.total_score.desc())
+        .limit(top)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+async def evaluate_job(db, service: HybridRetrievalService, job: Job, top: int, k: int, repeats: int):
+    # The first call loads the job's indexes; report it separately from warm queries
+    start = time.perf_counter()
+    hybrid = await service.rank_job(db, job, limit=top, k=k)
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    warm = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        hybrid = await service.rank_job(db, job, limit=top, k=k)
+        warm.append((time.perf_counter() - start) * 1000)
+
+    hybrid_ids = [entry["candidate_id"] for entry in hybrid]
+    baseline_ids = baseline_ranking(db, job.id, top)
+    overlap = len(set(hybrid_ids) & set(baseline_ids))
+    union = len(set(hybrid_ids) | set(baseline_ids))
+
+    return {
+        "job_id": job.id,
+        "title": job.title,
+        "candidates": db.query(Candidate).filter(Candidate.job_id == job.id).count(),
+        "cold_ms": round(cold_ms, 2),
+        "warm_p50_ms": round(statistics.median(warm), 2) if warm else None,
+        "warm_max_ms": round(max(warm), 2) if warm else None,
+        f"overlap_at_{top}": overlap / max(len(baseline_ids), 1),
+        "jaccard": overlap / union if union else 1.0,
+        "top1_agrees": bool(hybrid_ids and baseline_ids and hybrid_ids[0] == baseline_ids[0]),
+    }
+
+
+async def run(args):
+    db = SessionLocal()
+    service = HybridRetrievalService()
+    try:
+        query = db.query(Job)
+        if args.job_id:
+            query = query.filter(Job.id.in_(args.job_id))
+        results = []
+        for job in query.order_by(Job.id).all():
+            results.append(await evaluate_job(db, service, job, args.top, args.k, args.repeats))
+        return results
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job-id", type=int, action="append", help="Job to evaluate (repeatable, default: all)")
+    parser.add_argument("--top", type=int, default=10, help="Cut-off for overlap metrics")
+    parser.add_argument("--k", type=int, default=100, help="Chunks retrieved from each index")
+    parser.add_argument("--repeats", type=int, default=5, help="Warm queries per job")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    results = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'job':>5} {'cands':>6} {'cold ms':>9} {'p50 ms':>8} {'overlap':>8} {'jaccard':>8} {'top1':>5}")
+    for r in results:
+        print(
+            f"{r['job_id']:>5} {r['candidates']:>6} {r['cold_ms']:>9} {str(r['warm_p50_ms']):>8} "
+            f"{r[f'overlap_at_{args.top}']:>8.2f} {r['jaccard']:>8.2f} {str(r['top1_agrees']):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Garbage-collect the resume blob store.
+
+Deletes blobs no candidate references any more, plus files in the store
+that have no database row and are older than the grace period (left by
+uploads that failed before commit).
+
+Usage:
+    python scripts/gc_blobs.py [--grace-seconds 3600] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job  # noqa: F401
+from app.models.candidate import Candidate  # noqa: F401
+from app.services.blob_store import BlobStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grace-seconds", type=int, default=3600, help="Minimum age of orphaned files to delete")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    db = SessionLocal()
+    try:
+        result = BlobStore().garbage_collect(db, grace_seconds=args.grace_seconds)
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(
+        f"Removed {result['removed_blobs']} unreferenced blobs and {result['removed_orphans']} orphaned files, "
+        f"freed {result['freed_bytes']} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Bulk-import resumes into a job from a ZIP archive or a directory.
+
+An optional CSV manifest (columns: filename, name, email, phone) supplies
+contact details; otherwise the name is taken from the filename and the
+email from the resume text.
+
+Usage:
+    python scripts/ingest_resumes.py --job-id ID PATH [--manifest resumes.csv] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job
+from app.services.ingestion_service import IngestionBatch, IngestionService, parse_manifest
+
+
+def print_progress(batch: IngestionBatch):
+    status = batch.to_dict()
+    print(
+        f"\r{status['processed']}/{status['total']} processed, {status['failed']} failed, "
+        f"{status['resumes_per_minute']} resumes/min",
+        end="",
+        flush=True
+    )
+
+
+async def run(args):
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == args.job_id).first()
+        if job is None:
+            raise SystemExit(f"Job {args.job_id} not found")
+
+        manifest_rows = {}
+        if args.manifest:
+            with open(args.manifest, encoding="utf-8-sig") as f:
+                manifest_rows = parse_manifest(f.read())
+
+        batch = IngestionBatch(job.id, job.created_by, args.path)
+        return await IngestionService().ingest(
+            db, batch, args.path, manifest_rows, on_progress=None if args.json else print_progress
+        )
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="ZIP archive or directory of resumes")
+    parser.add_argument("--job-id", type=int, required=True, help="Job to import into")
+    parser.add_argument("--manifest", help="CSV manifest with filename, name, email, phone columns")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    batch = asyncio.run(run(args))
+    status = batch.to_dict()
+
+    if args.json:
+        print(json.dumps(status, indent=2, default=str))
+        return
+
+    print()
+    print(
+        f"{status['status']}: {status['succeeded']} imported, {status['failed']} failed "
+        f"in {status['elapsed_seconds']}s ({status['resumes_per_minute']} resumes/min)"
+    )
+    if status["error"]:
+        print(f"error: {status['error']}")
+    for error in status["errors"]:
+        print(f"  {error['filename']}: {error['error']}")
+    sys.exit(0 if status["status"] == "completed" else 1)
+
+
+if __name__ == "__main__":
+    main()
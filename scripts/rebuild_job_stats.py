@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Rebuild the per-job dashboard summary rows (job_stats).
+
+Jobs created before the table existed have no row, and their stats are
+computed on every read until one is stored; run this once after the
+migration. It also repairs rows that drifted, e.g. after manual edits.
+
+Usage:
+    python scripts/rebuild_job_stats.py [--job JOB_ID] [--missing-only] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job
+from app.models.candidate import Candidate  # noqa: F401
+from app.models.job_stats import JobStats
+from app.services.job_stats_service import JobStatsService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job", type=int, help="Only rebuild this job's row")
+    parser.add_argument("--missing-only", action="store_true", help="Only build rows for jobs that have none")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    service = JobStatsService()
+    db = SessionLocal()
+    try:
+        jobs = db.query(Job.id)
+        if args.job is not None:
+            jobs = jobs.filter(Job.id == args.job)
+        if args.missing_only:
+            jobs = jobs.filter(~db.query(JobStats.id).filter(JobStats.job_id == Job.id).exists())
+        results = []
+        for (job_id,) in jobs.order_by(Job.id).all():
+            stats = service.rebuild(db, job_id)
+            db.commit()  # One job at a time, so row locks are held briefly
+            results.append({"job_id": job_id, "candidate_count": stats.candidate_count})
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps({"jobs": results}, indent=2))
+        return
+    print(f"Rebuilt job stats for {len(results)} jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Re-embed resume chunks whose vectors came from the fallback backend.
+
+When the primary embedding backend fails, chunks are embedded by
+EMBEDDING_FALLBACK and marked with that backend; scoring, hybrid
+retrieval and the talent pool ignore such vectors. Run this once the
+primary backend is healthy again: the chunks are embedded again and their
+candidates rescored. Only jobs with mismatched chunks are visited.
+
+Usage:
+    python scripts/reembed_chunks.py [--job JOB_ID] [--include-unmarked] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from sqlalchemy import or_
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job
+from app.models.candidate import Candidate, CandidateChunk
+from app.services.candidate_service import CandidateService
+
+
+async def reembed(service: CandidateService, job_id, include_unmarked: bool):
+    primary = service.scoring_service.embedding_backend.name
+    db = SessionLocal()
+    try:
+        mismatched = CandidateChunk.embedding_backend != primary
+        if include_unmarked:
+            mismatched = or_(CandidateChunk.embedding_backend.is_(None), mismatched)
+        jobs = (
+            db.query(Candidate.job_id)
+            .join(CandidateChunk, CandidateChunk.candidate_id == Candidate.id)
+            .filter(mismatched)
+            .distinct()
+        )
+        if job_id is not None:
+            jobs = jobs.filter(Candidate.job_id == job_id)
+        results = []
+        for (stale_job_id,) in sorted(jobs.all()):
+            result = await service.reembed_chunks(
+                db, db.query(Job).filter(Job.id == stale_job_id).one(), include_unmarked
+            )
+            results.append(result)
+            if not result["complete"]:
+                break  # The primary backend is failing; later jobs would fail the same way
+        return primary, results
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job", type=int, help="Only re-embed this job's chunks")
+    parser.add_argument("--include-unmarked", action="store_true",
+                        help="Also re-embed chunks stored before the embedding backend was recorded")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    primary, results = asyncio.run(reembed(CandidateService(), args.job, args.include_unmarked))
+
+    if args.json:
+        print(json.dumps({"embedding_backend": primary, "jobs": results}, indent=2))
+        return
+    print(f"Embedding backend {primary}: {len(results)} jobs with mismatched chunks")
+    for result in results:
+        state = "" if result["complete"] else " (stopped: the primary backend is still failing)"
+        print(f"  job {result['job_id']}: {result['reembedded']} chunks re-embedded, {result['rescored']} rescored{state}")
+
+
+if __name__ == "__main__":
+    main()
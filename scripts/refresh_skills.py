@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Bring candidates up to the current skills taxonomy.
+
+Candidates parsed with another taxonomy version have their skills matched
+again against the stored resume text; facets and scores follow. Run after
+editing the taxonomy file. Only jobs with stale candidates are visited.
+
+Usage:
+    python scripts/refresh_skills.py [--job JOB_ID] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from sqlalchemy import or_
+
+from app.core.database import SessionLocal, engine
+from app.models.user import User  # noqa: F401 - registers the mapper used by Job
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.services.candidate_service import CandidateService
+from app.services.skill_taxonomy import taxonomy_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job", type=int, help="Only refresh this job")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    engine.echo = False
+    version = taxonomy_store.current().version
+    service = CandidateService()
+    db = SessionLocal()
+    try:
+        stale_jobs = (
+            db.query(Candidate.job_id)
+            .filter(or_(Candidate.taxonomy_version.is_(None), Candidate.taxonomy_version != version))
+            .distinct()
+        )
+        if args.job is not None:
+            stale_jobs = stale_jobs.filter(Candidate.job_id == args.job)
+        job_ids = sorted(job_id for (job_id,) in stale_jobs.all())
+        results = [
+            service.refresh_skills(db, db.query(Job).filter(Job.id == job_id).one())
+            for job_id in job_ids
+        ]
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps({"taxonomy_version": version, "jobs": results}, indent=2))
+        return
+    print(f"Skills taxonomy {version}: {len(results)} jobs with stale candidates")
+    for result in results:
+        print(
+            f"  job {result['job_id']}: {result['checked']} checked, {result['changed']} changed, "
+            f"{result['rescored']} rescored"
+        )
+
+
+if __name__ == "__main__":
+    main()
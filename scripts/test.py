@@ -1,153 +1,446 @@
 #!/usr/bin/env python3
 """
-Test script for CV_Bot API endpoints
-"""
+Load test for the CV_Bot API.
 
-import requests
-import json
-import sys
-from typing import Dict, Any
+Concurrent virtual users register and log in, create a job, then perform
+actions drawn from a weighted mix at a target total rate until the
+duration is up:
 
-BASE_URL = "http://localhost:8000/api/v1"
+    create_job    POST /jobs/
+    upload        POST /candidates/upload/{job_id} (one generated DOCX resume)
+    bulk_upload   POST /candidates/bulk/{job_id} (ZIP of generated resumes)
+    poll          GET /candidates/job/{job_id} (ranked list), plus
+                  GET /candidates/bulk/{batch_id} while an import is running
 
-def test_health():
-    """Test health endpoint"""
-    print("Testing health endpoint...")
-    try:
-        response = requests.get("http://localhost:8000/health")
-        if response.status_code == 200:
-            print("✅ Health check passed")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to backend. Is it running?")
-        return False
-
-def register_test_user():
-    """Register a test user"""
-    print("Registering test user...")
-    user_data = {
-        "full_name": "Test User",
-        "email": "test@example.com",
-        "password": "testpass123"
-    }
+Latency percentiles (p50/p95/p99) and throughput are reported per
+endpoint; --output writes them as JSON, and --baseline compares p95
+latencies with an earlier result (exit status 1 on regression).
 
-    try:
-        response = requests.post(f"{BASE_URL}/auth/register", json=user_data)
-        if response.status_code == 200:
-            print("✅ User registration successful")
-            return response.json()
-        else:
-            print(f"❌ User registration failed: {response.status_code}")
-            print(response.text)
-            return None
-    except Exception as e:
-        print(f"❌ Error registering user: {e}")
-        return None
+With --offline the backend is started here with DEEPSEEK_BASE_URL pointing
+at a local DeepSeek-compatible stub (--provider-url), so no request leaves
+the machine. Unless one is already listening there, scripts/deepseek_stub.py
+is started too (options via --stub-args). The database is whatever
+DATABASE_URL the backend is configured with; it must be migrated.
 
-def login_test_user():
-    """Login test user"""
-    print("Logging in test user...")
-    login_data = {
-        "username": "test@example.com",
-        "password": "testpass123"
-    }
+Usage:
+    python scripts/test.py [--users 10] [--rate 5] [--duration 60]
+                           [--mix poll=6,upload=2,bulk_upload=1,create_job=1]
+                           [--offline] [--output result.json] [--baseline old.json]
+"""
 
-    try:
-        response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
-        if response.status_code == 200:
-            print("✅ User login successful")
-            return response.json()["access_token"]
-        else:
-            print(f"❌ User login failed: {response.status_code}")
-            print(response.text)
-            return None
-    except Exception as e:
-        print(f"❌ Error logging in: {e}")
-        return None
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import time
+import uuid
+import zipfile
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
 
-def create_test_job(token: str):
-    """Create a test job"""
-    print("Creating test job...")
-    job_data = {
-        "title": "Senior Python Developer",
-        "description": """We are looking for a Senior Python Developer to join our team.
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "backend")
+DEFAULT_MIX = "poll=6,upload=2,bulk_upload=1,create_job=1"
+SKILLS = [
+    "Python", "Django", "FastAPI", "Flask", "PostgreSQL", "Redis", "Docker", "Kubernetes", "AWS", "Azure",
+    "GCP", "Terraform", "React", "TypeScript", "Java", "Spring", "Go", "Kafka", "Spark", "Airflow"
+]
+JOB_DESCRIPTION = """We are looking for a Senior Python Developer to join our team.
 
 Requirements:
 - 5+ years of Python experience
 - Experience with FastAPI, Django, or Flask
 - Knowledge of PostgreSQL and Redis
 - Experience with cloud platforms (AWS, Azure, GCP)
-- Strong understanding of software development best practices
 
 Responsibilities:
 - Develop and maintain web applications
 - Design and implement APIs
-- Work with databases and optimize queries
-- Collaborate with frontend developers
 - Mentor junior developers"""
-    }
 
-    headers = {"Authorization": f"Bearer {token}"}
-    try:
-        response = requests.post(f"{BASE_URL}/jobs", json=job_data, headers=headers)
-        if response.status_code == 200:
-            print("✅ Job creation successful")
-            return response.json()
-        else:
-            print(f"❌ Job creation failed: {response.status_code}")
-            print(response.text)
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Linearly interpolated percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        action, _, weight = part.partition("=")
+        action = action.strip()
+        if action not in LoadTest.ACTIONS:
+            raise SystemExit(f"Unknown action '{action}' in --mix (choose from {', '.join(LoadTest.ACTIONS)})")
+        mix[action] = float(weight or 1)
+    if sum(mix.values()) <= 0:
+        raise SystemExit("--mix needs at least one positive weight")
+    return mix
+
+
+def make_resumes(count: int, rng: random.Random) -> List[bytes]:
+    """DOCX resumes with varied skills and experience"""
+    from docx import Document  # python-docx, a backend dependency
+
+    resumes = []
+    for index in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 8))
+        start = rng.randint(2005, 2020)
+        document = Document()
+        for line in [
+            f"Candidate {index}",
+            "Summary",
+            f"Software engineer with {2024 - start} years of experience in {', '.join(skills[:3])}.",
+            "Experience",
+            f"Software Engineer at Company {index} {start} - Present: built services with {', '.join(skills)}.",
+            "Education",
+            "Bachelor of Science in Computer Science, State University",
+            "Skills",
+            ", ".join(skills)
+        ]:
+            document.add_paragraph(line)
+        buffer = io.BytesIO()
+        document.save(buffer)
+        resumes.append(buffer.getvalue())
+    return resumes
+
+
+class Recorder:
+    """Latencies and outcomes per endpoint"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.schedule_lag: List[float] = []  # Time actions waited for a free user
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, endpoint: str, seconds: float, status: Optional[int]) -> None:
+        self.latencies[endpoint].append(seconds * 1000)
+        self.statuses[endpoint][str(status) if status is not None else "error"] += 1
+        if status is None or status >= 400:
+            self.errors[endpoint] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        endpoints = {}
+        all_latencies = []
+        for endpoint, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            all_latencies.extend(values)
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors[endpoint],
+                "statuses": dict(self.statuses[endpoint]),
+                "throughput_rps": round(len(values) / elapsed, 3) if elapsed else 0.0,
+                "mean_ms": round(sum(values) / len(values), 2),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2)
+            }
+        all_latencies.sort()
+        lag = sorted(self.schedule_lag)
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": len(all_latencies),
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(len(all_latencies) / elapsed, 3) if elapsed else 0.0,
+            "p50_ms": round(percentile(all_latencies, 50), 2),
+            "p95_ms": round(percentile(all_latencies, 95), 2),
+            "p99_ms": round(percentile(all_latencies, 99), 2),
+            "schedule_lag_p95_ms": round(percentile(lag, 95), 2),
+            "endpoints": endpoints
+        }
+
+
+class VirtualUser:
+    def __init__(self, test: "LoadTest", index: int):
+        self.test = test
+        self.index = index
+        self.headers: Dict[str, str] = {}
+        self.job_id: Optional[int] = None
+        self.batch_id: Optional[str] = None
+
+    async def request(self, endpoint: str, method: str, path: str, **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await self.test.client.request(method, path, headers=self.headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.test.recorder.record(endpoint, time.perf_counter() - start, None)
+            if self.test.verbose:
+                print(f"user {self.index}: {endpoint} failed: {e}", file=sys.stderr)
             return None
-    except Exception as e:
-        print(f"❌ Error creating job: {e}")
-        return None
+        self.test.recorder.record(endpoint, time.perf_counter() - start, response.status_code)
+        if response.status_code >= 400 and self.test.verbose:
+            print(f"user {self.index}: {endpoint} -> {response.status_code} {response.text[:200]}", file=sys.stderr)
+        return response
+
+    async def sign_in(self) -> bool:
+        email = f"load-{self.test.run_id}-{self.index}@example.com"
+        password = "loadtest-password"
+        await self.request("POST /auth/register", "POST", "/auth/register", json={
+            "email": email, "full_name": f"Load User {self.index}", "password": password
+        })
+        response = await self.request("POST /auth/login", "POST", "/auth/login", data={
+            "username": email, "password": password
+        })
+        if response is None or response.status_code != 200:
+            return False
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return await self.create_job()
+
+    async def create_job(self) -> bool:
+        response = await self.request("POST /jobs/", "POST", "/jobs/", json={
+            "title": f"Senior Python Developer {self.index}",
+            "description": JOB_DESCRIPTION
+        })
+        if response is None or response.status_code != 200:
+            return False
+        self.job_id = response.json()["id"]
+        return True
+
+    async def upload(self) -> None:
+        number = self.test.rng.randrange(1_000_000)
+        await self.request(
+            "POST /candidates/upload/{job_id}", "POST", f"/candidates/upload/{self.job_id}",
+            files={"file": (f"resume_{number}.docx", self.test.rng.choice(self.test.resumes))},
+            data={"name": f"Candidate {number}", "email": f"candidate{number}@example.com"}
+        )
+
+    async def bulk_upload(self) -> None:
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for position in range(self.test.bulk_size):
+                name = f"candidate_{self.index}_{self.test.rng.randrange(1_000_000)}_{position}.docx"
+                zf.writestr(name, self.test.rng.choice(self.test.resumes))
+        response = await self.request(
+            "POST /candidates/bulk/{job_id}", "POST", f"/candidates/bulk/{self.job_id}",
+            files={"archive": ("resumes.zip", archive.getvalue(), "application/zip")}
+        )
+        if response is not None and response.status_code == 202:
+            self.batch_id = response.json()["batch_id"]
+
+    async def poll(self) -> None:
+        await self.request("GET /candidates/job/{job_id}", "GET", f"/candidates/job/{self.job_id}")
+        if self.batch_id:
+            response = await self.request("GET /candidates/bulk/{batch_id}", "GET", f"/candidates/bulk/{self.batch_id}")
+            if response is None or response.status_code != 200 or response.json()["status"] in ("completed", "failed"):
+                self.batch_id = None
+
+    async def run(self, tickets: asyncio.Queue) -> None:
+        while True:
+            scheduled = await tickets.get()
+            if scheduled is None:
+                return
+            self.test.recorder.schedule_lag.append((time.perf_counter() - scheduled) * 1000)
+            action = self.test.rng.choices(self.test.actions, self.test.weights)[0]
+            await getattr(self, action)()
+
+
+class LoadTest:
+    ACTIONS = ("create_job", "upload", "bulk_upload", "poll")
 
-def test_api_flow():
-    """Test the complete API flow"""
-    print("Starting API flow test...\n")
+    def __init__(self, args):
+        self.base_url = args.base_url.rstrip("/")
+        self.users = args.users
+        self.rate = args.rate
+        self.duration = args.duration
+        mix = parse_mix(args.mix)
+        self.actions, self.weights = list(mix), list(mix.values())
+        self.bulk_size = args.bulk_size
+        self.verbose = args.verbose
+        self.rng = random.Random(args.seed)
+        self.run_id = uuid.uuid4().hex[:8]
+        self.resumes = make_resumes(args.resume_pool, self.rng)
+        self.recorder = Recorder()
+        self.client: Optional[httpx.AsyncClient] = None
 
-    # Test health
-    if not test_health():
-        return False
+    async def _schedule(self, tickets: asyncio.Queue) -> None:
+        """Release actions at the target rate, whether or not users keep up"""
+        interval = 1 / self.rate
+        start = time.perf_counter()
+        issued = 0
+        while time.perf_counter() - start < self.duration:
+            due = start + issued * interval
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            tickets.put_nowait(due)
+            issued += 1
 
-    # Register user (may fail if already exists)
-    register_test_user()
+    async def run(self) -> Dict[str, Any]:
+        limits = httpx.Limits(max_connections=self.users, max_keepalive_connections=self.users)
+        async with httpx.AsyncClient(base_url=f"{self.base_url}/api/v1", timeout=120.0, limits=limits) as client:
+            self.client = client
+            self.recorder.started = time.perf_counter()
+            users = [VirtualUser(self, index) for index in range(self.users)]
+            signed_in = await asyncio.gather(*(user.sign_in() for user in users))
+            users = [user for user, ok in zip(users, signed_in) if ok]
+            if not users:
+                raise SystemExit("No user could sign in and create a job; run with --verbose for details")
 
-    # Login user
-    token = login_test_user()
-    if not token:
-        return False
+            tickets: asyncio.Queue = asyncio.Queue()
+            workers = [asyncio.create_task(user.run(tickets)) for user in users]
+            await self._schedule(tickets)
+            # Actions not started by the end of the run are dropped
+            while not tickets.empty():
+                tickets.get_nowait()
+            for _ in workers:
+                tickets.put_nowait(None)
+            await asyncio.gather(*workers)
+            self.recorder.finished = time.perf_counter()
+        result = self.recorder.summary()
+        result["config"] = {
+            "base_url": self.base_url,
+            "users": self.users,
+            "active_users": len(users),
+            "target_rate": self.rate,
+            "duration_seconds": self.duration,
+            "mix": dict(zip(self.actions, self.weights)),
+            "bulk_size": self.bulk_size
+        }
+        return result
 
-    # Create job
-    job = create_test_job(token)
-    if not job:
-        return False
 
-    print(f"\n✅ API flow test completed successfully!")
-    print(f"Job created with ID: {job['id']}")
-    print(f"AI-generated requirements: {json.dumps(job.get('requirements', {}), indent=2)}")
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Endpoints whose p95 latency grew by more than `tolerance` (a fraction)"""
+    regressions = []
+    for endpoint, stats in result["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(endpoint)
+        if previous and previous["p95_ms"] > 0 and stats["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{endpoint}: p95 {previous['p95_ms']} ms -> {stats['p95_ms']} ms")
+    return regressions
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['requests']} requests in {result['elapsed_seconds']}s "
+        f"({result['throughput_rps']} req/s), {result['errors']} errors, "
+        f"schedule lag p95 {result['schedule_lag_p95_ms']} ms"
+    )
+    print(f"{'endpoint':<36} {'count':>6} {'err':>4} {'rps':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for endpoint, stats in result["endpoints"].items():
+        print(
+            f"{endpoint:<36} {stats['requests']:>6} {stats['errors']:>4} {stats['throughput_rps']:>7} "
+            f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9} {stats['max_ms']:>9}"
+        )
+
+
+def wait_until_up(url: str, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=2.0)
+            return True
+        except httpx.HTTPError:
+            time.sleep(0.25)
+    return False
+
+
+def start_stub(provider_url: str, stub_args: str) -> Optional[subprocess.Popen]:
+    """Start scripts/deepseek_stub.py at the provider URL unless something already listens there"""
+    url = urlparse(provider_url)
+    if url.hostname not in ("127.0.0.1", "localhost", "::1"):
+        raise SystemExit(f"--offline needs a local provider URL, got {provider_url}")
+    if wait_until_up(provider_url, 0.5):
+        return None
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(SCRIPTS_DIR, "deepseek_stub.py"), "--host", url.hostname,
+         "--port", str(url.port or 80)] + shlex.split(stub_args)
+    )
+    if not wait_until_up(provider_url, 30.0):
+        process.terminate()
+        raise SystemExit(f"The provider stub did not start at {provider_url}")
+    return process
+
+
+def start_backend(base_url: str, provider_url: str) -> subprocess.Popen:
+    """Run the backend with its model provider pointed at the local stub"""
+    url = urlparse(base_url)
+    env = dict(os.environ, DEEPSEEK_BASE_URL=provider_url, DEEPSEEK_API_KEY=os.environ.get("DEEPSEEK_API_KEY") or "offline")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", url.hostname, "--port", str(url.port or 80),
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env
+    )
+    if not wait_until_up(f"{base_url}/health", 30.0):
+        process.terminate()
+        raise SystemExit("The backend did not start; check DATABASE_URL and the output above")
+    return process
 
-    return True
 
 def main():
-    """Main test function"""
-    print("CV_Bot API Test Suite")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Backend URL (without /api/v1)")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--rate", type=float, default=5.0, help="Target actions per second across all users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to generate load for")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Action weights, e.g. poll=6,upload=2")
+    parser.add_argument("--bulk-size", type=int, default=10, help="Resumes per bulk upload archive")
+    parser.add_argument("--resume-pool", type=int, default=50, help="Distinct generated resumes")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible action sequences")
+    parser.add_argument("--offline", action="store_true", help="Start the backend against a local provider stub")
+    parser.add_argument("--provider-url", default="http://127.0.0.1:8900", help="Provider stub URL for --offline")
+    parser.add_argument("--stub-args", default="", help="Options for a stub started by --offline, e.g. \"--error-rate 0.01\"")
+    parser.add_argument("--output", help="Write the JSON result to this file")
+    parser.add_argument("--baseline", help="Earlier JSON result to compare p95 latencies with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 growth over the baseline")
+    parser.add_argument("--json", action="store_true", help="Print the JSON result instead of a table")
+    parser.add_argument("--verbose", action="store_true", help="Print failed requests")
+    args = parser.parse_args()
+    if args.users < 1 or args.rate <= 0 or args.duration <= 0:
+        parser.error("--users, --rate and --duration must be positive")
 
-    success = test_api_flow()
+    processes = []
+    if args.offline:
+        stub = start_stub(args.provider_url, args.stub_args)
+        if stub is not None:
+            processes.append(stub)
+        try:
+            processes.append(start_backend(args.base_url.rstrip("/"), args.provider_url))
+        except BaseException:
+            if stub is not None:
+                stub.terminate()
+            raise
+    try:
+        if not processes and not wait_until_up(f"{args.base_url.rstrip('/')}/health", 5.0):
+            raise SystemExit(f"Cannot connect to the backend at {args.base_url}. Is it running?")
+        result = asyncio.run(LoadTest(args).run())
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=10)
 
-    if success:
-        print("\n🎉 All tests passed!")
-        print("Your CV_Bot API is working correctly!")
+    result["offline"] = args.offline
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    if args.json:
+        print(json.dumps(result, indent=2))
     else:
-        print("\n❌ Some tests failed.")
-        print("Check the error messages above and ensure:")
-        print("1. Backend server is running (python backend/run.py)")
-        print("2. Database is running (docker-compose up -d)")
-        print("3. Environment variables are configured")
-        sys.exit(1)
+        print_report(result)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()